@@ -0,0 +1,54 @@
+"""
+Benchmarks batch population evaluation against scoring each Individual on its own.
+
+Run from the backend directory with `python -m benchmarks.fitness_benchmark`.
+"""
+import timeit
+import numpy as np
+from datetime import date, time
+from ga import Proposal, SchedulingProblem, Individual
+from ga.problem import UNSCHEDULED
+from ga.fitness import evaluate_population, genome_fitness
+
+NUM_OF_INDIVIDUALS: int = 50
+NUM_OF_REPEATS: int = 20
+
+def build_problem(num_of_proposals: int, rng: np.random.Generator) -> SchedulingProblem:
+    """
+    Builds a synthetic problem with random durations over a four week window.
+
+    Args:
+        num_of_proposals (int): The number of proposals in the problem.
+        rng (np.random.Generator): The random number generator to draw from.
+
+    Returns:
+        SchedulingProblem: The synthetic scheduling problem.
+    """
+    proposals: list[Proposal] = [
+        Proposal(
+            id=index + 1, description="", proposal_id=f"SCI-{index + 1:04d}", owner_email="", instrument_product="",
+            instrument_integration_time=8.0, instrument_band="L", instrument_pool_resources="",
+            lst_start_time=time(0, 0), lst_start_end_time=time(23, 0), simulated_duration=int(rng.integers(1800, 8 * 3600)),
+            night_obs=False, avoid_sunrise_sunset=False, minimum_antennas=40, general_comments="",
+        )
+        for index in range(num_of_proposals)
+    ]
+    return SchedulingProblem(start_date=date(2024, 1, 1), end_date=date(2024, 1, 28), proposals=tuple(proposals))
+
+def main() -> None:
+    rng: np.random.Generator = np.random.default_rng(0)
+    print(f"{'proposals':>10} {'per-individual (ms)':>20} {'batch (ms)':>12} {'speedup':>8}")
+    for num_of_proposals in (50, 200, 1000):
+        problem: SchedulingProblem = build_problem(num_of_proposals, rng)
+        genomes: np.ndarray = rng.integers(0, 28 * 86400, size=(NUM_OF_INDIVIDUALS, num_of_proposals))
+        genomes[rng.random(genomes.shape) < 0.25] = UNSCHEDULED
+        individuals: list[Individual] = [Individual(problem, genome) for genome in genomes]
+
+        assert np.array_equal(evaluate_population(problem, genomes), [genome_fitness(problem, genome) for genome in genomes])
+
+        per_individual: float = min(timeit.repeat(lambda: [genome_fitness(problem, individual.genome) for individual in individuals], number=1, repeat=NUM_OF_REPEATS))
+        batch: float = min(timeit.repeat(lambda: evaluate_population(problem, np.stack([individual.genome for individual in individuals])), number=1, repeat=NUM_OF_REPEATS))
+        print(f"{num_of_proposals:>10} {per_individual * 1000:>20.2f} {batch * 1000:>12.2f} {per_individual / batch:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+from datetime import datetime, time
+from typing import Annotated, Any
+from pydantic import BaseModel, BeforeValidator, ConfigDict, PlainSerializer, TypeAdapter
+from ga import Proposal, parse_time
+
+# The API and the obs-data service exchange every proposal field as a string. The annotated types below parse those strings
+# into typed values once, when a model is validated, and serialize them back to the same strings.
+SCHEDULED_START_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+
+def parse_yes_no(value: Any) -> Any:
+    """
+    Parses a "yes"/"no" flag, in any case.
+
+    Args:
+        value (Any): The flag, as a string or a boolean.
+
+    Returns:
+        Any: True for "yes", False for any other string, or the value unchanged if it is not a string.
+    """
+    return value.lower() == "yes" if isinstance(value, str) else value
+
+def parse_lst(value: Any) -> Any:
+    """
+    Parses an "HH:MM" LST.
+
+    Args:
+        value (Any): The LST, as a string or a time.
+
+    Returns:
+        Any: The time, or the value unchanged if it is not a string.
+    """
+    return parse_time(value) if isinstance(value, str) else value
+
+def parse_scheduled_start(value: Any) -> Any:
+    """
+    Parses a "YYYY-MM-DD HH:MM:SS" scheduled start datetime, empty for an unscheduled proposal.
+
+    Args:
+        value (Any): The scheduled start datetime, as a string, a datetime or None.
+
+    Returns:
+        Any: The datetime, None for an empty string, or the value unchanged if it is not a string.
+    """
+    if isinstance(value, str):
+        return datetime.strptime(value, SCHEDULED_START_FORMAT) if value else None
+    return value
+
+NumberString = PlainSerializer(str, return_type=str)
+YesNo = Annotated[bool, BeforeValidator(parse_yes_no), PlainSerializer(lambda value: "yes" if value else "no", return_type=str)]
+LstTime = Annotated[time, BeforeValidator(parse_lst), PlainSerializer(lambda value: value.strftime("%H:%M"), return_type=str)]
+ScheduledStart = Annotated[datetime | None, BeforeValidator(parse_scheduled_start), PlainSerializer(lambda value: value.strftime(SCHEDULED_START_FORMAT) if value else "", return_type=str)]
+
+class ProposalModel(BaseModel):
+    """Model representing a proposal."""
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    id: Annotated[int, NumberString]
+    description: str
+    proposal_id: str
+    owner_email: str
+    instrument_product: str
+    instrument_integration_time: Annotated[float, NumberString]
+    instrument_band: str
+    instrument_pool_resources: str
+    lst_start: LstTime
+    lst_start_end: LstTime
+    simulated_duration: Annotated[int, NumberString]
+    night_obs: YesNo
+    avoid_sunrise_sunset: YesNo
+    minimum_antennas: Annotated[int, NumberString]
+    general_comments: str = ""
+    scheduled_start_datetime: ScheduledStart = None
+
+    def to_proposal(self) -> Proposal:
+        """
+        Converts the model into a Proposal.
+
+        Args:
+            None
+
+        Returns:
+            Proposal: The proposal, with its scheduled start datetime.
+        """
+        return Proposal(
+            id=self.id,
+            description=self.description,
+            proposal_id=self.proposal_id,
+            owner_email=self.owner_email,
+            instrument_product=self.instrument_product,
+            instrument_integration_time=self.instrument_integration_time,
+            instrument_band=self.instrument_band,
+            instrument_pool_resources=self.instrument_pool_resources,
+            lst_start_time=self.lst_start,
+            lst_start_end_time=self.lst_start_end,
+            simulated_duration=self.simulated_duration,
+            night_obs=self.night_obs,
+            avoid_sunrise_sunset=self.avoid_sunrise_sunset,
+            minimum_antennas=self.minimum_antennas,
+            general_comments=self.general_comments,
+            scheduled_start_datetime=self.scheduled_start_datetime,
+        )
+
+    @classmethod
+    def from_proposal(cls, proposal: Proposal) -> "ProposalModel":
+        """
+        Converts a Proposal into a model, without validating its already typed values again.
+
+        Args:
+            proposal (Proposal): The proposal.
+
+        Returns:
+            ProposalModel: The model of the proposal.
+        """
+        return cls.model_construct(
+            id=proposal.id,
+            description=proposal.description,
+            proposal_id=proposal.proposal_id,
+            owner_email=proposal.owner_email,
+            instrument_product=proposal.instrument_product,
+            instrument_integration_time=proposal.instrument_integration_time,
+            instrument_band=proposal.instrument_band,
+            instrument_pool_resources=proposal.instrument_pool_resources,
+            lst_start=proposal.lst_start_time,
+            lst_start_end=proposal.lst_start_end_time,
+            simulated_duration=proposal.simulated_duration,
+            night_obs=proposal.night_obs,
+            avoid_sunrise_sunset=proposal.avoid_sunrise_sunset,
+            minimum_antennas=proposal.minimum_antennas,
+            general_comments=proposal.general_comments,
+            scheduled_start_datetime=proposal.scheduled_start_datetime,
+        )
+
+# Validates a whole list of records in one call, rather than one model at a time
+proposal_models_adapter: TypeAdapter[list[ProposalModel]] = TypeAdapter(list[ProposalModel])
+
+def to_proposals(models: list[ProposalModel]) -> list[Proposal]:
+    """
+    Converts models into Proposals.
+
+    Args:
+        models (list[ProposalModel]): The models.
+
+    Returns:
+        list[Proposal]: The proposals, in the same order.
+    """
+    return [model.to_proposal() for model in models]
+
+def from_proposals(proposals: list[Proposal]) -> list[ProposalModel]:
+    """
+    Converts Proposals into models.
+
+    Args:
+        proposals (list[Proposal]): The proposals.
+
+    Returns:
+        list[ProposalModel]: The models, in the same order.
+    """
+    return [ProposalModel.from_proposal(proposal) for proposal in proposals]
+
+def parse_proposals(records: list[dict[str, Any]]) -> list[Proposal]:
+    """
+    Validates proposal records, such as those of the obs-data service, and converts them into Proposals.
+
+    Args:
+        records (list[dict[str, Any]]): The records, whose fields may be strings.
+
+    Returns:
+        list[Proposal]: The proposals, in the same order.
+    """
+    return to_proposals(proposal_models_adapter.validate_python(records))
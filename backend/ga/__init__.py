@@ -1,5 +1,10 @@
 from .proposal import Proposal
+from .problem import SchedulingProblem
 from .individual import Individual
 from .genetic_algorithim import Genetic_Algorithm
+from .progress import ProgressEvent, StopReason, ThrottledProgress
+from .stopping import StopPolicy, StagnationStop, TargetFitnessStop, TimeBudgetStop, make_stop_policies
+from .island import IslandModel
+from .clashes import ClashPolicy
 from .timetable import Timetable
 from .utils import *
\ No newline at end of file
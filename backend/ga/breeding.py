@@ -0,0 +1,55 @@
+import numpy as np
+from .individual import Individual
+from .fitness import FitnessCache
+
+def score_individuals(individuals: list[Individual], fitness_cache: FitnessCache) -> None:
+    """
+    Scores every Individual that needs a full evaluation with a single batch evaluation of their genomes.
+
+    Args:
+        individuals (list[Individual]): The Individuals to score.
+        fitness_cache (FitnessCache): The population-level cache to score the genomes through.
+
+    Returns:
+        None
+    """
+    pending: list[Individual] = [individual for individual in individuals if individual.needs_evaluation]
+    if not pending:
+        return
+    scores: np.ndarray = fitness_cache.evaluate_many(pending[0].problem, np.stack([individual.genome for individual in pending]))
+    for individual, score in zip(pending, scores.tolist()):
+        individual.assign_fitness(score)
+    return
+
+def breed_offspring(parent_individual_1: Individual, parent_individual_2: Individual, num_offsprings: int, rng: np.random.Generator, mutation_rate: float, incremental_fitness: bool, fitness_cache: FitnessCache) -> Individual:
+    """
+    Breeds offspring from two parents and picks one of the fittest to replace a slot of the population.
+
+    The outcome only depends on the parents' genomes and the random number generator, so a slot bred in a worker process
+    is identical to one bred in the main process.
+
+    Args:
+        parent_individual_1 (Individual): The first parent.
+        parent_individual_2 (Individual): The second parent.
+        num_offsprings (int): The number of offspring to breed.
+        rng (np.random.Generator): The random number generator of the slot.
+        mutation_rate (float): The rate of mutation operation, ranging from 0.0 to 1.0.
+        incremental_fitness (bool): Whether offspring close to a parent are scored as deltas from that parent.
+        fitness_cache (FitnessCache): The population-level cache to score the offspring through.
+
+    Returns:
+        Individual: The scored offspring picked for the slot.
+    """
+    problem = parent_individual_1.problem
+    offsprings: list[Individual] = list()
+    for _ in range(num_offsprings):
+        offspring: Individual = Individual(problem, parent_individual_1.crossover(parent_individual_2.genome, rng=rng), fitness_cache=fitness_cache)
+        if incremental_fitness:
+            offspring.track_fitness([parent_individual_1, parent_individual_2])
+        offspring.mutation(mutation_rate=mutation_rate, rng=rng)
+        offsprings.append(offspring)
+
+    score_individuals(offsprings, fitness_cache)
+    offsprings.sort(key=lambda individual: individual.compute_fitness(), reverse=True)
+    best_offsprings: list[Individual] = offsprings[:max(2, int(num_offsprings * 0.4))]
+    return best_offsprings[rng.integers(len(best_offsprings))]
@@ -0,0 +1,190 @@
+import os
+import json
+import tempfile
+import threading
+import numpy as np
+from dataclasses import dataclass
+from .problem import SchedulingProblem
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """
+    A compact snapshot of a Genetic Algorithm run, from which it can resume on the same trajectory.
+
+    Attributes:
+        genomes (np.ndarray): The (individuals x proposals) int64 genomes of the population, in population order.
+        fitnesses (np.ndarray): The fitness score of each genome.
+        rng_state (dict): The state of the run's random number generator.
+        generation (int): The number of completed generations.
+        num_of_generations (int): The number of generations the run evolves for.
+        elapsed (float): The time the run had taken, in seconds.
+        best_genome (np.ndarray): The genome of the fittest Individual so far.
+        best_fitness (float): The fitness of the fittest Individual so far.
+        proposal_ids (np.ndarray): The ids of the problem's proposals, to check the checkpoint belongs to the problem it resumes.
+        start_date (str): The first date of the problem, in ISO format.
+        end_date (str): The last date of the problem, in ISO format.
+    """
+    genomes: np.ndarray
+    fitnesses: np.ndarray
+    rng_state: dict
+    generation: int
+    num_of_generations: int
+    elapsed: float
+    best_genome: np.ndarray
+    best_fitness: float
+    proposal_ids: np.ndarray
+    start_date: str
+    end_date: str
+
+    def check_problem(self, problem: SchedulingProblem) -> None:
+        """
+        Checks that the checkpoint was taken for a problem with the same dates and proposals.
+
+        Args:
+            problem (SchedulingProblem): The problem to resume the run on.
+
+        Returns:
+            None
+        """
+        if (self.start_date, self.end_date) != (problem.start_date.isoformat(), problem.end_date.isoformat()) or not np.array_equal(self.proposal_ids, problem.ids):
+            raise ValueError("The checkpoint was taken for a different scheduling problem")
+
+def save_checkpoint(path: str, checkpoint: Checkpoint) -> None:
+    """
+    Writes a checkpoint atomically: it is written to a temporary file in the same directory, which then replaces the previous
+    checkpoint, so a crash never leaves a partial file behind.
+
+    Args:
+        path (str): The path of the checkpoint file.
+        checkpoint (Checkpoint): The checkpoint to write.
+
+    Returns:
+        None
+    """
+    directory: str = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            np.savez_compressed(
+                file,
+                genomes=checkpoint.genomes,
+                fitnesses=checkpoint.fitnesses,
+                rng_state=np.array(json.dumps(checkpoint.rng_state)),
+                generation=np.array(checkpoint.generation),
+                num_of_generations=np.array(checkpoint.num_of_generations),
+                elapsed=np.array(checkpoint.elapsed),
+                best_genome=checkpoint.best_genome,
+                best_fitness=np.array(checkpoint.best_fitness),
+                proposal_ids=checkpoint.proposal_ids,
+                start_date=np.array(checkpoint.start_date),
+                end_date=np.array(checkpoint.end_date),
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+def load_checkpoint(path: str) -> Checkpoint:
+    """
+    Reads a checkpoint written by `save_checkpoint()`.
+
+    Args:
+        path (str): The path of the checkpoint file.
+
+    Returns:
+        Checkpoint: The checkpoint.
+    """
+    with np.load(path) as data:
+        return Checkpoint(
+            genomes=data["genomes"],
+            fitnesses=data["fitnesses"],
+            rng_state=json.loads(str(data["rng_state"])),
+            generation=int(data["generation"]),
+            num_of_generations=int(data["num_of_generations"]),
+            elapsed=float(data["elapsed"]),
+            best_genome=data["best_genome"],
+            best_fitness=float(data["best_fitness"]),
+            proposal_ids=data["proposal_ids"],
+            start_date=str(data["start_date"]),
+            end_date=str(data["end_date"]),
+        )
+
+class CheckpointWriter:
+    """
+    Writes checkpoints on a background thread, so the evolution loop never waits for the disk. If checkpoints arrive faster than
+    they can be written, only the latest one is kept.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Starts the writer thread.
+
+        Args:
+            path (str): The path of the checkpoint file.
+
+        Returns:
+            None
+        """
+        self.path: str = path
+        self.pending: Checkpoint | None = None
+        self.closed: bool = False
+        self.error: BaseException | None = None  # The last failed write, raised by `close()`
+        self.condition: threading.Condition = threading.Condition()
+        self.thread: threading.Thread = threading.Thread(target=self.write_loop, name="checkpoint-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, checkpoint: Checkpoint) -> None:
+        """
+        Queues a checkpoint, replacing any checkpoint not written yet.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint to write.
+
+        Returns:
+            None
+        """
+        with self.condition:
+            self.pending = checkpoint
+            self.condition.notify()
+
+    def write_loop(self) -> None:
+        """
+        Writes queued checkpoints until the writer is closed and nothing is left to write.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        while True:
+            with self.condition:
+                while self.pending is None and not self.closed:
+                    self.condition.wait()
+                if self.pending is None:
+                    return
+                checkpoint, self.pending = self.pending, None
+            try:
+                save_checkpoint(self.path, checkpoint)
+            except Exception as exception:
+                self.error = exception
+
+    def close(self) -> None:
+        """
+        Writes the last queued checkpoint and stops the writer thread.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
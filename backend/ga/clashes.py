@@ -0,0 +1,169 @@
+import bisect
+import numpy as np
+from enum import Enum
+
+class ClashPolicy(str, Enum):
+    """
+    How clashing proposals are chosen between when clashes are removed from a timetable.
+    """
+    FIRST_WINS = "first_wins"  # Keep the earlier-listed proposal
+    HIGHEST_SCORE = "highest_score"  # Keep the proposal with the higher score, the earlier-listed one on a tie
+    MAX_DURATION = "max_duration"  # Keep the clash-free selection with the most scheduled seconds
+
+class IntervalIndex:
+    """
+    The clash-free intervals kept so far, indexed by the rank of their start among all candidate intervals, so whether a
+    new interval clashes with any of them is found in O(log n). Two Fenwick trees hold the latest end among the kept
+    intervals starting before a rank and the earliest start among those starting after it. Intervals starting together
+    clash unless both are empty, which the trees cannot tell apart by rank, so the latest kept end at each start is also held.
+    """
+    def __init__(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        """
+        Initializes an empty IntervalIndex over candidate intervals.
+
+        Args:
+            starts (np.ndarray): The start of each candidate interval.
+            ends (np.ndarray): The end of each candidate interval, exclusive.
+
+        Returns:
+            None
+        """
+        self.starts: list[int] = starts.tolist()
+        self.ends: list[int] = ends.tolist()
+        order: np.ndarray = np.argsort(starts, kind="stable")
+        self.ranks: list[int] = [0] * len(order)
+        for rank, index in enumerate(order.tolist()):
+            self.ranks[index] = rank + 1  # Fenwick trees count from 1
+        self.latest_ends: list[float] = [-np.inf] * (len(order) + 1)  # Prefix maximum of the ends, by rank
+        self.earliest_starts: list[float] = [np.inf] * (len(order) + 1)  # Prefix minimum of the starts, by reversed rank
+        self.latest_ends_at: dict[int, int] = dict()  # The latest end among the kept intervals starting at each start
+
+    def clashes(self, index: int) -> bool:
+        """
+        Checks whether a candidate interval overlaps any kept interval.
+
+        Args:
+            index (int): The candidate interval.
+
+        Returns:
+            bool: True if a kept interval starting no later than the candidate ends after it starts, or a kept interval
+                starting no earlier than the candidate starts before it ends. A kept interval starting at the same time
+                clashes unless both are empty.
+        """
+        latest_end_at: int | None = self.latest_ends_at.get(self.starts[index])
+        if latest_end_at is not None and max(latest_end_at, self.ends[index]) > self.starts[index]:
+            return True
+        size: int = len(self.latest_ends) - 1
+        latest_end: float = -np.inf
+        rank: int = self.ranks[index] - 1
+        while rank > 0:
+            latest_end = max(latest_end, self.latest_ends[rank])
+            rank -= rank & -rank
+        if latest_end > self.starts[index]:
+            return True
+        earliest_start: float = np.inf
+        rank = size - self.ranks[index]
+        while rank > 0:
+            earliest_start = min(earliest_start, self.earliest_starts[rank])
+            rank -= rank & -rank
+        return earliest_start < self.ends[index]
+
+    def keep(self, index: int) -> None:
+        """
+        Adds a candidate interval to the kept intervals.
+
+        Args:
+            index (int): The candidate interval.
+
+        Returns:
+            None
+        """
+        self.latest_ends_at[self.starts[index]] = max(self.latest_ends_at.get(self.starts[index], self.starts[index]), self.ends[index])
+        size: int = len(self.latest_ends) - 1
+        rank: int = self.ranks[index]
+        while rank <= size:
+            self.latest_ends[rank] = max(self.latest_ends[rank], self.ends[index])
+            rank += rank & -rank
+        rank = size + 1 - self.ranks[index]
+        while rank <= size:
+            self.earliest_starts[rank] = min(self.earliest_starts[rank], self.starts[index])
+            rank += rank & -rank
+
+def keep_by_priority(starts: np.ndarray, ends: np.ndarray, priority: np.ndarray) -> np.ndarray:
+    """
+    Keeps intervals greedily in order of priority, each one only if it does not overlap an interval already kept.
+
+    Args:
+        starts (np.ndarray): The start of each interval.
+        ends (np.ndarray): The end of each interval, exclusive.
+        priority (np.ndarray): The order the intervals are considered in, as indices.
+
+    Returns:
+        np.ndarray: The boolean mask of the kept intervals.
+    """
+    index: IntervalIndex = IntervalIndex(starts, ends)
+    kept: np.ndarray = np.zeros(len(starts), dtype=bool)
+    for candidate in priority.tolist():
+        if not index.clashes(candidate):
+            index.keep(candidate)
+            kept[candidate] = True
+    return kept
+
+def keep_max_duration(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Keeps the non-overlapping intervals with the largest total length, by weighted interval scheduling: with the intervals
+    sorted by end, the best total up to each interval either skips it or adds it to the best total up to the last interval
+    ending before it starts. Empty intervals are kept wherever they clash with nothing, although they add nothing.
+
+    Args:
+        starts (np.ndarray): The start of each interval.
+        ends (np.ndarray): The end of each interval, exclusive.
+
+    Returns:
+        np.ndarray: The boolean mask of the kept intervals.
+    """
+    # Among intervals ending together, empty ones come last: an interval starting there clashes with them unless it is empty too
+    empty: np.ndarray = starts == ends
+    order: list[int] = np.lexsort((empty, ends)).tolist()
+    sorted_keys: list[tuple[int, bool]] = list(zip(ends[order].tolist(), empty[order].tolist()))
+    sorted_starts: list[int] = starts[order].tolist()
+    best: list[int] = [0] * (len(order) + 1)  # The best total of the first k intervals by end
+    previous: list[int] = [0] * len(order)  # The number of intervals compatible with each interval, before it by end
+    for k in range(len(order)):
+        search = bisect.bisect_right if sorted_keys[k][1] else bisect.bisect_left
+        previous[k] = search(sorted_keys, (sorted_starts[k], True), 0, k)
+        best[k + 1] = max(best[k], best[previous[k]] + sorted_keys[k][0] - sorted_starts[k])
+
+    # Walk back through the choices that made the best total, keeping an interval whenever it does not lower the total
+    kept: np.ndarray = np.zeros(len(order), dtype=bool)
+    k: int = len(order)
+    while k > 0:
+        if best[previous[k - 1]] + sorted_keys[k - 1][0] - sorted_starts[k - 1] == best[k]:
+            kept[order[k - 1]] = True
+            k = previous[k - 1]
+        else:
+            k -= 1
+    return kept
+
+def resolve_clashes(starts: np.ndarray, durations: np.ndarray, policy: ClashPolicy = ClashPolicy.FIRST_WINS, scores: np.ndarray | None = None) -> np.ndarray:
+    """
+    Chooses which of a set of scheduled proposals to keep so none of the kept ones overlap, in O(n log n).
+
+    Args:
+        starts (np.ndarray): The start offset of each proposal, in listed order.
+        durations (np.ndarray): The duration of each proposal in seconds.
+        policy (ClashPolicy, optional): How clashing proposals are chosen between. Defaults to ClashPolicy.FIRST_WINS.
+        scores (np.ndarray | None, optional): The score of each proposal, required by ClashPolicy.HIGHEST_SCORE. Defaults to None.
+
+    Returns:
+        np.ndarray: The boolean mask of the kept proposals.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    ends: np.ndarray = starts + np.asarray(durations, dtype=np.int64)
+    if policy == ClashPolicy.MAX_DURATION:
+        return keep_max_duration(starts, ends)
+    if policy == ClashPolicy.HIGHEST_SCORE:
+        if scores is None:
+            raise ValueError("The highest_score policy needs the scores of the proposals")
+        return keep_by_priority(starts, ends, np.argsort(-np.asarray(scores, dtype=float), kind="stable"))
+    return keep_by_priority(starts, ends, np.arange(len(starts)))
@@ -0,0 +1,190 @@
+import numpy as np
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+from .utils import julian_date, gmst_at_0h_utc, lst_to_utc_from_gmst, get_night_window, get_sunrise_sunset, date_range_array, julian_date_array, gmst_at_0h_utc_array, get_sunrise_sunset_array
+
+class EphemerisTable:
+    """
+    A per-run, date-indexed table of GMST at 0h UTC, sunrise, sunset and night window, with a bounded least recently used cache
+    of LST to UTC conversions. It returns exactly the values of the functions in `ga.utils`, which it falls back to for dates
+    outside of the table.
+
+    The LST cache and the counters belong to the process using the table: a pickled table, such as one sent to a worker
+    process, starts with an empty cache and zero counters.
+    """
+    def __init__(self, start_date: date, end_date: date, lst_cache_size: int = 64 * 1024) -> None:
+        """
+        Precomputes the ephemeris of every date in [start_date, end_date].
+
+        Args:
+            start_date (date): The first date of the table.
+            end_date (date): The last date of the table.
+            lst_cache_size (int, optional): The maximum number of (date, LST) conversions to remember. Defaults to 64 * 1024.
+
+        Returns:
+            None
+        """
+        self.start_date: date = start_date
+        self.end_date: date = end_date
+        self.lst_cache_size: int = lst_cache_size
+        self.lst_cache: OrderedDict[tuple[date, time], datetime] = OrderedDict()
+        self.hits: int = 0  # Lookups served by the table or the LST cache
+        self.misses: int = 0  # Lookups that had to be computed
+
+        # Whole date range at once, with the array kernels
+        self.dates: np.ndarray = date_range_array(start_date, end_date)
+        sunrises, sunsets = get_sunrise_sunset_array(self.dates)
+        self.sun_events: np.ndarray = ~np.isnan(sunrises)  # Whether the sun rises and sets on each date
+        self.sunrise_seconds: np.ndarray = np.nan_to_num(sunrises).astype(np.int64)  # Seconds after midnight, 0 without sun events
+        self.sunset_seconds: np.ndarray = np.nan_to_num(sunsets).astype(np.int64)
+
+        days: list[date] = [start_date + timedelta(days=day) for day in range(len(self.dates))]
+        self.gmst0s: list[float] = gmst_at_0h_utc_array(julian_date_array(self.dates)).tolist()
+        self.sunrise_sunsets: list[tuple[datetime, datetime]] = [
+            (datetime.combine(day, time(0, 0, 0)) + timedelta(seconds=sunrise), datetime.combine(day, time(0, 0, 0)) + timedelta(seconds=sunset)) if sun_event else (None, None)
+            for day, sun_event, sunrise, sunset in zip(days, self.sun_events.tolist(), self.sunrise_seconds.tolist(), self.sunset_seconds.tolist())
+        ]
+        self.night_windows: list[tuple[datetime, datetime]] = [get_night_window(day) for day in days]
+
+    @property
+    def num_of_days(self) -> int:
+        """
+        The number of dates in the table.
+
+        Returns:
+            int: The number of days between start_date and end_date inclusive.
+        """
+        return len(self.dates)
+
+    def day_index(self, day: date) -> int | None:
+        """
+        Finds the row of a date in the table.
+
+        Args:
+            day (date): The date to look up.
+
+        Returns:
+            int | None: The index of the date, or None if it is outside of the table.
+        """
+        index: int = (day - self.start_date).days
+        return index if 0 <= index < len(self.gmst0s) else None
+
+    def gmst_at_0h_utc(self, day: date) -> float:
+        """
+        Returns the GMST at 0h UTC of a date.
+
+        Args:
+            day (date): The UTC calendar date.
+
+        Returns:
+            float: GMST at 0h UTC in decimal hours.
+        """
+        index: int | None = self.day_index(day)
+        if index is None:
+            self.misses += 1
+            return gmst_at_0h_utc(julian_date(datetime.combine(day, time(0, 0, 0))))
+        self.hits += 1
+        return self.gmst0s[index]
+
+    def gmst_for_conversion(self, day: date) -> float:
+        """
+        Returns the GMST at 0h UTC of a date for an LST conversion, without counting it as a separate lookup.
+
+        Args:
+            day (date): The UTC calendar date.
+
+        Returns:
+            float: GMST at 0h UTC in decimal hours.
+        """
+        index: int | None = self.day_index(day)
+        if index is None:
+            return gmst_at_0h_utc(julian_date(datetime.combine(day, time(0, 0, 0))))
+        return self.gmst0s[index]
+
+    def lst_to_utc(self, day: date, lst_time: time) -> datetime:
+        """
+        Converts a Local Sidereal Time on a date to a UTC datetime, as `ga.utils.lst_to_utc()` does at the SKA site.
+
+        Args:
+            day (date): The UTC calendar date.
+            lst_time (time): LST as time object.
+
+        Returns:
+            datetime: Approximate UTC datetime corresponding to the given LST.
+        """
+        key: tuple[date, time] = (day, lst_time)
+        utc_datetime: datetime | None = self.lst_cache.get(key)
+        if utc_datetime is not None:
+            self.hits += 1
+            self.lst_cache.move_to_end(key)
+            return utc_datetime
+
+        self.misses += 1
+        utc_datetime = lst_to_utc_from_gmst(day, lst_time, self.gmst_for_conversion(day))
+        self.lst_cache[key] = utc_datetime
+        if len(self.lst_cache) > self.lst_cache_size:
+            self.lst_cache.popitem(last=False)
+        return utc_datetime
+
+    def sunrise_sunset(self, day: date) -> tuple[datetime, datetime]:
+        """
+        Returns the sunrise and sunset of a date at the SKA site, as `ga.utils.get_sunrise_sunset()` does.
+
+        Args:
+            day (date): The date for which to get the sunrise and sunset.
+
+        Returns:
+            tuple[datetime, datetime]: The sunrise and sunset times as naive datetime objects.
+        """
+        index: int | None = self.day_index(day)
+        if index is None:
+            self.misses += 1
+            return get_sunrise_sunset(day)
+        self.hits += 1
+        return self.sunrise_sunsets[index]
+
+    def night_window(self, day: date) -> tuple[datetime, datetime]:
+        """
+        Returns the night window of a date, as `ga.utils.get_night_window()` does.
+
+        Args:
+            day (date): The date for which to get the night window.
+
+        Returns:
+            tuple[datetime, datetime]: The start and end datetime of the night window.
+        """
+        index: int | None = self.day_index(day)
+        if index is None:
+            self.misses += 1
+            return get_night_window(day)
+        self.hits += 1
+        return self.night_windows[index]
+
+    def __getstate__(self) -> dict:
+        """
+        Pickles the table without its LST cache and counters.
+
+        Returns:
+            dict: The attributes of the table, with an empty LST cache and zero counters.
+        """
+        return self.__dict__ | {"lst_cache": OrderedDict(), "hits": 0, "misses": 0}
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of lookups served without computing an ephemeris.
+
+        Returns:
+            float: The hit rate, ranging from 0.0 to 1.0.
+        """
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        """
+        Summarizes the table counters.
+
+        Returns:
+            str: A one-line summary of hits, misses and hit rate.
+        """
+        return f"Ephemeris table: {self.hits} hits, {self.misses} misses ({self.hit_rate:.1%} hit rate)"
@@ -0,0 +1,152 @@
+import numpy as np
+from datetime import date, time
+from .proposal import Proposal
+from .ephemeris import EphemerisTable
+from .utils import SECONDS_PER_DAY, lst_to_utc_array
+
+NIGHT_START_SECONDS: int = 18 * 3600  # Night windows open at 18:00 of the start date
+NIGHT_END_SECONDS: int = 30 * 3600  # and close at 06:00 the next day
+
+# Bound of a forbidden interval that removes nothing, far beyond any offset of a timetable
+NO_EVENT: int = 2 ** 62
+
+def lst_hours(lst_time: time) -> float:
+    """
+    Converts an LST to decimal hours, as `ga.utils.lst_to_utc()` does.
+
+    Args:
+        lst_time (time): LST as time object.
+
+    Returns:
+        float: The LST in decimal hours.
+    """
+    return lst_time.hour + lst_time.minute / 60 + lst_time.second / 3600
+
+class FeasibleStarts:
+    """
+    The precomputed set of start offsets at which a proposal meets all of its constraints, sampled uniformly without rejection.
+    """
+    def __init__(self, lowers: np.ndarray, uppers: np.ndarray) -> None:
+        """
+        Initializes the FeasibleStarts from disjoint closed intervals.
+
+        Args:
+            lowers (np.ndarray): The int64 first feasible start offset of each interval, in seconds from START_DATE, in increasing order.
+            uppers (np.ndarray): The int64 last feasible start offset of each interval.
+
+        Returns:
+            None
+        """
+        self.lowers: np.ndarray = lowers
+        self.uppers: np.ndarray = uppers
+        self.cumulative_counts: np.ndarray = np.cumsum(self.uppers - self.lowers + 1)
+        self.total: int = int(self.cumulative_counts[-1]) if len(lowers) else 0
+
+    @property
+    def intervals(self) -> list[tuple[int, int]]:
+        """
+        The disjoint closed intervals of feasible start offsets.
+
+        Returns:
+            list[tuple[int, int]]: The intervals, ordered by start offset.
+        """
+        return list(zip(self.lowers.tolist(), self.uppers.tolist()))
+
+    def sample(self, rng: np.random.Generator) -> int | None:
+        """
+        Draws a start offset uniformly from every feasible start.
+
+        Args:
+            rng (np.random.Generator): The random number generator to draw from.
+
+        Returns:
+            int | None: A feasible start offset in seconds from START_DATE, or None if the proposal can never be scheduled.
+        """
+        if self.total == 0:
+            return None
+        draw: int = int(rng.integers(self.total))
+        index: int = int(np.searchsorted(self.cumulative_counts, draw, side="right"))
+        return int(self.uppers[index]) - int(self.cumulative_counts[index]) + 1 + draw
+
+    def contains(self, offset: int) -> bool:
+        """
+        Checks whether a start offset is feasible.
+
+        Args:
+            offset (int): The start offset in seconds from START_DATE.
+
+        Returns:
+            bool: True if the proposal meets all of its constraints when started at the offset, False otherwise.
+        """
+        index: int = int(np.searchsorted(self.lowers, offset, side="right")) - 1
+        return index >= 0 and offset <= self.uppers[index]
+
+    def contains_many(self, offsets: np.ndarray) -> np.ndarray:
+        """
+        Checks whether each of several start offsets is feasible.
+
+        Args:
+            offsets (np.ndarray): The int64 start offsets in seconds from START_DATE.
+
+        Returns:
+            np.ndarray: A boolean array, True where the proposal meets all of its constraints when started at the offset.
+        """
+        indexes: np.ndarray = np.searchsorted(self.lowers, offsets, side="right") - 1
+        return (indexes >= 0) & (offsets <= self.uppers[np.maximum(indexes, 0)]) if len(self.lowers) else np.zeros(len(offsets), dtype=bool)
+
+def build_feasible_starts(start_date: date, end_date: date, proposals: tuple[Proposal, ...], ephemeris: EphemerisTable) -> tuple[FeasibleStarts, ...]:
+    """
+    Precomputes the feasible start offsets of every proposal for every day in [START_DATE, END_DATE].
+
+    The intervals match `Proposal.all_constraints_met()` exactly. A start belongs to the day it falls on, as every constraint is
+    evaluated for the start date. On each day, a proposal may start within the UTC times of its LST window, intersected with the
+    night window when `night_obs` is set. When `avoid_sunrise_sunset` is set, the starts whose observation would contain sunrise
+    or sunset are removed, which splits the window into at most three pieces. Every proposal and day is worked out at once on
+    (proposals x days) arrays.
+
+    Args:
+        start_date (date): The first date of the timetable, whose midnight is offset 0.
+        end_date (date): The last date of the timetable.
+        proposals (tuple[Proposal, ...]): The proposals to place.
+        ephemeris (EphemerisTable): The run's ephemeris table covering the timetable dates.
+
+    Returns:
+        tuple[FeasibleStarts, ...]: The feasible starts of each proposal, indexed by proposal position.
+    """
+    if len(proposals) == 0:
+        return tuple()
+    day_offsets: np.ndarray = np.arange(ephemeris.num_of_days, dtype=np.int64) * SECONDS_PER_DAY
+
+    # Each distinct LST is converted once for every day
+    lst_times: list[time] = sorted({proposal.lst_start_time for proposal in proposals} | {proposal.lst_start_end_time for proposal in proposals})
+    lst_rows: dict[time, int] = {lst_time: row for row, lst_time in enumerate(lst_times)}
+    lst_offsets: np.ndarray = day_offsets[None, :] + lst_to_utc_array(ephemeris.dates, np.array([lst_hours(lst_time) for lst_time in lst_times]))
+
+    # The window of each proposal on each day, of shape (proposals x days)
+    lower: np.ndarray = np.maximum(lst_offsets[[lst_rows[proposal.lst_start_time] for proposal in proposals]], day_offsets[None, :])
+    upper: np.ndarray = np.minimum(lst_offsets[[lst_rows[proposal.lst_start_end_time] for proposal in proposals]], day_offsets[None, :] + SECONDS_PER_DAY - 1)
+
+    durations: np.ndarray = np.array([proposal.simulated_duration for proposal in proposals], dtype=np.int64)[:, None]
+    night_obs: np.ndarray = np.array([proposal.night_obs for proposal in proposals], dtype=bool)[:, None]
+    lower = np.where(night_obs, np.maximum(lower, day_offsets[None, :] + NIGHT_START_SECONDS), lower)
+    upper = np.where(night_obs, np.minimum(upper, day_offsets[None, :] + NIGHT_END_SECONDS - durations), upper)
+
+    # The forbidden starts [event - observation, event] around sunrise and sunset. The constraint measures the observation in
+    # minutes of simulated duration. Proposals that do not avoid them, and days on which the sun never rises or sets, forbid nothing.
+    avoids: np.ndarray = np.array([proposal.avoid_sunrise_sunset for proposal in proposals], dtype=bool)[:, None] & ephemeris.sun_events[None, :]
+    observation_seconds: np.ndarray = durations * 60
+    sunrise: np.ndarray = np.where(avoids, day_offsets[None, :] + ephemeris.sunrise_seconds[None, :], NO_EVENT)
+    sunset: np.ndarray = np.where(avoids, day_offsets[None, :] + ephemeris.sunset_seconds[None, :], NO_EVENT)
+    sunrise_first: np.ndarray = sunrise <= sunset
+    first_event: np.ndarray = np.where(sunrise_first, sunrise, sunset)
+    second_event: np.ndarray = np.where(sunrise_first, sunset, sunrise)
+    last_event: np.ndarray = np.maximum(first_event, second_event)
+
+    # The pieces of the window before, between and after the forbidden intervals, of shape (proposals x days x 3)
+    lowers: np.ndarray = np.stack((lower, np.maximum(lower, first_event + 1), np.maximum(lower, last_event + 1)), axis=-1)
+    uppers: np.ndarray = np.stack((np.minimum(upper, first_event - observation_seconds - 1), np.minimum(upper, second_event - observation_seconds - 1), upper), axis=-1)
+    lowers = lowers.reshape(len(proposals), -1)
+    uppers = uppers.reshape(len(proposals), -1)
+    non_empty: np.ndarray = lowers <= uppers
+
+    return tuple(FeasibleStarts(lowers[position][non_empty[position]], uppers[position][non_empty[position]]) for position in range(len(proposals)))
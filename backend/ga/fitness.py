@@ -0,0 +1,384 @@
+import bisect
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from .problem import SchedulingProblem, UNSCHEDULED
+
+def pairwise_clash_time(starts: np.ndarray, ends: np.ndarray) -> int:
+    """
+    Computes the total clash time over every ordered pair of intervals with a sweep over their sorted endpoints.
+
+    The overlap of all pairs equals the integral of k(t) * (k(t) - 1) over time, where k(t) is the number of intervals active at t,
+    so sorting the 2n endpoints once gives the same result as comparing every pair, in O(n log n).
+
+    Args:
+        starts (np.ndarray): The int64 start of each interval.
+        ends (np.ndarray): The int64 end of each interval.
+
+    Returns:
+        int: The sum of the overlaps of every ordered pair (i, j) with i != j, in the unit of the inputs.
+    """
+    if len(starts) < 2:
+        return 0
+    # Each endpoint is packed as time * 2 + 1 for a start and time * 2 for an end, so a plain sort orders the sweep
+    events: np.ndarray = np.sort(np.concatenate((starts * 2 + 1, ends * 2)))
+    steps: np.ndarray = (events & 1) * 2 - 1
+
+    # Number of active intervals between consecutive endpoints; ties only produce zero-length segments
+    active: np.ndarray = np.cumsum(steps)[:-1]
+    lengths: np.ndarray = np.diff(events >> 1)
+    return int(np.sum(active * (active - 1) * lengths))
+
+def clash_statistics(problem: SchedulingProblem, genome: np.ndarray) -> tuple[int, int, int]:
+    """
+    Computes the clash and unscheduled statistics of a genome, matching the pairwise accounting of the original fitness formula.
+
+    Pairs of proposals sharing the same id are never counted as clashing, and every scheduled proposal accrues its duration once
+    for each unscheduled proposal with a different id.
+
+    Args:
+        problem (SchedulingProblem): The scheduling problem the genome belongs to.
+        genome (np.ndarray): The int64 genome of start offsets.
+
+    Returns:
+        tuple[int, int, int]: The total clash time in seconds, the total unscheduled time in seconds and the number of scheduled proposals.
+    """
+    scheduled: np.ndarray = genome != UNSCHEDULED
+    num_scheduled: int = int(np.count_nonzero(scheduled))
+    durations: np.ndarray = problem.durations
+
+    starts: np.ndarray = genome[scheduled]
+    total_clash_time: int = pairwise_clash_time(starts, starts + durations[scheduled])
+
+    num_unscheduled: int = len(genome) - num_scheduled
+    total_unscheduled_time: int = int(durations[~scheduled].sum()) + int(durations[scheduled].sum()) * num_unscheduled
+
+    for group in problem.duplicate_id_groups:
+        group_scheduled: np.ndarray = group[scheduled[group]]
+        group_starts: np.ndarray = genome[group_scheduled]
+        total_clash_time -= pairwise_clash_time(group_starts, group_starts + durations[group_scheduled])
+        total_unscheduled_time -= int(durations[group_scheduled].sum()) * (len(group) - len(group_scheduled))
+
+    return total_clash_time, total_unscheduled_time, num_scheduled
+
+def fitness_score(problem: SchedulingProblem, total_clash_time: float, num_scheduled: int) -> float:
+    """
+    Turns clash statistics into a fitness score.
+
+    Args:
+        problem (SchedulingProblem): The scheduling problem the statistics belong to.
+        total_clash_time (float): The total clash time in seconds over every ordered pair of scheduled proposals.
+        num_scheduled (int): The number of scheduled proposals.
+
+    Returns:
+        float: The fitness score, ranging from 0.0 (worst) to 1.0 (best).
+    """
+    # If no proposals are scheduled, return a score of 0
+    if num_scheduled == 0:
+        return 0.0
+    total_proposal_duration: int = problem.total_duration
+    # Return the score as a fraction of non-clash time to total time
+    return ((total_proposal_duration - float(total_clash_time)) / (total_proposal_duration)) * float(problem.unscheduled_penalties[problem.num_of_proposals - num_scheduled])
+
+def genome_fitness(problem: SchedulingProblem, genome: np.ndarray) -> float:
+    """
+    Computes the fitness score of a genome from scratch.
+
+    Args:
+        problem (SchedulingProblem): The scheduling problem the genome belongs to.
+        genome (np.ndarray): The int64 genome of start offsets.
+
+    Returns:
+        float: The fitness score, ranging from 0.0 (worst) to 1.0 (best).
+    """
+    total_clash_time, _, num_scheduled = clash_statistics(problem, genome)
+    return fitness_score(problem, total_clash_time, num_scheduled)
+
+def population_clash_times(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Computes the total clash time of every row of a population in one call, with the same endpoint sweep as `pairwise_clash_time()`.
+
+    Args:
+        starts (np.ndarray): A (population x intervals) int64 matrix of interval starts.
+        ends (np.ndarray): A (population x intervals) int64 matrix of interval ends. Zero-length intervals never clash.
+
+    Returns:
+        np.ndarray: The int64 sum of the overlaps of every ordered pair of intervals, for each row.
+    """
+    if starts.shape[1] < 2:
+        return np.zeros(starts.shape[0], dtype=np.int64)
+    events: np.ndarray = np.sort(np.concatenate((starts * 2 + 1, ends * 2), axis=1), axis=1)
+    steps: np.ndarray = (events & 1) * 2 - 1
+
+    active: np.ndarray = np.cumsum(steps, axis=1)[:, :-1]
+    lengths: np.ndarray = np.diff(events >> 1, axis=1)
+    return np.sum(active * (active - 1) * lengths, axis=1)
+
+def evaluate_population(problem: SchedulingProblem, genomes: np.ndarray) -> np.ndarray:
+    """
+    Computes the fitness score of every genome of a population with broadcast NumPy operations.
+
+    Args:
+        problem (SchedulingProblem): The scheduling problem the genomes belong to.
+        genomes (np.ndarray): A (population x proposals) int64 matrix of start offsets.
+
+    Returns:
+        np.ndarray: The float64 fitness score of each genome, equal to `genome_fitness()` of each row.
+    """
+    scheduled: np.ndarray = genomes != UNSCHEDULED
+    num_scheduled: np.ndarray = np.count_nonzero(scheduled, axis=1)
+
+    # Unscheduled proposals become zero-length intervals, which never clash
+    starts: np.ndarray = np.where(scheduled, genomes, 0)
+    ends: np.ndarray = starts + np.where(scheduled, problem.durations, 0)
+    total_clash_times: np.ndarray = population_clash_times(starts, ends)
+    for group in problem.duplicate_id_groups:
+        total_clash_times -= population_clash_times(starts[:, group], ends[:, group])
+
+    total_proposal_duration: int = problem.total_duration
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores: np.ndarray = ((total_proposal_duration - total_clash_times.astype(np.float64)) / (total_proposal_duration)) * problem.unscheduled_penalties[problem.num_of_proposals - num_scheduled]
+    # If no proposals are scheduled, the score is 0
+    return np.where(num_scheduled == 0, 0.0, scores)
+
+class IncrementalFitness:
+    """
+    Keeps the per-proposal clash contributions of a genome in a sorted interval index, so that changing k genes updates the
+    fitness in O(k log n) plus the overlaps of the changed proposals, instead of a full recompute.
+    """
+    def __init__(self, problem: SchedulingProblem, genome: np.ndarray) -> None:
+        """
+        Builds the interval index and clash contributions of a genome.
+
+        Args:
+            problem (SchedulingProblem): The scheduling problem the genome belongs to.
+            genome (np.ndarray): The int64 genome of start offsets, which is copied.
+
+        Returns:
+            None
+        """
+        self.problem: SchedulingProblem = problem
+        self.starts: list[int] = genome.tolist()
+        self.durations: list[int] = problem.durations.tolist()
+        self.ids: list[int] = problem.ids.tolist()
+        self.max_duration: int = max(self.durations, default=0)
+        self.index: list[tuple[int, int]] = sorted((start, position) for position, start in enumerate(self.starts) if start != UNSCHEDULED)
+        self.contributions: list[int] = [0] * len(self.starts)  # Clash time of each proposal with every other proposal
+        self.total_clash_time: int = 0
+        self.num_scheduled: int = len(self.index)
+        for start, position in self.index:
+            for other_position, clash_time in self.clashes(position, start):
+                self.contributions[position] += clash_time
+        self.total_clash_time = sum(self.contributions)
+
+    def clashes(self, position: int, start: int) -> list[tuple[int, int]]:
+        """
+        Finds the indexed proposals clashing with a proposal placed at the given start.
+
+        Args:
+            position (int): The position of the proposal in the problem.
+            start (int): The start offset to test, in seconds from START_DATE.
+
+        Returns:
+            list[tuple[int, int]]: The position and clash time of every other indexed proposal with a different id that overlaps.
+        """
+        end: int = start + self.durations[position]
+        # Only proposals starting less than the longest duration earlier can still be running at start
+        lower: int = bisect.bisect_left(self.index, (start - self.max_duration + 1,))
+        upper: int = bisect.bisect_left(self.index, (end,))
+        clashes: list[tuple[int, int]] = list()
+        for other_start, other_position in self.index[lower:upper]:
+            if other_position == position or self.ids[other_position] == self.ids[position]:
+                continue
+            clash_time: int = min(end, other_start + self.durations[other_position]) - max(start, other_start)
+            if clash_time > 0:
+                clashes.append((other_position, clash_time))
+        return clashes
+
+    def update(self, position: int, start: int) -> None:
+        """
+        Moves a proposal to a new start offset and updates the clash contributions it affects.
+
+        Args:
+            position (int): The position of the proposal in the problem.
+            start (int): The new start offset in seconds from START_DATE, or UNSCHEDULED.
+
+        Returns:
+            None
+        """
+        old_start: int = self.starts[position]
+        if old_start == start:
+            return
+        if old_start != UNSCHEDULED:
+            del self.index[bisect.bisect_left(self.index, (old_start, position))]
+            for other_position, clash_time in self.clashes(position, old_start):
+                self.contributions[other_position] -= clash_time
+                self.total_clash_time -= 2 * clash_time
+            self.contributions[position] = 0
+            self.num_scheduled -= 1
+        if start != UNSCHEDULED:
+            for other_position, clash_time in self.clashes(position, start):
+                self.contributions[other_position] += clash_time
+                self.contributions[position] += clash_time
+                self.total_clash_time += 2 * clash_time
+            bisect.insort(self.index, (start, position))
+            self.num_scheduled += 1
+        self.starts[position] = start
+
+    def score(self) -> float:
+        """
+        Returns the fitness score of the tracked genome.
+
+        Returns:
+            float: The fitness score, ranging from 0.0 (worst) to 1.0 (best).
+        """
+        return fitness_score(self.problem, self.total_clash_time, self.num_scheduled)
+
+    def copy(self) -> "IncrementalFitness":
+        """
+        Copies the tracker, so an offspring can start from its parent's state.
+
+        Returns:
+            IncrementalFitness: An independent copy of the tracker.
+        """
+        tracker: IncrementalFitness = IncrementalFitness.__new__(IncrementalFitness)
+        tracker.__dict__.update(self.__dict__)
+        tracker.starts = self.starts.copy()
+        tracker.index = self.index.copy()
+        tracker.contributions = self.contributions.copy()
+        return tracker
+
+def genome_key(genome: np.ndarray) -> bytes:
+    """
+    Hashes a genome into a compact key, so identical genomes share one cache entry.
+
+    Args:
+        genome (np.ndarray): The int64 genome of start offsets.
+
+    Returns:
+        bytes: A 16-byte BLAKE2b digest of the genome.
+    """
+    return hashlib.blake2b(np.ascontiguousarray(genome).tobytes(), digest_size=16).digest()
+
+class FitnessCache:
+    """
+    A population-level, least recently used cache of fitness scores keyed by genome hash, shared by the Individuals of a run.
+    """
+    def __init__(self, max_size: int = 10 * 1000) -> None:
+        """
+        Initializes an empty FitnessCache.
+
+        Args:
+            max_size (int, optional): The maximum number of genomes to remember. Defaults to 10 * 1000.
+
+        Returns:
+            None
+        """
+        self.max_size: int = max_size
+        self.scores: OrderedDict[bytes, float] = OrderedDict()
+        self.memo_hits: int = 0  # Scores reused from an Individual's own memo
+        self.hits: int = 0  # Scores reused from another Individual with the same genome
+        self.misses: int = 0  # Scores computed from scratch
+        self.delta_scores: int = 0  # Scores read from an incremental evaluator instead of a full evaluation
+
+    def evaluate(self, problem: SchedulingProblem, genome: np.ndarray) -> float:
+        """
+        Returns the fitness score of a genome, computing it only if no identical genome was scored before.
+
+        Args:
+            problem (SchedulingProblem): The scheduling problem the genome belongs to.
+            genome (np.ndarray): The int64 genome of start offsets.
+
+        Returns:
+            float: The fitness score, ranging from 0.0 (worst) to 1.0 (best).
+        """
+        key: bytes = genome_key(genome)
+        score: float | None = self.scores.get(key)
+        if score is not None:
+            self.hits += 1
+            self.scores.move_to_end(key)
+            return score
+        self.misses += 1
+        score = genome_fitness(problem, genome)
+        self.store(key, score)
+        return score
+
+    def evaluate_many(self, problem: SchedulingProblem, genomes: np.ndarray) -> np.ndarray:
+        """
+        Returns the fitness scores of several genomes, scoring every genome not seen before in a single `evaluate_population()` call.
+
+        Args:
+            problem (SchedulingProblem): The scheduling problem the genomes belong to.
+            genomes (np.ndarray): A (population x proposals) int64 matrix of start offsets.
+
+        Returns:
+            np.ndarray: The float64 fitness score of each genome.
+        """
+        keys: list[bytes] = [genome_key(genome) for genome in genomes]
+        scores: np.ndarray = np.empty(len(keys), dtype=np.float64)
+        pending: dict[bytes, list[int]] = dict()  # Genomes to evaluate, with the rows sharing them
+        for row, key in enumerate(keys):
+            score: float | None = self.scores.get(key)
+            if score is not None:
+                self.hits += 1
+                self.scores.move_to_end(key)
+                scores[row] = score
+            elif key in pending:
+                self.hits += 1
+                pending[key].append(row)
+            else:
+                self.misses += 1
+                pending[key] = [row]
+
+        if pending:
+            rows: list[list[int]] = list(pending.values())
+            new_scores: np.ndarray = evaluate_population(problem, genomes[[shared_rows[0] for shared_rows in rows]])
+            for key, shared_rows, score in zip(pending.keys(), rows, new_scores.tolist()):
+                scores[shared_rows] = score
+                self.store(key, score)
+        return scores
+
+    def store(self, key: bytes, score: float) -> None:
+        """
+        Remembers the fitness score of a genome, evicting the least recently used entry when full.
+
+        Args:
+            key (bytes): The genome key, as returned by `genome_key()`.
+            score (float): The fitness score of the genome.
+
+        Returns:
+            None
+        """
+        self.scores[key] = score
+        if len(self.scores) > self.max_size:
+            self.scores.popitem(last=False)
+
+    @property
+    def num_scored(self) -> int:
+        """
+        The number of Individuals scored without their own memo, from the cache, an incremental evaluator or a full evaluation.
+
+        Returns:
+            int: The number of scored Individuals.
+        """
+        return self.hits + self.delta_scores + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of fitness lookups answered from a memo or an identical genome.
+
+        Returns:
+            float: The hit rate, ranging from 0.0 to 1.0.
+        """
+        lookups: int = self.memo_hits + self.hits + self.delta_scores + self.misses
+        return (self.memo_hits + self.hits) / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        """
+        Summarizes the cache counters.
+
+        Returns:
+            str: A one-line summary of hits, misses and hit rate.
+        """
+        return f"Fitness cache: {self.memo_hits} memo hits, {self.hits} genome hits, {self.delta_scores} delta scores, {self.misses} misses ({self.hit_rate:.1%} hit rate)"
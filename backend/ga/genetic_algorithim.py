@@ -1,32 +1,268 @@
-import random
+import time
+import dataclasses
+import numpy as np
+from typing import Callable, Iterator
 from .individual import Individual
+from .fitness import FitnessCache
+from .progress import ProgressEvent
+from .stopping import StopPolicy, StopReason
+from .breeding import score_individuals, breed_offspring
+from .repair import RepairOperator
+from .parallel import ProcessOffspringExecutor
+from .checkpoint import Checkpoint, CheckpointWriter, load_checkpoint
+from .problem import SchedulingProblem
 
 class Genetic_Algorithm:
     """
     Implements a Genetic Algorithm to optimize the scheduling of a set of proposals.
     """
-    def __init__(self, initial_individuals: list[Individual] = list(),num_of_individuals: int = 5 * 10, num_of_generations: int = 15 * 1000) -> None:
+    def __init__(self, problem: SchedulingProblem, initial_individuals: list[Individual] = list(),num_of_individuals: int = 5 * 10, num_of_generations: int = 15 * 1000, seed: int | None = None, incremental_fitness: bool = True, progress_callback: Callable[[ProgressEvent], None] | None = None, verbose: bool = True, num_of_workers: int = 1, stop_policies: list[StopPolicy] | None = None, checkpoint_path: str | None = None, checkpoint_interval: int = 100, repair_rate: float = 0.0) -> None:
         """
-        Initializes the GeneticAlgorithm with the given parameters.
+        Initializes the GeneticAlgorithm with the given parameters and generates its initial population. Evolution starts with
+        `run()`, `step()` or `iterate()`.
 
         Args:
+            problem (SchedulingProblem): The scheduling problem shared by every Individual in the population.
             initial_individuals (list[Individual]): A list of initial Individuals to start the genetic algorithm.
             num_of_individuals (int, optional): The number of Individuals in the population. Defaults to 5 * 10.
             num_of_generations (int, optional): The number of generations to evolve the population. Defaults to 15 * 1000.
+            seed (int | None, optional): The seed of the random number generator driving the run. Defaults to None, for a non-reproducible run.
+            incremental_fitness (bool, optional): Whether offspring close to a parent are scored as deltas from that parent. Defaults to True.
+            progress_callback (Callable[[ProgressEvent], None] | None, optional): Called with a ProgressEvent after each generation is ranked. Defaults to None.
+            verbose (bool, optional): Whether to print the fitness of every generation. Defaults to True.
+            num_of_workers (int, optional): The number of worker processes breeding and scoring offspring. With more than one, a process
+                pool is started when the run starts and stopped when it ends, and a seeded run gives the same result as a serial one.
+                Defaults to 1, for serial breeding.
+            stop_policies (list[StopPolicy] | None, optional): Policies that can end the run before its last generation, checked
+                after each generation is ranked. The first one to fire is recorded in `stop_reason`. Defaults to None.
+            checkpoint_path (str | None, optional): The file to write a checkpoint of the run to, every `checkpoint_interval` generations
+                and when the run ends, from a background thread. Defaults to None, for no checkpoints.
+            checkpoint_interval (int, optional): The number of generations between two checkpoints. Defaults to 100.
+            repair_rate (float, optional): The probability that each bred offspring is repaired, its clashing proposals shifted to
+                the nearest free feasible start or unscheduled, ranging from 0.0 to 1.0. Defaults to 0.0, for no repairs.
 
         Returns:
             None
         """
+        self.problem: SchedulingProblem = problem
         self.num_of_individuals: int = num_of_individuals
         self.num_of_generations: int = num_of_generations
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.incremental_fitness: bool = incremental_fitness
+        self.progress_callback: Callable[[ProgressEvent], None] | None = progress_callback
+        self.verbose: bool = verbose
+        self.stop_policies: list[StopPolicy] = stop_policies if stop_policies else list()
+        self.stop_reason: StopReason | None = None if num_of_generations > 0 else StopReason.NUM_OF_GENERATIONS  # The policy that ended the run, None while it can still evolve
+        self.generation: int = 0  # The number of completed generations
+        self.num_of_workers: int = num_of_workers
+        self.offspring_executor: ProcessOffspringExecutor | None = None
+        self.checkpoint_path: str | None = checkpoint_path
+        self.checkpoint_interval: int = checkpoint_interval
+        self.checkpoint_writer: CheckpointWriter | None = None
+        self.repair_rate: float = repair_rate
+        self.repair_operator: RepairOperator | None = RepairOperator(problem) if repair_rate > 0 else None
+        # The time budget covers evolution only, so the clock starts with the first generation rather than here
+        self.start_time: float | None = None
+        self.previous_elapsed: float = 0.0  # The time taken by the run before it was resumed, in seconds
+        self.num_scored: int = 0  # Value of the fitness cache counter at the last progress event
+        self.fitness_cache: FitnessCache = FitnessCache()
         self.individuals: list[Individual] = initial_individuals if initial_individuals else list()
+        for individual in self.individuals:
+            individual.fitness_cache = self.fitness_cache
         self.generate_individuals()
 
-        for generation in range(num_of_generations):
-            self.individuals.sort(key=lambda individual: individual.compute_fitness(), reverse=True)
-            self.print_fitness(generation)
-            self.evolve()
-            
+    @classmethod
+    def resume(cls, problem: SchedulingProblem, checkpoint_path: str, **kwargs) -> "Genetic_Algorithm":
+        """
+        Rebuilds a run from its latest checkpoint, so it continues on the same trajectory as the run that wrote it. The run keeps
+        writing checkpoints to the same file.
+
+        Stop policies start afresh, except for the time budget, which counts the time the run had already taken.
+
+        Args:
+            problem (SchedulingProblem): The scheduling problem of the run, which must match the one of the checkpoint.
+            checkpoint_path (str): The path of the checkpoint file.
+            **kwargs: The other parameters of the run, as given to the constructor. The population size and number of generations are
+                taken from the checkpoint.
+
+        Returns:
+            Genetic_Algorithm: The run, ready to `run()` from the generation after the checkpoint.
+        """
+        checkpoint: Checkpoint = load_checkpoint(checkpoint_path)
+        checkpoint.check_problem(problem)
+        individuals: list[Individual] = list()
+        for genome, fitness in zip(checkpoint.genomes, checkpoint.fitnesses.tolist()):
+            individual: Individual = Individual(problem, genome)
+            individual.assign_fitness(fitness)
+            individuals.append(individual)
+        kwargs.update(initial_individuals=individuals, num_of_individuals=len(individuals), num_of_generations=checkpoint.num_of_generations, checkpoint_path=checkpoint_path)
+        genetic_algorithm: Genetic_Algorithm = cls(problem, **kwargs)
+        genetic_algorithm.rng.bit_generator.state = checkpoint.rng_state
+        genetic_algorithm.generation = checkpoint.generation
+        genetic_algorithm.previous_elapsed = checkpoint.elapsed
+        if checkpoint.generation >= checkpoint.num_of_generations:
+            genetic_algorithm.stop_reason = StopReason.NUM_OF_GENERATIONS
+        return genetic_algorithm
+
+    def checkpoint(self) -> Checkpoint:
+        """
+        Takes a snapshot of the run. The snapshot shares nothing mutable with the run, so it can be written while the run goes on.
+
+        Args:
+            None
+
+        Returns:
+            Checkpoint: The snapshot of the run.
+        """
+        fitnesses: np.ndarray = np.array([individual.compute_fitness() for individual in self.individuals])
+        best: int = int(np.argmax(fitnesses))
+        return Checkpoint(
+            genomes=np.stack([individual.genome for individual in self.individuals]),
+            fitnesses=fitnesses,
+            rng_state=self.rng.bit_generator.state,
+            generation=self.generation,
+            num_of_generations=self.num_of_generations,
+            elapsed=self.elapsed,
+            best_genome=self.individuals[best].genome.copy(),
+            best_fitness=float(fitnesses[best]),
+            proposal_ids=self.problem.ids.copy(),
+            start_date=self.problem.start_date.isoformat(),
+            end_date=self.problem.end_date.isoformat(),
+        )
+
+    @property
+    def finished(self) -> bool:
+        """
+        Whether the run has ended, by reaching its last generation or through a stop policy.
+
+        Returns:
+            bool: True if the run cannot evolve any further, False otherwise.
+        """
+        return self.stop_reason is not None
+
+    @property
+    def elapsed(self) -> float:
+        """
+        The time the run has spent evolving, including the time taken before it was resumed.
+
+        Returns:
+            float: The elapsed time in seconds.
+        """
+        running: float = time.perf_counter() - self.start_time if self.start_time is not None else 0.0
+        return self.previous_elapsed + running
+
+    def advance(self) -> ProgressEvent:
+        """
+        Runs one generation: ranks the population, reports its progress, checks the stop policies and evolves it.
+
+        Args:
+            None
+
+        Returns:
+            ProgressEvent: The state of the run after the generation was ranked.
+        """
+        if self.start_time is None:
+            self.start_time = time.perf_counter()
+        if self.offspring_executor is None and self.num_of_workers > 1:
+            self.offspring_executor = ProcessOffspringExecutor(self.problem, self.num_of_workers)
+        try:
+            generation: int = self.generation
+            self.rank()
+            if self.verbose:
+                self.print_fitness(generation)
+            event: ProgressEvent = self.progress_event(generation)
+            stop_policy: StopPolicy | None = next((stop_policy for stop_policy in self.stop_policies if stop_policy.should_stop(event)), None)
+            if stop_policy is not None:
+                self.stop_reason = stop_policy.reason
+            elif generation >= self.num_of_generations - 1:
+                self.stop_reason = StopReason.NUM_OF_GENERATIONS
+            if self.stop_reason is not None:
+                event = dataclasses.replace(event, stop_reason=self.stop_reason)
+            if self.progress_callback is not None:
+                self.progress_callback(event)
+            if stop_policy is None:
+                self.evolve()
+            self.generation += 1
+            if self.checkpoint_path is not None and (self.generation % self.checkpoint_interval == 0 or self.finished):
+                if self.checkpoint_writer is None:
+                    self.checkpoint_writer = CheckpointWriter(self.checkpoint_path)
+                self.checkpoint_writer.submit(self.checkpoint())
+        except BaseException:
+            self.close()
+            raise
+        if self.finished:
+            self.close()
+            if self.verbose:
+                print(self.fitness_cache)
+                # Only counts the lookups of this process, not those of offspring bred by workers
+                print(self.problem.ephemeris)
+                if self.repair_operator is not None:
+                    print(self.repair_operator)
+        return event
+
+    def step(self, num_of_generations: int = 1) -> ProgressEvent | None:
+        """
+        Runs up to a number of generations, fewer if the run ends first. A run can be stepped, observed and stepped again.
+
+        Args:
+            num_of_generations (int, optional): The number of generations to run. Defaults to 1.
+
+        Returns:
+            ProgressEvent | None: The state of the run after its latest generation, or None if no generation was run.
+        """
+        event: ProgressEvent | None = None
+        for _ in range(num_of_generations):
+            if self.finished:
+                break
+            event = self.advance()
+        return event
+
+    def iterate(self) -> Iterator[ProgressEvent]:
+        """
+        Runs the remaining generations one at a time, yielding the state of the run after each. Leaving the loop early pauses
+        the run, which the next call to `step()`, `iterate()` or `run()` resumes.
+
+        Args:
+            None
+
+        Returns:
+            Iterator[ProgressEvent]: The state of the run after each generation.
+        """
+        while not self.finished:
+            yield self.advance()
+
+    def run(self) -> Individual:
+        """
+        Runs the remaining generations until the last one or until a stop policy ends the run.
+
+        Args:
+            None
+
+        Returns:
+            Individual: The Individual with the highest fitness score once the run has ended.
+        """
+        for _ in self.iterate():
+            pass
+        return self.get_best_fit_individual()
+
+    def close(self) -> None:
+        """
+        Stops the worker processes of the run, if any, and waits for the last checkpoint to be written. They are started again if
+        the run is resumed.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.offspring_executor is not None:
+            self.offspring_executor.close()
+            self.offspring_executor = None
+        if self.checkpoint_writer is not None:
+            checkpoint_writer, self.checkpoint_writer = self.checkpoint_writer, None
+            checkpoint_writer.close()
+
     def generate_individuals(self) -> None:
         """
         Generates the initial population of Individuals for the Genetic Algorithm.
@@ -39,7 +275,34 @@ class Genetic_Algorithm:
         """
         num_of_new_individuals: int = self.num_of_individuals - len(self.individuals)
         for _ in range(min(num_of_new_individuals, self.num_of_individuals)):
-            self.individuals.append(Individual())
+            self.individuals.append(Individual(self.problem, rng=self.rng, fitness_cache=self.fitness_cache))
+        return
+
+    def score(self, individuals: list[Individual]) -> None:
+        """
+        Scores every Individual that needs a full evaluation with a single batch evaluation of their genomes.
+
+        Args:
+            individuals (list[Individual]): The Individuals to score.
+
+        Returns:
+            None
+        """
+        score_individuals(individuals, self.fitness_cache)
+        return
+
+    def rank(self) -> None:
+        """
+        Scores the population in one batch and sorts it from the fittest to the least fit Individual.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.score(self.individuals)
+        self.individuals.sort(key=lambda individual: individual.compute_fitness(), reverse=True)
         return
 
     def evolve(self, crossover_rate: float = 0.2, mutation_rate: float = 0.1) -> None:
@@ -54,24 +317,37 @@ class Genetic_Algorithm:
             None
         """
         # Elitism: Keep the best timetables
-        self.individuals.sort(key=lambda individual: individual.compute_fitness(), reverse=True)
+        self.rank()
         elite_individuals: list[Individual] = self.individuals[:int(self.num_of_individuals * 0.75)]
         
         starting_index: int = self.num_of_individuals - 1 - int(self.num_of_individuals * crossover_rate)
-        
-        for index in range(starting_index, self.num_of_individuals, 1):
-            parent_individual_1: Individual = random.choice(elite_individuals)
-            parent_individual_2: Individual = random.choice(elite_individuals)
-            num_offsprings: int = random.randint(4, 8)
-            offsprings: list[Individual] = list()
-        
-            for _ in range(num_offsprings):
-                offspring: Individual = Individual(parent_individual_1.crossover(parent_individual_2.schedules))
-                offspring.mutation(mutation_rate=mutation_rate)
-                offsprings.append(offspring)
-        
-            offsprings.sort(key=lambda individual: individual.compute_fitness(), reverse=True)
-            offspring_individual: Individual = random.choice(offsprings[:max(2, int(num_offsprings * 0.4))])
+        indexes: range = range(starting_index, self.num_of_individuals, 1)
+
+        # Every random choice of a slot is drawn up front, so slots can be bred in any order or process with the same result
+        parents: list[tuple[Individual, Individual]] = list()
+        num_offsprings: list[int] = list()
+        seeds: list[int] = list()
+        for _ in indexes:
+            parent_individual_1: Individual = elite_individuals[self.rng.integers(len(elite_individuals))]
+            parent_individual_2: Individual = elite_individuals[self.rng.integers(len(elite_individuals))]
+            parents.append((parent_individual_1, parent_individual_2))
+            num_offsprings.append(int(self.rng.integers(4, 9)))
+            seeds.append(int(self.rng.integers(np.iinfo(np.int64).max)))
+
+        if self.offspring_executor is not None:
+            offsprings: list[Individual] = self.offspring_executor.breed(parents, num_offsprings, seeds, mutation_rate, self.incremental_fitness, self.fitness_cache)
+        else:
+            offsprings = [
+                breed_offspring(parent_individual_1, parent_individual_2, num_offspring, np.random.default_rng(seed), mutation_rate, self.incremental_fitness, self.fitness_cache)
+                for (parent_individual_1, parent_individual_2), num_offspring, seed in zip(parents, num_offsprings, seeds)
+            ]
+
+        # Offspring are repaired in this process, with draws taken after breeding, so serial and parallel runs stay identical
+        if self.repair_operator is not None:
+            for offspring_individual, draw in zip(offsprings, self.rng.random(len(offsprings)).tolist()):
+                if draw < self.repair_rate:
+                    self.repair_operator.repair(offspring_individual)
+        for index, offspring_individual in zip(indexes, offsprings):
             self.individuals[index] = offspring_individual
         return
 
@@ -102,6 +378,30 @@ class Genetic_Algorithm:
         print(", ".join(f"{score:3.2f}" for score in least_fittest_two))
         return
 
+    def progress_event(self, generation: int) -> ProgressEvent:
+        """
+        Summarizes the ranked population after a generation.
+
+        Args:
+            generation (int): The current generation number.
+
+        Returns:
+            ProgressEvent: The best, median and worst fitness of the population, and the number of Individuals scored since the last event.
+        """
+        fitness_scores: np.ndarray = np.array([individual.compute_fitness() for individual in self.individuals])
+        num_scored: int = self.fitness_cache.num_scored
+        event: ProgressEvent = ProgressEvent(
+            generation=generation + 1,
+            num_of_generations=self.num_of_generations,
+            best_fitness=float(fitness_scores.max()),
+            median_fitness=float(np.median(fitness_scores)),
+            worst_fitness=float(fitness_scores.min()),
+            num_scored=num_scored - self.num_scored,
+            elapsed=self.elapsed,
+        )
+        self.num_scored = num_scored
+        return event
+
     def get_best_fit_individual(self) -> Individual:
         """
         Retrieves the Individual with the highest fitness score from the current population.
@@ -113,7 +413,7 @@ class Genetic_Algorithm:
             Individual: The Individual with the highest fitness score in the current population.
         """
         # Sort individuals by score and return the best one
-        self.individuals.sort(key=lambda individual: individual.compute_fitness(), reverse=True)
+        self.rank()
         return self.individuals[0]
 
 
@@ -1,177 +1,257 @@
-import random
-import copy
-from datetime import date, datetime, timedelta
+import numpy as np
 from .proposal import Proposal
-from .utils import get_global_vars
+from .problem import SchedulingProblem, UNSCHEDULED
+from .fitness import FitnessCache, IncrementalFitness, genome_fitness
 
-START_DATE: date = date.today()
-END_DATE: date = date.today()
-PROPOSALS: list[Proposal] = []
-
-def generate_random_date() -> date:
-    """
-    Randomly generates a date between START_DATE and END_DATE.
-
-    Args:
-        None
-
-    Returns:
-        date: A randomly generated date between START_DATE and END_DATE.
-    """
-    delta_days: int = (END_DATE - START_DATE).days
-    days: int = random.randint(0, delta_days)
-    return START_DATE + timedelta(days=days)
-
-def generate_random_start_datetime(proposal: Proposal) -> datetime|None:
+def generate_random_start_offset(problem: SchedulingProblem, position: int, rng: np.random.Generator) -> int:
     """
-    Generates a random start datetime for a proposal, ensuring that all constraints are met.
+    Generates a random start offset for a proposal, drawn uniformly from the precomputed starts at which all constraints are met.
 
     Args:
-        proposal (Proposal): The proposal object for which to generate a random start datetime.
+        problem (SchedulingProblem): The scheduling problem the proposal belongs to.
+        position (int): The position of the proposal in the problem.
+        rng (np.random.Generator): The random number generator to draw from.
 
     Returns:
-        datetime|None: A randomly generated start datetime that meets all constraints, or None if no valid datetime could be found.
+        int: A randomly generated start offset in seconds from START_DATE that meets all constraints, or UNSCHEDULED if the proposal has no valid start.
     """
-    for _ in range(5):
-        if random.random() > 0.75:
-            break
-        start_date = generate_random_date()
-        earliest_datetime = datetime.combine(date=start_date, time=proposal.lst_start_time)
-        latest_datetime = datetime.combine(date=start_date, time=proposal.lst_start_end_time)
-        delta_seconds = (latest_datetime - earliest_datetime).seconds
-        seconds = random.randint(0, delta_seconds)
-        proposed_start_datetime:datetime = earliest_datetime + timedelta(seconds=seconds)
-        if proposal.all_constraints_met(proposed_start_datetime):
-            return proposed_start_datetime
-    return None
+    start_offset: int | None = problem.feasible_starts[position].sample(rng)
+    return UNSCHEDULED if start_offset is None else start_offset
 
 class Individual:
     """
     An Individual represents a candidate solution in an optimization problem, typically in the context of evolutionary algorithms.
+
+    Its chromosome is a genome: an int64 array holding, for every proposal position of the shared problem, the scheduled start
+    in seconds from START_DATE, or UNSCHEDULED.
     """
-    def __init__(self, schedules: list[Proposal] = []):
+    def __init__(self, problem: SchedulingProblem, genome: np.ndarray | None = None, rng: np.random.Generator | None = None, fitness_cache: FitnessCache | None = None):
         """
         Initialize an Individual object.
 
         Args:
-            schedules (list[Schedule], optional): A list of Schedule objects associated with the Individual. If not provided, the `generate()` method will be called to generate the schedules.
+            problem (SchedulingProblem): The scheduling problem shared by every Individual of a run.
+            genome (np.ndarray | None, optional): The start offsets of the Individual. If not provided, the `generate()` method will be called to generate them.
+            rng (np.random.Generator | None, optional): The random number generator used by `generate()`. Defaults to a freshly seeded generator.
+            fitness_cache (FitnessCache | None, optional): The population-level cache to score the genome through. Defaults to None.
 
         Returns:
             None
         """
-        global START_DATE, END_DATE, PROPOSALS
-        START_DATE, END_DATE, proposals_dict = get_global_vars()
-        PROPOSALS = [Proposal.from_dict(p) for p in proposals_dict]
-        self.schedules: list[Proposal] = []
-        if schedules == []:
-            self.generate()
+        self.problem: SchedulingProblem = problem
+        self.fitness_cache: FitnessCache | None = fitness_cache
+        self._fitness: float | None = None  # Memoized fitness, cleared whenever the genome changes
+        self._genome: np.ndarray
+        self._owns_genome: bool = False  # Whether the genome array may be written in place
+        self._tracker: IncrementalFitness | None = None  # Incremental evaluator kept in step with the genome
+        if genome is None:
+            self.generate(rng)
         else:
-            self.schedules = schedules
+            self.genome = genome
 
-    def generate(self) -> None:
+    @classmethod
+    def from_schedules(cls, problem: SchedulingProblem, schedules: list[Proposal]) -> "Individual":
         """
-        Generate schedules from proposals for an Individual.
+        Builds an Individual from scheduled proposals, such as a timetable edited by a user.
 
         Args:
+            problem (SchedulingProblem): The scheduling problem the schedules belong to.
+            schedules (list[Proposal]): The scheduled proposals, ordered like the problem's proposals.
+
+        Returns:
+            Individual: An Individual whose genome encodes the given schedules.
+        """
+        return cls(problem, problem.encode(schedules))
+
+    @property
+    def genome(self) -> np.ndarray:
+        """
+        The int64 start offsets of the Individual, indexed by proposal position.
+
+        Returns:
+            np.ndarray: The genome of the Individual.
+        """
+        return self._genome
+
+    @genome.setter
+    def genome(self, genome: np.ndarray) -> None:
+        """
+        Replaces the genome of the Individual and clears its memoized fitness.
+
+        Args:
+            genome (np.ndarray): The new int64 genome, which may be shared with other Individuals.
+
+        Returns:
             None
+        """
+        self._genome = genome
+        self._owns_genome = False
+        self._fitness = None
+        self._tracker = None
+
+    def set_gene(self, position: int, offset: int) -> None:
+        """
+        Assigns the start offset of a single proposal, clearing the memoized fitness only if the genome changes.
+
+        Args:
+            position (int): The position of the proposal in the problem.
+            offset (int): The new start offset in seconds from START_DATE, or UNSCHEDULED.
 
         Returns:
             None
         """
-        global PROPOSALS
-        for proposal in PROPOSALS:
-            start_datetime = generate_random_start_datetime(proposal) if random.random() > 0.75 else None
-            schedule_proposal: Proposal = proposal
-            schedule_proposal.scheduled_start_datetime = start_datetime
-            self.schedules.append(schedule_proposal)
+        if self._genome[position] == offset:
+            return
+        if not self._owns_genome:
+            # Copy on first write, as the genome may be shared with a parent or another Individual
+            self._genome = self._genome.copy()
+            self._owns_genome = True
+        self._genome[position] = offset
+        self._fitness = None
+        if self._tracker is not None:
+            self._tracker.update(position, offset)
+
+    @property
+    def needs_evaluation(self) -> bool:
+        """
+        Whether scoring the Individual requires a full evaluation, because it has neither a memoized score nor an incremental evaluator.
+
+        Returns:
+            bool: True if the fitness has to be computed from the genome, False otherwise.
+        """
+        return self._fitness is None and self._tracker is None
+
+    def assign_fitness(self, fitness: float) -> None:
+        """
+        Memoizes a fitness score computed elsewhere for the current genome, such as by a batch evaluation of the population.
+
+        Args:
+            fitness (float): The fitness score of the current genome.
+
+        Returns:
+            None
+        """
+        self._fitness = fitness
+
+    def fitness_tracker(self) -> IncrementalFitness:
+        """
+        Returns the incremental evaluator of the Individual, building it from the genome if needed.
+
+        Returns:
+            IncrementalFitness: The evaluator kept in step with the genome.
+        """
+        if self._tracker is None:
+            self._tracker = IncrementalFitness(self.problem, self._genome)
+        return self._tracker
+
+    def track_fitness(self, parents: list["Individual"], max_delta_fraction: float = 0.25) -> None:
+        """
+        Starts incremental fitness evaluation from the parent whose genome is closest, so later gene changes are scored as deltas.
+
+        If every parent differs in more than `max_delta_fraction` of the genes, replaying the differences would cost more than a
+        full evaluation, and the Individual is left to be scored from scratch.
+
+        Args:
+            parents (list[Individual]): The Individuals the genome was bred from.
+            max_delta_fraction (float, optional): The largest fraction of differing genes worth replaying. Defaults to 0.25.
+
+        Returns:
+            None
+        """
+        differences: list[np.ndarray] = [np.flatnonzero(parent.genome != self._genome) for parent in parents]
+        closest: int = min(range(len(parents)), key=lambda index: len(differences[index]))
+        if len(differences[closest]) > max_delta_fraction * len(self._genome):
+            return
+        tracker: IncrementalFitness = parents[closest].fitness_tracker().copy()
+        for position in differences[closest]:
+            tracker.update(int(position), int(self._genome[position]))
+        self._tracker = tracker
+
+    @property
+    def schedules(self) -> list[Proposal]:
+        """
+        Decodes the genome into Proposal objects carrying their scheduled start datetimes.
+
+        Returns:
+            list[Proposal]: One scheduled Proposal per proposal of the problem.
+        """
+        return self.problem.decode(self.genome)
+
+    def generate(self, rng: np.random.Generator | None = None) -> None:
+        """
+        Generate schedules from proposals for an Individual.
+
+        Args:
+            rng (np.random.Generator | None, optional): The random number generator to draw from. Defaults to a freshly seeded generator.
+
+        Returns:
+            None
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        genome: np.ndarray = np.full(self.problem.num_of_proposals, UNSCHEDULED, dtype=np.int64)
+        for position in range(self.problem.num_of_proposals):
+            if rng.random() > 0.75:
+                genome[position] = generate_random_start_offset(self.problem, position, rng)
+        self.genome = genome
         return
-        
+
     def compute_fitness(self) -> float:
         """
         Compute the fitness of the Individual based on the scheduled proposals and potential clashes.
 
+        The score is memoized until the genome changes. It is then read from the incremental evaluator when one is tracking
+        the genome, or looked up in the population-level cache when one is attached.
+
         Args:
             None
 
         Returns:
             float: The fitness score of the Individual, ranging from 0.0 (worst) to 1.0 (best).
         """
-        total_proposal_duration: int = 0
-        total_clash_time: float = 0
-        total_unscheduled_time: int = 0
-        num_scheduled_proposals: int = 0
-
-        for proposal in self.schedules:
-            total_proposal_duration += proposal.simulated_duration
-            if proposal.scheduled_start_datetime is not None:
-                num_scheduled_proposals += 1
-                for another_proposal in self.schedules:
-                    if (proposal.id != another_proposal.id):
-                        if another_proposal.scheduled_start_datetime is not None:
-                            # Calculate end times for both proposals
-                            proposal_end_datetime = proposal.scheduled_start_datetime + timedelta(seconds=proposal.simulated_duration)
-                            another_proposal_end_datetime = another_proposal.scheduled_start_datetime + timedelta(seconds=another_proposal.simulated_duration)
-
-                            # Check for clash
-                            # Calculate clash time
-                            max_start = max(proposal.scheduled_start_datetime, another_proposal.scheduled_start_datetime)
-                            min_end = min(proposal_end_datetime, another_proposal_end_datetime)
-                            
-                            # Calculate clash time in seconds
-                            clash_time = max(0, (min_end - max_start).total_seconds())
-                            total_clash_time += clash_time
-                        else:
-                            total_unscheduled_time += proposal.simulated_duration
-            else:
-                total_unscheduled_time += proposal.simulated_duration
-
-        # If no proposals are scheduled, return a score of 0
-        if num_scheduled_proposals == 0:
-            return 0.0 
-        # Return the score as a fraction of non-clash time to total time
-        return ((total_proposal_duration - total_clash_time) / (total_proposal_duration)) * (0.95 ** (len(self.schedules) - num_scheduled_proposals))
- 
-    def crossover(self, schedules: list[Proposal]) -> list[Proposal]:
-        """
-        Perform crossover between the schedules of the current Individual and the provided schedules.
+        if self._fitness is not None:
+            if self.fitness_cache is not None:
+                self.fitness_cache.memo_hits += 1
+            return self._fitness
+        if self._tracker is not None:
+            self._fitness = self._tracker.score()
+            if self.fitness_cache is not None:
+                self.fitness_cache.delta_scores += 1
+        elif self.fitness_cache is not None:
+            self._fitness = self.fitness_cache.evaluate(self.problem, self._genome)
+        else:
+            self._fitness = genome_fitness(self.problem, self._genome)
+        return self._fitness
+
+    def crossover(self, genome: np.ndarray, rng: np.random.Generator | None = None) -> np.ndarray:
+        """
+        Perform uniform crossover between the genome of the current Individual and the provided genome.
 
         Args:
-            schedules (list[Proposa]): The schedules of another Individual to be used in the crossover operation.
+            genome (np.ndarray): The genome of another Individual to be used in the crossover operation.
+            rng (np.random.Generator | None, optional): The random number generator to draw from. Defaults to a freshly seeded generator.
 
         Returns:
-            list[Proposal]: The offspring's schedules resulting from the crossover operation.
+            np.ndarray: The offspring's genome resulting from the crossover operation.
         """
-        offspring_schedules: list[Proposal] = list()
-        for schedule_1, schedule_2 in zip(self.schedules, schedules):
-            offspring_schedules.append(schedule_1 if random.random() > 0.5 else schedule_2)
-        return offspring_schedules
-    
-    def mutation(self, mutation_rate: float = 0.3) -> None:
+        rng = rng if rng is not None else np.random.default_rng()
+        return np.where(rng.random(len(self.genome)) > 0.5, self.genome, genome)
+
+    def mutation(self, mutation_rate: float = 0.3, rng: np.random.Generator | None = None) -> None:
         """
-        Perform mutation on the schedules of the Individual.
+        Perform mutation on the genome of the Individual.
 
         Args:
             mutation_rate (float, optional): The rate of mutation, ranging from 0.0 to 1.0. Defaults to 0.3.
+            rng (np.random.Generator | None, optional): The random number generator to draw from. Defaults to a freshly seeded generator.
 
         Returns:
             None
         """
-        num_of_mutable_schedules: int = int(len(self.schedules) * mutation_rate)
-        mutation_indexes: list[int] = list()  # Use a set for unique mutation indexes
-
-        # Create a deep copy of the schedules to avoid modifying the original
-        original_schedules = copy.deepcopy(self.schedules)
-
-        while len(mutation_indexes) < num_of_mutable_schedules:
-            mutation_index = random.randint(0, len(original_schedules) - 1)
-            
-            if mutation_index not in mutation_indexes:
-                proposal: Proposal = original_schedules[mutation_index]
-                start_datetime = generate_random_start_datetime(proposal) if random.random() > 0.75 else None  # Compute new start_datetime
-                
-                # Mutate the copied schedule
-                original_schedules[mutation_index].scheduled_start_datetime = start_datetime  # Mutate the start_datetime at this mutation index
-                mutation_indexes.append(mutation_index)
-
-        # Update self.schedules with the mutated schedules
-        self.schedules = original_schedules
\ No newline at end of file
+        rng = rng if rng is not None else np.random.default_rng()
+        num_of_mutable_genes: int = int(len(self.genome) * mutation_rate)
+        mutation_indexes: np.ndarray = rng.choice(len(self.genome), size=num_of_mutable_genes, replace=False)
+
+        for mutation_index in mutation_indexes:
+            # Mutate the start offset at this mutation index
+            start_offset: int = generate_random_start_offset(self.problem, int(mutation_index), rng) if rng.random() > 0.75 else UNSCHEDULED
+            self.set_gene(int(mutation_index), start_offset)
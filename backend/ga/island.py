@@ -0,0 +1,156 @@
+import math
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from . import parallel
+from .problem import SchedulingProblem
+from .individual import Individual
+from .genetic_algorithim import Genetic_Algorithm
+
+TOPOLOGIES: tuple[str, ...] = ("ring", "random")
+
+def evolve_island(problem: SchedulingProblem | None, genomes: np.ndarray, num_of_individuals: int, num_of_generations: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evolves one island for an epoch, starting from its current genomes.
+
+    Args:
+        problem (SchedulingProblem | None): The scheduling problem, or None in a worker process that received it at startup.
+        genomes (np.ndarray): The (individuals x proposals) genomes of the island, or an empty array for a new island.
+        num_of_individuals (int): The number of Individuals of the island.
+        num_of_generations (int): The number of generations of the epoch.
+        seed (int): The seed of the island's random number generator for the epoch.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The genomes of the island, from the fittest to the least fit, and their fitness scores.
+    """
+    problem = problem if problem is not None else parallel.worker_problem
+    initial_individuals: list[Individual] = [Individual(problem, genome) for genome in genomes]
+    genetic_algorithm: Genetic_Algorithm = Genetic_Algorithm(problem=problem, initial_individuals=initial_individuals, num_of_individuals=num_of_individuals, num_of_generations=num_of_generations, seed=seed, verbose=False)
+    genetic_algorithm.run()
+    return np.stack([individual.genome for individual in genetic_algorithm.individuals]), np.array([individual.compute_fitness() for individual in genetic_algorithm.individuals])
+
+class IslandModel:
+    """
+    Evolves several sub-populations of the Genetic Algorithm in separate processes, migrating the fittest genomes between them
+    every few generations.
+    """
+    def __init__(self, problem: SchedulingProblem, num_of_islands: int = 4, num_of_individuals: int = 10, num_of_generations: int = 50, migration_interval: int = 10, num_of_migrants: int = 2, topology: str = "ring", seed: int | None = None, num_of_workers: int | None = None) -> None:
+        """
+        Initializes the IslandModel with the given parameters.
+
+        Args:
+            problem (SchedulingProblem): The scheduling problem shared by every island.
+            num_of_islands (int, optional): The number of sub-populations. Defaults to 4.
+            num_of_individuals (int, optional): The number of Individuals of each island. Defaults to 10.
+            num_of_generations (int, optional): The number of generations every island evolves for. Defaults to 50.
+            migration_interval (int, optional): The number of generations between two migrations. Defaults to 10.
+            num_of_migrants (int, optional): The number of fittest genomes each island sends at a migration. Defaults to 2.
+            topology (str, optional): Where migrants go: "ring" sends them to the next island, "random" to another island drawn at
+                every migration. Defaults to "ring".
+            seed (int | None, optional): The seed of the random number generator driving the run. Defaults to None, for a non-reproducible run.
+            num_of_workers (int | None, optional): The number of worker processes. Defaults to one per island. With 1, islands evolve in this process.
+
+        Returns:
+            None
+        """
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology '{topology}', expected one of {', '.join(TOPOLOGIES)}")
+        self.problem: SchedulingProblem = problem
+        self.num_of_islands: int = num_of_islands
+        self.num_of_individuals: int = num_of_individuals
+        self.num_of_generations: int = num_of_generations
+        self.migration_interval: int = migration_interval
+        self.num_of_migrants: int = min(num_of_migrants, num_of_individuals - 1)
+        self.topology: str = topology
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.num_of_workers: int = num_of_workers if num_of_workers is not None else num_of_islands
+        self.islands: list[np.ndarray] = [np.empty((0, problem.num_of_proposals), dtype=np.int64) for _ in range(num_of_islands)]
+        self.fitnesses: list[np.ndarray] = [np.empty(0) for _ in range(num_of_islands)]
+
+    def destinations(self) -> list[int]:
+        """
+        Picks the island each island sends its migrants to.
+
+        Args:
+            None
+
+        Returns:
+            list[int]: The destination of each island, never the island itself.
+        """
+        if self.topology == "ring":
+            return [(island + 1) % self.num_of_islands for island in range(self.num_of_islands)]
+        return [(island + int(self.rng.integers(1, self.num_of_islands))) % self.num_of_islands for island in range(self.num_of_islands)]
+
+    def migrate(self) -> None:
+        """
+        Copies the fittest genomes of every island over the least fit genomes of its destination.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.num_of_islands < 2 or self.num_of_migrants < 1:
+            return
+        # Migrants are picked before any island receives, so a migration is not affected by the order of the islands
+        migrants: list[np.ndarray] = [genomes[:self.num_of_migrants].copy() for genomes in self.islands]
+        incoming: list[list[np.ndarray]] = [list() for _ in range(self.num_of_islands)]
+        for island, destination in enumerate(self.destinations()):
+            incoming[destination].append(migrants[island])
+        for island, arrivals in enumerate(incoming):
+            if not arrivals:
+                continue
+            arriving: np.ndarray = np.concatenate(arrivals)[:self.num_of_individuals - 1]  # The fittest genome of the island always stays
+            self.islands[island][len(self.islands[island]) - len(arriving):] = arriving
+            self.fitnesses[island][len(self.fitnesses[island]) - len(arriving):] = np.nan  # Rescored by the next epoch
+
+    def run(self) -> Individual:
+        """
+        Evolves every island, migrating between epochs, and returns the global best.
+
+        Args:
+            None
+
+        Returns:
+            Individual: The fittest Individual across all islands.
+        """
+        num_of_epochs: int = math.ceil(self.num_of_generations / self.migration_interval)
+        executor: ProcessPoolExecutor | None = None
+        if self.num_of_workers > 1:
+            # Workers receive the problem once, so epochs only exchange genomes
+            executor = ProcessPoolExecutor(max_workers=self.num_of_workers, mp_context=multiprocessing.get_context("spawn"), initializer=parallel.initialize_worker, initargs=(self.problem,))
+        try:
+            for epoch in range(num_of_epochs):
+                num_of_generations: int = min(self.migration_interval, self.num_of_generations - epoch * self.migration_interval)
+                seeds: list[int] = [int(self.rng.integers(np.iinfo(np.int64).max)) for _ in range(self.num_of_islands)]
+                if executor is not None:
+                    results = list(executor.map(evolve_island, [None] * self.num_of_islands, self.islands, [self.num_of_individuals] * self.num_of_islands, [num_of_generations] * self.num_of_islands, seeds))
+                else:
+                    results = [evolve_island(self.problem, genomes, self.num_of_individuals, num_of_generations, seed) for genomes, seed in zip(self.islands, seeds)]
+                self.islands = [genomes for genomes, _ in results]
+                self.fitnesses = [fitnesses for _, fitnesses in results]
+                if epoch < num_of_epochs - 1:
+                    self.migrate()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        return self.get_best_fit_individual()
+
+    def get_best_fit_individual(self) -> Individual:
+        """
+        Retrieves the fittest Individual across all islands after the last epoch. Fails with a RuntimeError before any
+        epoch has run.
+
+        Args:
+            None
+
+        Returns:
+            Individual: The Individual with the highest fitness score of any island.
+        """
+        if any(len(fitnesses) == 0 for fitnesses in self.fitnesses):
+            raise RuntimeError("run() has not been called")
+        island: int = int(np.argmax([fitnesses[0] for fitnesses in self.fitnesses]))
+        best_individual: Individual = Individual(self.problem, self.islands[island][0])
+        best_individual.assign_fitness(float(self.fitnesses[island][0]))
+        return best_individual
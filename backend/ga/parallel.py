@@ -0,0 +1,133 @@
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from .problem import SchedulingProblem
+from .individual import Individual
+from .fitness import FitnessCache
+from .breeding import breed_offspring
+
+# State of a worker process, set once by its initializer
+worker_problem: SchedulingProblem | None = None
+worker_fitness_cache: FitnessCache | None = None
+
+def initialize_worker(problem: SchedulingProblem) -> None:
+    """
+    Receives the problem once when a worker process starts, so tasks only carry genomes.
+
+    Args:
+        problem (SchedulingProblem): The scheduling problem of the run.
+
+    Returns:
+        None
+    """
+    global worker_problem, worker_fitness_cache
+    worker_problem = problem
+    worker_fitness_cache = FitnessCache()
+
+def breed_in_worker(parent_genome_1: np.ndarray, parent_genome_2: np.ndarray, num_offsprings: int, seed: int, mutation_rate: float, incremental_fitness: bool) -> tuple[np.ndarray, float, tuple[int, int, int]]:
+    """
+    Breeds the offspring of one slot in a worker process.
+
+    Args:
+        parent_genome_1 (np.ndarray): The genome of the first parent.
+        parent_genome_2 (np.ndarray): The genome of the second parent.
+        num_offsprings (int): The number of offspring to breed.
+        seed (int): The seed of the random number generator of the slot.
+        mutation_rate (float): The rate of mutation operation, ranging from 0.0 to 1.0.
+        incremental_fitness (bool): Whether offspring close to a parent are scored as deltas from that parent.
+
+    Returns:
+        tuple[np.ndarray, float, tuple[int, int, int]]: The genome and fitness of the picked offspring, and the genome hits,
+        delta scores and misses the worker's fitness cache counted for the slot.
+    """
+    fitness_cache: FitnessCache = worker_fitness_cache
+    counters: tuple[int, int, int] = (fitness_cache.hits, fitness_cache.delta_scores, fitness_cache.misses)
+    parent_individual_1: Individual = Individual(worker_problem, parent_genome_1, fitness_cache=fitness_cache)
+    parent_individual_2: Individual = Individual(worker_problem, parent_genome_2, fitness_cache=fitness_cache)
+    offspring: Individual = breed_offspring(parent_individual_1, parent_individual_2, num_offsprings, np.random.default_rng(seed), mutation_rate, incremental_fitness, fitness_cache)
+    return offspring.genome, offspring.compute_fitness(), (fitness_cache.hits - counters[0], fitness_cache.delta_scores - counters[1], fitness_cache.misses - counters[2])
+
+class ProcessOffspringExecutor:
+    """
+    Breeds and scores the offspring of every replaced slot of a generation in a pool of worker processes.
+    """
+    def __init__(self, problem: SchedulingProblem, num_of_workers: int) -> None:
+        """
+        Starts the worker processes and sends them the problem.
+
+        Args:
+            problem (SchedulingProblem): The scheduling problem of the run.
+            num_of_workers (int): The number of worker processes.
+
+        Returns:
+            None
+        """
+        self.problem: SchedulingProblem = problem
+        self.num_of_workers: int = num_of_workers
+        self.executor: ProcessPoolExecutor = ProcessPoolExecutor(max_workers=num_of_workers, mp_context=multiprocessing.get_context("spawn"), initializer=initialize_worker, initargs=(problem,))
+
+    def breed(self, parents: list[tuple[Individual, Individual]], num_offsprings: list[int], seeds: list[int], mutation_rate: float, incremental_fitness: bool, fitness_cache: FitnessCache) -> list[Individual]:
+        """
+        Breeds the offspring of several slots in parallel.
+
+        Args:
+            parents (list[tuple[Individual, Individual]]): The two parents of each slot.
+            num_offsprings (list[int]): The number of offspring to breed for each slot.
+            seeds (list[int]): The seed of the random number generator of each slot.
+            mutation_rate (float): The rate of mutation operation, ranging from 0.0 to 1.0.
+            incremental_fitness (bool): Whether offspring close to a parent are scored as deltas from that parent.
+            fitness_cache (FitnessCache): The cache of the run, which is credited with the scores computed by the workers.
+
+        Returns:
+            list[Individual]: The scored offspring picked for each slot.
+        """
+        chunksize: int = max(1, len(seeds) // (4 * self.num_of_workers))
+        results = self.executor.map(
+            breed_in_worker,
+            [parent_individual_1.genome for parent_individual_1, _ in parents],
+            [parent_individual_2.genome for _, parent_individual_2 in parents],
+            num_offsprings,
+            seeds,
+            [mutation_rate] * len(seeds),
+            [incremental_fitness] * len(seeds),
+            chunksize=chunksize,
+        )
+        offsprings: list[Individual] = list()
+        for genome, fitness, (hits, delta_scores, misses) in results:
+            fitness_cache.hits += hits
+            fitness_cache.delta_scores += delta_scores
+            fitness_cache.misses += misses
+            offspring: Individual = Individual(self.problem, genome, fitness_cache=fitness_cache)
+            offspring.assign_fitness(fitness)
+            offsprings.append(offspring)
+        return offsprings
+
+    def close(self) -> None:
+        """
+        Stops the worker processes.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ProcessOffspringExecutor":
+        """
+        Uses the executor as a context manager that stops its workers on exit.
+
+        Returns:
+            ProcessOffspringExecutor: The executor itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Stops the worker processes.
+
+        Returns:
+            None
+        """
+        self.close()
@@ -0,0 +1,371 @@
+import io
+import os
+import csv
+import hashlib
+import tempfile
+from typing import Any
+from dataclasses import asdict, astuple, dataclass, fields
+from datetime import date, timedelta
+from matplotlib.axes import Axes
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+from .proposal import Proposal
+
+DAYS_OF_WEEK: list[str] = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+COLORS: list[str] = ['gray', 'yellow', 'blue', 'red', 'green', 'brown', 'pink',
+                     'lightgreen', 'lightblue', 'wheat', 'salmon', 'lightcoral', 'lightyellow']
+FIGSIZE: tuple[int, int] = (12, 8)
+DPI: int = 200
+OVERVIEW_COLUMNS: int = 4
+OVERVIEW_WEEK_FIGSIZE: tuple[float, float] = (4, 3)
+OVERVIEW_DPI: int = 100
+OVERVIEW_TITLE_HOURS: int = 4  # The height of the title of a week in the overview, in hours of the grid
+RENDER_VERSION: int = 3  # Bumped whenever the drawing changes, so plots drawn before are not reused
+
+@dataclass(frozen=True)
+class WeekPlot:
+    """
+    Everything needed to draw the plot of one week of a timetable, so weeks can be drawn independently, in other processes.
+
+    Attributes:
+        week_num (int): The number of the week in the timetable, from 0.
+        week_start_date (date): The first date of the week.
+        entries (list[tuple[int, Proposal]]): The index of each proposal scheduled in the week in the timetable, with the proposal.
+        total_proposals (int): The number of proposals of the timetable, which the week plot does not show.
+        total_scheduled_proposals (int): The number of scheduled proposals of the timetable, which the week plot does not show.
+        path (str): The path of the PNG file to write.
+    """
+    week_num: int
+    week_start_date: date
+    entries: list[tuple[int, Proposal]]
+    total_proposals: int
+    total_scheduled_proposals: int
+    path: str
+
+    @property
+    def week_end_date(self) -> date:
+        """
+        The last date of the week.
+
+        Returns:
+            date: The date six days after the first date of the week.
+        """
+        return self.week_start_date + timedelta(days=6)
+
+    def content_key(self) -> str:
+        """
+        Hashes everything the plot shows and the options it is drawn with: the dates of the week and its own blocks. Identical
+        weeks share a key whatever their file name, and an edit of another week of the timetable leaves the key unchanged.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest of the plot.
+        """
+        content: tuple = (
+            RENDER_VERSION, FIGSIZE, DPI, self.week_start_date.isoformat(),
+            tuple(astuple(block) for block in plot_blocks(self)),
+        )
+        return hashlib.sha256(repr(content).encode()).hexdigest()
+
+@dataclass(frozen=True)
+class PlotBlock:
+    """
+    A colored block of a week plot: one proposal on one day of the week.
+
+    Attributes:
+        index (int): The index of the proposal in the timetable.
+        day_index (int): The column of the day in the week grid.
+        start_time (float): The hour the block starts at.
+        end_time (float): The hour the block ends at, 24 for the first part of an overnight observation.
+        color (str): The color of the block.
+        label (str): The legend entry of the proposal.
+    """
+    index: int
+    day_index: int
+    start_time: float
+    end_time: float
+    color: str
+    label: str
+
+CSV_COLUMNS: list[str] = ["week_num", "week_start_date", *(field.name for field in fields(PlotBlock))]
+
+def overview_key(week_plots: list[WeekPlot]) -> str:
+    """
+    Hashes the weeks of an overview, the counts of its title and the options it is drawn with, so identical timetables share
+    an overview.
+
+    Args:
+        week_plots (list[WeekPlot]): The weeks of the overview, in order.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest of the overview.
+    """
+    totals: tuple = (week_plots[0].total_proposals, week_plots[0].total_scheduled_proposals) if week_plots else ()
+    content: tuple = ("overview", totals, OVERVIEW_COLUMNS, OVERVIEW_WEEK_FIGSIZE, OVERVIEW_DPI, tuple(week_plot.content_key() for week_plot in week_plots))
+    return hashlib.sha256(repr(content).encode()).hexdigest()
+
+def plan_week_plots(start_date: date, end_date: date, schedules: list[Proposal], filename_suffix: str = '', directory: str = 'outputs') -> list[WeekPlot]:
+    """
+    Splits a timetable into the plots of its weeks, one for each week between the START_DATE and END_DATE.
+
+    Args:
+        start_date (date): The first date of the timetable.
+        end_date (date): The last date of the timetable.
+        schedules (list[Proposal]): The proposals of the timetable, carrying their scheduled start datetimes.
+        filename_suffix (str, optional): A suffix added to the file name of every plot. Defaults to ''.
+        directory (str, optional): The directory the plots are written to. Defaults to 'outputs'.
+
+    Returns:
+        list[WeekPlot]: The plot of each week, in order.
+    """
+    num_weeks: int = (end_date - start_date).days // 7 + 1
+    total_scheduled_proposals: int = sum(1 for schedule in schedules if schedule.scheduled_start_datetime is not None)
+    week_plots: list[WeekPlot] = list()
+    for week_num in range(num_weeks):
+        week_start_date: date = start_date + timedelta(days=week_num * 7)
+        week_end_date: date = week_start_date + timedelta(days=6)
+        entries: list[tuple[int, Proposal]] = [
+            (idx, proposal) for idx, proposal in enumerate(schedules)
+            if proposal.scheduled_start_datetime is not None and week_start_date <= proposal.scheduled_start_datetime.date() <= week_end_date
+        ]
+        path: str = os.path.join(directory, f"week_{week_start_date.strftime('%Y-%m-%d')}_{week_end_date.strftime('%Y-%m-%d')}{filename_suffix}.png")
+        week_plots.append(WeekPlot(week_num, week_start_date, entries, len(schedules), total_scheduled_proposals, path))
+    return week_plots
+
+def legend_label(idx: int, proposal: Proposal) -> str:
+    """
+    The legend entry of a proposal in a week plot.
+
+    Args:
+        idx (int): The index of the proposal in the timetable.
+        proposal (Proposal): The proposal.
+
+    Returns:
+        str: The index, the owner and the LST window and constraints of the proposal.
+    """
+    return f'{idx} {proposal.owner_email.split("@")[0].split(".")[0]} {proposal.lst_start_time.strftime("%H:%M:%S")} {proposal.lst_start_end_time.strftime("%H:%M:%S")} {proposal.night_obs} {proposal.avoid_sunrise_sunset}'
+
+def plot_blocks(week_plot: WeekPlot) -> list[PlotBlock]:
+    """
+    Lays out the blocks of a week plot. An overnight observation is split at midnight into a block ending at 24 on its first
+    day and a block starting at 0 on the next day, which is dropped if the next day is beyond the week.
+
+    Args:
+        week_plot (WeekPlot): The week.
+
+    Returns:
+        list[PlotBlock]: The blocks of the week, in the order of the proposals.
+    """
+    blocks: list[PlotBlock] = list()
+    for idx, proposal in week_plot.entries:
+        end_datetime = proposal.scheduled_start_datetime + timedelta(seconds=proposal.simulated_duration)
+
+        # Calculate the day of the week and time for plotting
+        day_index = proposal.scheduled_start_datetime.weekday()  # Monday is 0 and Sunday is 6
+        start_time = proposal.scheduled_start_datetime.hour + proposal.scheduled_start_datetime.minute / 60.0
+        end_time = end_datetime.hour + end_datetime.minute / 60.0
+        color = COLORS[idx % len(COLORS)]
+        label = legend_label(idx, proposal)
+
+        # Handle overnight events
+        if (end_time - start_time) < 0:
+            blocks.append(PlotBlock(idx, day_index, start_time, 24, color, label))
+            if day_index + 1 < 7:
+                blocks.append(PlotBlock(idx, day_index + 1, 0, end_time, color, label))
+        else:
+            blocks.append(PlotBlock(idx, day_index, start_time, end_time, color, label))
+    return blocks
+
+def block_rectangles(blocks: list[PlotBlock], x: float = 0, y: float = 0) -> list[list[tuple[float, float]]]:
+    """
+    The corners of the rectangles of blocks on a week grid, optionally shifted to place the week on a larger grid.
+
+    Args:
+        blocks (list[PlotBlock]): The blocks of the week.
+        x (float, optional): The shift of the days. Defaults to 0.
+        y (float, optional): The shift of the hours. Defaults to 0.
+
+    Returns:
+        list[list[tuple[float, float]]]: The four corners of each rectangle.
+    """
+    return [
+        [(x + block.day_index - 0.5, y + block.start_time), (x + block.day_index + 0.5, y + block.start_time),
+         (x + block.day_index + 0.5, y + block.end_time), (x + block.day_index - 0.5, y + block.end_time)]
+        for block in blocks
+    ]
+
+def draw_blocks(ax: Axes, blocks: list[PlotBlock]) -> None:
+    """
+    Draws blocks on a week grid as a single collection of rectangles with a black border and 25% opacity, with the index of
+    the proposal inside each block.
+
+    Args:
+        ax (Axes): The axes of the week.
+        blocks (list[PlotBlock]): The blocks of the week.
+
+    Returns:
+        None
+    """
+    ax.add_collection(PolyCollection(block_rectangles(blocks), facecolors=[block.color for block in blocks], edgecolors='black', linewidths=0.5, alpha=0.25))
+    for block in blocks:
+        ax.text(block.day_index, (block.start_time + block.end_time) / 2, str(block.index),
+                ha='center', va='center', fontsize=10, color='black')
+    ax.set_xlim(-0.5, len(DAYS_OF_WEEK) - 0.5)
+    ax.set_ylim(0, 24)
+
+def save_figure(fig: Figure, path: str, dpi: int) -> str:
+    """
+    Writes a figure to a PNG file atomically, through a temporary file next to it, so a reader never sees a partial plot.
+
+    Args:
+        fig (Figure): The figure.
+        path (str): The path of the PNG file.
+        dpi (int): The resolution of the image.
+
+    Returns:
+        str: The path of the PNG file written.
+    """
+    directory: str = os.path.dirname(path) or "."
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".week-", suffix=".png")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            fig.savefig(file, format="png", dpi=dpi)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+    return path
+
+def render_week(week_plot: WeekPlot) -> str:
+    """
+    Draws the plot of a week, with the proposals represented as colored blocks on a grid of days and times and a legend to
+    identify each proposal. The file is written atomically, so a reader never sees a partial plot.
+
+    Args:
+        week_plot (WeekPlot): The week to draw.
+
+    Returns:
+        str: The path of the PNG file written.
+    """
+    # A figure outside pyplot needs no global state, so it is freed with its last reference
+    fig = Figure(figsize=FIGSIZE, layout='tight')
+    ax = fig.add_subplot()
+    blocks: list[PlotBlock] = plot_blocks(week_plot)
+    draw_blocks(ax, blocks)
+
+    # Dictionary to hold color legend
+    legend_dict = {block.label: block.color for block in blocks}
+
+    # Set the x-axis and y-axis labels
+    ax.set_xticks(range(len(DAYS_OF_WEEK)))
+    ax.set_xticklabels(DAYS_OF_WEEK)
+    ax.set_xlabel('Days of the Week')
+    ax.set_ylabel('Time (hours)')
+
+    # Update the title to include scheduled proposals count
+    # Only what the week holds is shown, so the plot does not change when another week of the timetable does
+    ax.set_title(f'Weekly Timetable: {len(week_plot.entries)} Proposals ({week_plot.week_start_date.isoformat()} to {week_plot.week_end_date.isoformat()})', fontsize=16)
+
+    # Add gridlines for better readability
+    ax.yaxis.grid(True)
+
+    # Create a legend outside the plot
+    handles = [Rectangle((0, 0), 1, 1, color=color) for color in legend_dict.values()]
+    ax.legend(handles, legend_dict.keys(), title="Proposals", loc='upper left', bbox_to_anchor=(1, 1))
+    return save_figure(fig, week_plot.path, DPI)
+
+def render_weeks(week_plots: list[WeekPlot], path: str, columns: int = OVERVIEW_COLUMNS) -> str:
+    """
+    Draws every week of a timetable into a single figure for an overview of the whole timetable. The weeks are laid out as
+    a grid of week grids on one set of axes, so the blocks of all weeks are drawn as one collection rather than one plot
+    per week. The proposals are identified by their indices only; the legend of each week is in its own plot and in the
+    block model.
+
+    Args:
+        week_plots (list[WeekPlot]): The weeks to draw, in order.
+        path (str): The path of the PNG file to write.
+        columns (int, optional): The number of weeks drawn side by side. Defaults to OVERVIEW_COLUMNS.
+
+    Returns:
+        str: The path of the PNG file written.
+    """
+    num_of_days: int = len(DAYS_OF_WEEK)
+    columns = max(1, min(columns, len(week_plots)))
+    rows: int = max(1, -(-len(week_plots) // columns))
+    fig = Figure(figsize=(OVERVIEW_WEEK_FIGSIZE[0] * columns, OVERVIEW_WEEK_FIGSIZE[1] * rows + 0.5))
+    ax = fig.add_axes((0.01, 0.01, 0.98, 1 - 0.6 / fig.get_figheight()))
+    ax.set_axis_off()
+
+    # Each week takes a cell of the grid, with a day of space between columns and room for its title between rows
+    cell_width: int = num_of_days + 1
+    cell_height: int = 24 + OVERVIEW_TITLE_HOURS
+    frames: list[list[tuple[float, float]]] = list()
+    rectangles: list[list[tuple[float, float]]] = list()
+    colors: list[str] = list()
+    for week_plot in week_plots:
+        x: float = (week_plot.week_num % columns) * cell_width
+        y: float = (week_plot.week_num // columns) * cell_height
+        blocks: list[PlotBlock] = plot_blocks(week_plot)
+        frames.append([(x - 0.5, y), (x + num_of_days - 0.5, y), (x + num_of_days - 0.5, y + 24), (x - 0.5, y + 24)])
+        rectangles.extend(block_rectangles(blocks, x, y))
+        colors.extend(block.color for block in blocks)
+        for block in blocks:
+            ax.text(x + block.day_index, y + (block.start_time + block.end_time) / 2, str(block.index),
+                    ha='center', va='center', fontsize=5, color='black')
+        ax.text(x + (num_of_days - 1) / 2, y - OVERVIEW_TITLE_HOURS / 2,
+                f'Week {week_plot.week_num + 1}: {week_plot.week_start_date.isoformat()} ({len(week_plot.entries)})',
+                ha='center', va='center', fontsize=8)
+    ax.add_collection(PolyCollection(frames, facecolors='none', edgecolors='black', linewidths=0.5))
+    ax.add_collection(PolyCollection(rectangles, facecolors=colors, edgecolors='black', linewidths=0.3, alpha=0.25))
+
+    # Hours grow downwards, like the days of a calendar
+    ax.set_xlim(-1, columns * cell_width - 1)
+    ax.set_ylim(rows * cell_height - OVERVIEW_TITLE_HOURS, -OVERVIEW_TITLE_HOURS)
+    if week_plots:
+        fig.suptitle(f'Timetable: {week_plots[0].total_scheduled_proposals} of {week_plots[0].total_proposals} Proposals over {len(week_plots)} Weeks', y=1 - 0.1 / fig.get_figheight())
+    return save_figure(fig, path, OVERVIEW_DPI)
+
+def render_model(week_plots: list[WeekPlot]) -> dict[str, Any]:
+    """
+    Describes the blocks of every week of a timetable as plain data, so a client can draw the timetable itself.
+
+    Args:
+        week_plots (list[WeekPlot]): The weeks, in order.
+
+    Returns:
+        dict[str, Any]: The days of the week and, for each week, its dates, counts and blocks, JSON serializable.
+    """
+    return {
+        "days_of_week": DAYS_OF_WEEK,
+        "weeks": [
+            {
+                "week_num": week_plot.week_num,
+                "week_start_date": week_plot.week_start_date.isoformat(),
+                "week_end_date": week_plot.week_end_date.isoformat(),
+                "num_of_proposals": len(week_plot.entries),
+                "total_scheduled_proposals": week_plot.total_scheduled_proposals,
+                "total_proposals": week_plot.total_proposals,
+                "blocks": [asdict(block) for block in plot_blocks(week_plot)],
+            }
+            for week_plot in week_plots
+        ],
+    }
+
+def render_model_csv(week_plots: list[WeekPlot]) -> str:
+    """
+    Describes the blocks of every week of a timetable as CSV, one row per block.
+
+    Args:
+        week_plots (list[WeekPlot]): The weeks, in order.
+
+    Returns:
+        str: The CSV text, with a header row.
+    """
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(CSV_COLUMNS)
+    for week_plot in week_plots:
+        for block in plot_blocks(week_plot):
+            writer.writerow([week_plot.week_num, week_plot.week_start_date.isoformat(), *astuple(block)])
+    return output.getvalue()
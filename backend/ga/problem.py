@@ -0,0 +1,179 @@
+import copy
+import numpy as np
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from .proposal import Proposal
+from .ephemeris import EphemerisTable
+from .feasibility import FeasibleStarts, build_feasible_starts
+
+# Genome value of a proposal that has no scheduled start datetime
+UNSCHEDULED: int = int(np.iinfo(np.int64).min)
+
+def read_only(array: np.ndarray) -> np.ndarray:
+    """
+    Marks a NumPy array as read-only so it can be shared safely between Individuals.
+
+    Args:
+        array (np.ndarray): The array to protect.
+
+    Returns:
+        np.ndarray: The same array with its writeable flag cleared.
+    """
+    array.setflags(write=False)
+    return array
+
+@dataclass(frozen=True, eq=False)
+class SchedulingProblem:
+    """
+    An immutable description of a scheduling request, built once and shared by the Genetic Algorithm, its Individuals and Timetables.
+
+    Attributes:
+        start_date (date): The first date of the timetable.
+        end_date (date): The last date of the timetable.
+        proposals (tuple[Proposal, ...]): The proposals to be scheduled, without any scheduled start datetime.
+        start_datetime (datetime): Midnight of START_DATE, the origin of all schedule offsets.
+        ids (np.ndarray): The read-only int64 id of each proposal, indexed by proposal position.
+        durations (np.ndarray): The read-only int64 simulated duration of each proposal in seconds, indexed by proposal position.
+        total_duration (int): The sum of all proposal durations in seconds.
+        duplicate_id_groups (tuple[np.ndarray, ...]): The positions of proposals sharing an id, which never clash with each other.
+        unscheduled_penalties (np.ndarray): The fitness multiplier 0.95 ** k for k unscheduled proposals, for k from 0 to the number of proposals.
+        ephemeris (EphemerisTable): The ephemeris of every date of the problem, used by all constraint checks. Its LST cache
+            and counters change with every lookup and are local to each process, so they are not part of the problem's
+            identity: the table is left out of comparisons and repr, and a pickled problem carries it without them.
+        feasible_starts (tuple[FeasibleStarts, ...]): The start offsets at which each proposal meets all of its constraints, indexed by proposal position.
+    """
+    start_date: date
+    end_date: date
+    proposals: tuple[Proposal, ...]
+    start_datetime: datetime = field(init=False)
+    ids: np.ndarray = field(init=False)
+    durations: np.ndarray = field(init=False)
+    total_duration: int = field(init=False)
+    duplicate_id_groups: tuple[np.ndarray, ...] = field(init=False)
+    unscheduled_penalties: np.ndarray = field(init=False)
+    ephemeris: EphemerisTable = field(init=False, repr=False, compare=False)
+    feasible_starts: tuple[FeasibleStarts, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """
+        Detaches the proposals from the caller and precomputes the constraint data shared by every Individual.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        proposals: list[Proposal] = list()
+        for proposal in self.proposals:
+            template: Proposal = copy.copy(proposal)
+            template.scheduled_start_datetime = None
+            proposals.append(template)
+
+        # The dataclass is frozen, so derived fields are set through object.__setattr__
+        object.__setattr__(self, "proposals", tuple(proposals))
+        object.__setattr__(self, "start_datetime", datetime.combine(self.start_date, time(0, 0, 0)))
+        object.__setattr__(self, "ids", read_only(np.array([proposal.id for proposal in proposals], dtype=np.int64)))
+        object.__setattr__(self, "durations", read_only(np.array([proposal.simulated_duration for proposal in proposals], dtype=np.int64)))
+        object.__setattr__(self, "total_duration", int(self.durations.sum()))
+
+        unique_ids, inverse, counts = np.unique(self.ids, return_inverse=True, return_counts=True)
+        duplicate_id_groups = tuple(read_only(np.flatnonzero(inverse == index)) for index in np.flatnonzero(counts > 1))
+        object.__setattr__(self, "duplicate_id_groups", duplicate_id_groups)
+        # Python's float power, so batch and single evaluations agree to the last bit
+        object.__setattr__(self, "unscheduled_penalties", read_only(np.array([0.95 ** k for k in range(len(proposals) + 1)], dtype=np.float64)))
+        object.__setattr__(self, "ephemeris", EphemerisTable(self.start_date, self.end_date))
+        object.__setattr__(self, "feasible_starts", build_feasible_starts(self.start_date, self.end_date, self.proposals, self.ephemeris))
+
+    @property
+    def num_of_days(self) -> int:
+        """
+        The number of days covered by the problem, including both START_DATE and END_DATE.
+
+        Returns:
+            int: The number of days between START_DATE and END_DATE inclusive.
+        """
+        return (self.end_date - self.start_date).days + 1
+
+    @property
+    def num_of_proposals(self) -> int:
+        """
+        The number of proposals, which is also the length of every genome.
+
+        Returns:
+            int: The number of proposals in the problem.
+        """
+        return len(self.proposals)
+
+    def to_offset(self, start_datetime: datetime | None) -> int:
+        """
+        Converts a scheduled start datetime into a genome value.
+
+        Args:
+            start_datetime (datetime | None): The scheduled start datetime, or None if the proposal is unscheduled.
+
+        Returns:
+            int: The number of seconds from START_DATE, or UNSCHEDULED.
+        """
+        if start_datetime is None:
+            return UNSCHEDULED
+        return int((start_datetime - self.start_datetime).total_seconds())
+
+    def to_datetime(self, offset: int) -> datetime | None:
+        """
+        Converts a genome value back into a scheduled start datetime.
+
+        Args:
+            offset (int): The number of seconds from START_DATE, or UNSCHEDULED.
+
+        Returns:
+            datetime | None: The scheduled start datetime, or None if the proposal is unscheduled.
+        """
+        if offset == UNSCHEDULED:
+            return None
+        return self.start_datetime + timedelta(seconds=int(offset))
+
+    def encode(self, schedules: list[Proposal]) -> np.ndarray:
+        """
+        Encodes a list of scheduled proposals, ordered like the problem's proposals, into a genome.
+
+        Args:
+            schedules (list[Proposal]): The scheduled proposals, one per proposal of the problem.
+
+        Returns:
+            np.ndarray: The int64 genome of start offsets.
+        """
+        return np.array([self.to_offset(proposal.scheduled_start_datetime) for proposal in schedules], dtype=np.int64)
+
+    def decode(self, genome: np.ndarray, positions: np.ndarray | None = None) -> list[Proposal]:
+        """
+        Decodes a genome into Proposal objects carrying their scheduled start datetimes.
+
+        Args:
+            genome (np.ndarray): The int64 genome of start offsets.
+            positions (np.ndarray | None, optional): The proposal positions to decode. Defaults to every position.
+
+        Returns:
+            list[Proposal]: Copies of the problem's proposals with their scheduled_start_datetime set.
+        """
+        if positions is None:
+            positions = np.arange(len(self.proposals))
+        schedules: list[Proposal] = list()
+        for position in positions:
+            proposal: Proposal = copy.copy(self.proposals[position])
+            proposal.scheduled_start_datetime = self.to_datetime(int(genome[position]))
+            schedules.append(proposal)
+        return schedules
+
+    def constraints_met(self, position: int, offset: int) -> bool:
+        """
+        Checks whether a proposal meets all of its constraints when started at an offset, using the problem's ephemeris table.
+
+        Args:
+            position (int): The position of the proposal in the problem.
+            offset (int): The start offset in seconds from START_DATE.
+
+        Returns:
+            bool: True if all constraints are met, False otherwise.
+        """
+        return self.proposals[position].all_constraints_met(self.to_datetime(offset), self.ephemeris)
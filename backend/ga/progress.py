@@ -0,0 +1,82 @@
+import time
+from enum import Enum
+from dataclasses import dataclass
+from typing import Callable
+
+class StopReason(str, Enum):
+    """
+    The policy that ended a Genetic Algorithm run.
+    """
+    NUM_OF_GENERATIONS = "num_of_generations"
+    STAGNATION = "stagnation"
+    TARGET_FITNESS = "target_fitness"
+    TIME_BUDGET = "time_budget"
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """
+    The state of a Genetic Algorithm run after a generation has been ranked.
+
+    Attributes:
+        generation (int): The number of completed generations.
+        num_of_generations (int): The number of generations the run evolves for.
+        best_fitness (float): The fitness of the fittest Individual.
+        median_fitness (float): The median fitness of the population.
+        worst_fitness (float): The fitness of the least fit Individual.
+        num_scored (int): The number of Individuals scored during the generation.
+        elapsed (float): The time since the run started, in seconds.
+        stop_reason (StopReason | None): The policy that ended the run if this is its last generation, None otherwise.
+    """
+    generation: int
+    num_of_generations: int
+    best_fitness: float
+    median_fitness: float
+    worst_fitness: float
+    num_scored: int
+    elapsed: float
+    stop_reason: StopReason | None = None
+
+    def __str__(self) -> str:
+        """
+        Formats the event as a progress line.
+
+        Returns:
+            str: The generation and the best, median and worst fitness.
+        """
+        return f"Generation {self.generation}:\t{self.best_fitness:3.2f}, {self.median_fitness:3.2f}, ..., {self.worst_fitness:3.2f}\t({self.num_scored} scored, {self.elapsed:.2f}s)"
+
+class ThrottledProgress:
+    """
+    Forwards progress events to a listener at most once per interval, so a fast run does not flood it. The first and the last
+    generation of a run, including a run stopped early, are always forwarded.
+    """
+    def __init__(self, listener: Callable[[ProgressEvent], None], min_interval: float = 0.5) -> None:
+        """
+        Initializes the ThrottledProgress.
+
+        Args:
+            listener (Callable[[ProgressEvent], None]): The listener to forward events to.
+            min_interval (float, optional): The minimum time between two forwarded events, in seconds. Defaults to 0.5.
+
+        Returns:
+            None
+        """
+        self.listener: Callable[[ProgressEvent], None] = listener
+        self.min_interval: float = min_interval
+        self.last_forwarded: float | None = None
+
+    def __call__(self, event: ProgressEvent) -> None:
+        """
+        Forwards the event if the interval has passed since the last forwarded one.
+
+        Args:
+            event (ProgressEvent): The latest progress event.
+
+        Returns:
+            None
+        """
+        now: float = time.monotonic()
+        if self.last_forwarded is not None and now - self.last_forwarded < self.min_interval and event.stop_reason is None:
+            return
+        self.last_forwarded = now
+        self.listener(event)
@@ -1,5 +1,6 @@
 from datetime import datetime, date, time, timedelta
 from .utils import lst_to_utc, get_night_window, get_sunrise_sunset
+from .ephemeris import EphemerisTable
 
 class Proposal():
     """ A class representing proposals to be scheduled.
@@ -85,31 +86,34 @@ class Proposal():
 
    #----> Methods to check constraints <----#
 
-    def lst_start_end_time_constraint_met(self, proposed_start_datetime: datetime) -> bool:
+    def lst_start_end_time_constraint_met(self, proposed_start_datetime: datetime, ephemeris: EphemerisTable | None = None) -> bool:
         """
         Check if the proposed start time is within the allowed Local Sidereal Time (LST) start and end times.
 
         Args:
             proposed_start_datetime (datetime): The proposed start datetime for this proposal.
+            ephemeris (EphemerisTable | None, optional): The run's ephemeris table to read conversions from. Defaults to None, to compute them.
 
         Returns:
             bool: True if the proposed start time is within the allowed LST range, False otherwise.
         """
         # Convert LST start and end times to UTC for the proposed date
-        lst_start_time_utc = lst_to_utc(proposed_start_datetime.date(), self.lst_start_time)
-        lst_end_time_utc = lst_to_utc(proposed_start_datetime.date(), self.lst_start_end_time)
+        convert = ephemeris.lst_to_utc if ephemeris is not None else lst_to_utc
+        lst_start_time_utc = convert(proposed_start_datetime.date(), self.lst_start_time)
+        lst_end_time_utc = convert(proposed_start_datetime.date(), self.lst_start_end_time)
         
         # Check if the proposed start datetime is within the allowed LST range
         is_within_lst_range = lst_start_time_utc <= proposed_start_datetime <= lst_end_time_utc
         
         return is_within_lst_range
 
-    def night_obs_constraint_met(self, proposed_start_datetime: datetime) -> bool:
+    def night_obs_constraint_met(self, proposed_start_datetime: datetime, ephemeris: EphemerisTable | None = None) -> bool:
         """
         Check if the proposed start datetime meets the night observation constraints.
 
         Args:
             proposed_start_datetime (datetime): The proposed start datetime for this proposal.
+            ephemeris (EphemerisTable | None, optional): The run's ephemeris table to read the night window from. Defaults to None, to compute it.
 
         Returns:
             bool: True if the night observation constraints are met, False otherwise.
@@ -119,7 +123,8 @@ class Proposal():
             proposed_end_datetime = proposed_start_datetime + timedelta(seconds=self.simulated_duration)
             
             # Get the night window for the proposed date
-            night_start_datetime, night_end_datetime = get_night_window(proposed_start_datetime.date())
+            night_window = ephemeris.night_window if ephemeris is not None else get_night_window
+            night_start_datetime, night_end_datetime = night_window(proposed_start_datetime.date())
 
             # Check if both the start and end datetimes fall within the night window
             is_start_within_night = night_start_datetime <= proposed_start_datetime <= night_end_datetime
@@ -129,19 +134,23 @@ class Proposal():
 
         return True  # If night observations are not required, the constraint is considered met
 
-    def avoid_sunrise_sunset_constraint_met(self, proposed_start_datetime: datetime) -> bool:
+    def avoid_sunrise_sunset_constraint_met(self, proposed_start_datetime: datetime, ephemeris: EphemerisTable | None = None) -> bool:
         """
         Check if the proposed datetime avoids sunrise and sunset constraints.
 
         Args:
             proposed_start_datetime (datetime): The proposed start datetime for this proposal.
+            ephemeris (EphemerisTable | None, optional): The run's ephemeris table to read sunrise and sunset from. Defaults to None, to compute them.
 
         Returns:
             bool: True if the sunrise and sunset constraints are met, False otherwise.
         """
         if self.avoid_sunrise_sunset:
             # Get sunrise and sunset datetimes for the proposed date
-            sunrise_datetime, sunset_datetime = get_sunrise_sunset(date=proposed_start_datetime.date())
+            if ephemeris is not None:
+                sunrise_datetime, sunset_datetime = ephemeris.sunrise_sunset(proposed_start_datetime.date())
+            else:
+                sunrise_datetime, sunset_datetime = get_sunrise_sunset(date=proposed_start_datetime.date())
 
             # Compute the end datetime based on the proposal's duration
             proposed_end_datetime = proposed_start_datetime + timedelta(minutes=self.simulated_duration)
@@ -155,20 +164,21 @@ class Proposal():
 
         return True
     
-    def all_constraints_met(self, proposed_start_datetime: datetime) -> bool:
+    def all_constraints_met(self, proposed_start_datetime: datetime, ephemeris: EphemerisTable | None = None) -> bool:
         """
         Check if the given proposed_start_datetime satisfies all constraints for this proposal.
 
         Args:
             proposed_start_datetime (datetime): The proposed start datetime for this proposal.
+            ephemeris (EphemerisTable | None, optional): The run's ephemeris table to read from. Defaults to None, to compute every ephemeris.
 
         Returns:
             bool: True if all constraints are met, False otherwise.
         """
         # Check each constraint and store the results
-        is_time_constraint_met = self.lst_start_end_time_constraint_met(proposed_start_datetime)
-        is_night_obs_constraint_met = self.night_obs_constraint_met(proposed_start_datetime)
-        is_avoid_sunrise_sunset_constraint_met = self.avoid_sunrise_sunset_constraint_met(proposed_start_datetime)
+        is_time_constraint_met = self.lst_start_end_time_constraint_met(proposed_start_datetime, ephemeris)
+        is_night_obs_constraint_met = self.night_obs_constraint_met(proposed_start_datetime, ephemeris)
+        is_avoid_sunrise_sunset_constraint_met = self.avoid_sunrise_sunset_constraint_met(proposed_start_datetime, ephemeris)
         # Return True only if all constraints are satisfied
         return (is_time_constraint_met and
                 is_night_obs_constraint_met and
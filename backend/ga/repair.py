@@ -0,0 +1,139 @@
+import time
+import bisect
+import numpy as np
+from .individual import Individual
+from .problem import SchedulingProblem, UNSCHEDULED
+
+NO_END: int = 2 ** 62  # The end of the gap after the last occupied interval, far beyond any offset of a timetable
+MAX_GAPS: int = 64  # The free gaps searched on each side of a clashing proposal before it is unscheduled
+
+class RepairOperator:
+    """
+    Removes the clashes of an Individual during evolution: its scheduled proposals are swept in order of their start offsets
+    into an index of occupied time, and a proposal overlapping the occupied time is shifted to the nearest free feasible
+    start, or unscheduled if there is none nearby. Proposals sharing an id are treated like any others, so they may be
+    shifted apart although they never clash.
+    """
+    def __init__(self, problem: SchedulingProblem, max_gaps: int = MAX_GAPS) -> None:
+        """
+        Initializes the RepairOperator and its counters.
+
+        Args:
+            problem (SchedulingProblem): The scheduling problem of the Individuals to repair.
+            max_gaps (int, optional): The free gaps searched on each side of a clashing proposal. Defaults to MAX_GAPS.
+
+        Returns:
+            None
+        """
+        self.problem: SchedulingProblem = problem
+        self.max_gaps: int = max_gaps
+        self.durations: list[int] = problem.durations.tolist()
+        self.lowers: list[list[int]] = [feasible_starts.lowers.tolist() for feasible_starts in problem.feasible_starts]
+        self.uppers: list[list[int]] = [feasible_starts.uppers.tolist() for feasible_starts in problem.feasible_starts]
+        self.num_of_repairs: int = 0  # Individuals repaired
+        self.num_shifted: int = 0  # Proposals moved to a free start
+        self.num_unscheduled: int = 0  # Proposals unscheduled for lack of a free start
+        self.elapsed: float = 0.0  # Seconds spent repairing
+
+    def nearest_feasible_start(self, position: int, offset: int, lower: int, upper: int) -> int | None:
+        """
+        Finds the feasible start of a proposal closest to an offset within a window.
+
+        Args:
+            position (int): The position of the proposal in the problem.
+            offset (int): The start offset to stay close to.
+            lower (int): The earliest start offset of the window.
+            upper (int): The latest start offset of the window.
+
+        Returns:
+            int | None: The feasible start offset, or None if the window holds none.
+        """
+        lowers: list[int] = self.lowers[position]
+        uppers: list[int] = self.uppers[position]
+        target: int = min(max(offset, lower), upper)
+        index: int = bisect.bisect_right(lowers, target) - 1
+        if index >= 0 and target <= uppers[index]:
+            return target
+        candidates: list[int] = list()
+        if index >= 0 and uppers[index] >= lower:
+            candidates.append(uppers[index])
+        if index + 1 < len(lowers) and lowers[index + 1] <= upper:
+            candidates.append(lowers[index + 1])
+        return min(candidates, key=lambda candidate: abs(candidate - offset)) if candidates else None
+
+    def nearest_free_start(self, position: int, offset: int, starts: list[int], ends: list[int]) -> int | None:
+        """
+        Finds the feasible start of a proposal closest to an offset at which it fits into a gap of the occupied time. The
+        gaps are searched outwards from the offset, and the search stops once a gap is farther than the best start found.
+
+        Args:
+            position (int): The position of the proposal in the problem.
+            offset (int): The start offset the proposal clashes at.
+            starts (list[int]): The sorted starts of the occupied intervals.
+            ends (list[int]): The ends of the occupied intervals, in the same order.
+
+        Returns:
+            int | None: The free feasible start offset, or None if none was found.
+        """
+        duration: int = self.durations[position]
+        best: int | None = None
+        middle: int = bisect.bisect_right(starts, offset)  # The gap before the first occupied interval starting after the offset
+        leftwards: range = range(middle, max(middle - self.max_gaps, -1), -1)
+        rightwards: range = range(middle + 1, min(middle + self.max_gaps, len(starts)) + 1)
+        for gaps in (leftwards, rightwards):
+            for gap in gaps:
+                lower: int = ends[gap - 1] if gap > 0 else 0
+                upper: int = (starts[gap] if gap < len(starts) else NO_END) - duration
+                # Gaps only get farther from the offset in either direction
+                if best is not None and max(lower - offset, offset - upper, 0) >= abs(best - offset):
+                    break
+                if lower <= upper:
+                    candidate: int | None = self.nearest_feasible_start(position, offset, lower, upper)
+                    if candidate is not None and (best is None or abs(candidate - offset) < abs(best - offset)):
+                        best = candidate
+        return best
+
+    def repair(self, individual: Individual) -> None:
+        """
+        Shifts or unschedules the proposals of an Individual that clash with proposals starting before them, so none of its
+        scheduled proposals overlap.
+
+        Args:
+            individual (Individual): The Individual to repair in place.
+
+        Returns:
+            None
+        """
+        started: float = time.perf_counter()
+        genome: np.ndarray = individual.genome
+        positions: np.ndarray = np.flatnonzero(genome != UNSCHEDULED)
+        order: list[int] = positions[np.argsort(genome[positions], kind="stable")].tolist()
+        offsets: list[int] = genome[order].tolist()
+        starts: list[int] = list()  # The occupied intervals, sorted by start
+        ends: list[int] = list()
+        for position, offset in zip(order, offsets):
+            index: int = bisect.bisect_right(starts, offset)
+            if (index > 0 and ends[index - 1] > offset) or (index < len(starts) and starts[index] < offset + self.durations[position]):
+                free_start: int | None = self.nearest_free_start(position, offset, starts, ends)
+                if free_start is None:
+                    individual.set_gene(position, UNSCHEDULED)
+                    self.num_unscheduled += 1
+                    continue
+                individual.set_gene(position, free_start)
+                self.num_shifted += 1
+                offset = free_start
+                index = bisect.bisect_right(starts, offset)
+            starts.insert(index, offset)
+            ends.insert(index, offset + self.durations[position])
+        self.num_of_repairs += 1
+        self.elapsed += time.perf_counter() - started
+
+    def __str__(self) -> str:
+        """
+        Summarizes the repair counters.
+
+        Returns:
+            str: A one-line summary of the repairs and their cost.
+        """
+        mean: float = self.elapsed / self.num_of_repairs if self.num_of_repairs else 0.0
+        return f"Repair: {self.num_of_repairs} repairs, {self.num_shifted} shifted, {self.num_unscheduled} unscheduled in {self.elapsed:.3f} s ({mean * 1e6:.0f} us per repair)"
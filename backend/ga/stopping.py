@@ -0,0 +1,136 @@
+from abc import ABC, abstractmethod
+from .progress import ProgressEvent, StopReason
+
+class StopPolicy(ABC):
+    """
+    Decides after every generation whether a run should stop before its last generation.
+    """
+    reason: StopReason
+
+    @abstractmethod
+    def should_stop(self, event: ProgressEvent) -> bool:
+        """
+        Checks the state of the run after a generation.
+
+        Args:
+            event (ProgressEvent): The state of the run after the latest generation.
+
+        Returns:
+            bool: True if the run should stop, False otherwise.
+        """
+
+class StagnationStop(StopPolicy):
+    """
+    Stops a run once the best fitness has not improved for a number of generations.
+    """
+    reason: StopReason = StopReason.STAGNATION
+
+    def __init__(self, window: int) -> None:
+        """
+        Initializes the StagnationStop.
+
+        Args:
+            window (int): The number of generations without improvement of the best fitness after which the run stops.
+
+        Returns:
+            None
+        """
+        self.window: int = window
+        self.best_fitness: float = float("-inf")
+        self.best_generation: int = 0
+
+    def should_stop(self, event: ProgressEvent) -> bool:
+        """
+        Checks whether the best fitness improved within the window.
+
+        Args:
+            event (ProgressEvent): The state of the run after the latest generation.
+
+        Returns:
+            bool: True if the run should stop, False otherwise.
+        """
+        if event.best_fitness > self.best_fitness:
+            self.best_fitness = event.best_fitness
+            self.best_generation = event.generation
+        return event.generation - self.best_generation >= self.window
+
+class TargetFitnessStop(StopPolicy):
+    """
+    Stops a run once the best fitness reaches a target, such as 1.0 for a clash-free and fully scheduled timetable.
+    """
+    reason: StopReason = StopReason.TARGET_FITNESS
+
+    def __init__(self, target_fitness: float) -> None:
+        """
+        Initializes the TargetFitnessStop.
+
+        Args:
+            target_fitness (float): The best fitness at which the run stops, ranging from 0.0 to 1.0.
+
+        Returns:
+            None
+        """
+        self.target_fitness: float = target_fitness
+
+    def should_stop(self, event: ProgressEvent) -> bool:
+        """
+        Checks whether the best fitness reached the target.
+
+        Args:
+            event (ProgressEvent): The state of the run after the latest generation.
+
+        Returns:
+            bool: True if the run should stop, False otherwise.
+        """
+        return event.best_fitness >= self.target_fitness
+
+class TimeBudgetStop(StopPolicy):
+    """
+    Stops a run once its wall-clock time exceeds a budget. The generation running when the budget runs out is completed.
+    """
+    reason: StopReason = StopReason.TIME_BUDGET
+
+    def __init__(self, time_budget: float) -> None:
+        """
+        Initializes the TimeBudgetStop.
+
+        Args:
+            time_budget (float): The wall-clock budget of the run, in seconds.
+
+        Returns:
+            None
+        """
+        self.time_budget: float = time_budget
+
+    def should_stop(self, event: ProgressEvent) -> bool:
+        """
+        Checks whether the run used up its time budget.
+
+        Args:
+            event (ProgressEvent): The state of the run after the latest generation.
+
+        Returns:
+            bool: True if the run should stop, False otherwise.
+        """
+        return event.elapsed >= self.time_budget
+
+def make_stop_policies(stagnation_window: int | None = None, target_fitness: float | None = None, time_budget: float | None = None) -> list[StopPolicy]:
+    """
+    Builds the stop policies of the given limits.
+
+    Args:
+        stagnation_window (int | None, optional): The number of generations without improvement after which to stop. Defaults to None.
+        target_fitness (float | None, optional): The best fitness at which to stop. Defaults to None.
+        time_budget (float | None, optional): The wall-clock budget of the run, in seconds. Defaults to None.
+
+    Returns:
+        list[StopPolicy]: One policy per given limit.
+    """
+    stop_policies: list[StopPolicy] = list()
+    if stagnation_window is not None:
+        stop_policies.append(StagnationStop(stagnation_window))
+    if target_fitness is not None:
+        stop_policies.append(TargetFitnessStop(target_fitness))
+    if time_budget is not None:
+        stop_policies.append(TimeBudgetStop(time_budget))
+    return stop_policies
@@ -1,10 +1,8 @@
 import math
-import json
 import random
+import numpy as np
 from datetime import datetime, date, time, timedelta
 
-GLOBAL_VARS_FILE = "tmp/global_vars.json"
-
 SECONDS_PER_DAY: int = 86400
 SIDEREAL_DAY_SECONDS: int = 86164.0905
 J2000: datetime = datetime(2000, 1, 1, 12)  # Reference epoch for JD
@@ -37,46 +35,6 @@ def degrees_string_to_float(degrees: str) -> float:
 SKA_LATITUDE: float = degrees_string_to_float(SKA_LATITUDE_STR)
 SKA_LONGITUDE: float = degrees_string_to_float(SKA_LONGITUDE_STR)
 
-def get_global_vars() -> tuple[date, date, list[dict]]:
-    """
-    Get the current values of the global variables from the JSON file.
-
-    Args:
-        None
-
-    Returns:
-        tuple[date, date, list[dict]]: The current values of START_DATE, END_DATE, and PROPOSALS.
-    """
-    try:
-        with open(GLOBAL_VARS_FILE, "r") as file:
-            data = json.load(file)
-            start_date = date.fromisoformat(data["START_DATE"])
-            end_date = date.fromisoformat(data["END_DATE"])
-            proposals = data["PROPOSALS"]
-            return start_date, end_date, proposals
-    except FileNotFoundError:
-        return date(2024, 1, 1), date(2024, 1, 22), []
-
-def update_global_vars(start_date: date = date.today(), end_date: date = date.today(),proposals: list[dict] = []) -> None:
-    """
-    Update the global variables and write them to the JSON file.
-
-    Args:
-        start_date (date): The new start date.
-        end_date (date): The new end date.
-        proposals (list[dict]): The new list of proposal data.
-
-    Returns:
-        None
-    """
-    data = {
-        "START_DATE": start_date.isoformat(),
-        "END_DATE": end_date.isoformat(),
-        "PROPOSALS": proposals
-    }
-    with open(GLOBAL_VARS_FILE, "w") as file:
-        json.dump(data, file)
-
 def parse_time(time_str: str) -> time:
     """
     Parses a time string in the format "HH:MM" and returns a datetime.time object.
@@ -132,6 +90,27 @@ def lst_to_utc(date_obj: date, lst_time: time, longitude: float = SKA_LONGITUDE)
         lst_time (time): LST as time object.
         longitude (float): Observer longitude in degrees East (default is SKA site).
 
+    Returns:
+        datetime: Approximate UTC datetime corresponding to the given LST.
+    """
+    # 1. Compute Julian Date at 0h UTC for the given date
+    jd_0h: float = julian_date(datetime.combine(date_obj, time(0, 0, 0)))
+
+    # 2. Compute GMST at 0h UTC
+    gmst0: float = gmst_at_0h_utc(jd_0h)
+
+    return lst_to_utc_from_gmst(date_obj, lst_time, gmst0, longitude)
+
+def lst_to_utc_from_gmst(date_obj: date, lst_time: time, gmst0: float, longitude: float = SKA_LONGITUDE) -> datetime:
+    """
+    Convert Local Sidereal Time (LST) to UTC datetime, given the GMST at 0h UTC of the date.
+
+    Args:
+        date_obj (date): UTC calendar date.
+        lst_time (time): LST as time object.
+        gmst0 (float): GMST at 0h UTC of the date in decimal hours, as returned by `gmst_at_0h_utc()`.
+        longitude (float): Observer longitude in degrees East (default is SKA site).
+
     Returns:
         datetime: Approximate UTC datetime corresponding to the given LST.
     """
@@ -141,23 +120,17 @@ def lst_to_utc(date_obj: date, lst_time: time, longitude: float = SKA_LONGITUDE)
     # 2. Convert observer longitude from degrees to hours
     longitude_hours: float = longitude / 15.0
 
-    # 3. Compute Julian Date at 0h UTC for the given date
-    jd_0h: float = julian_date(datetime.combine(date_obj, time(0, 0, 0)))
-
-    # 4. Compute GMST at 0h UTC
-    gmst0: float = gmst_at_0h_utc(jd_0h)
-
-    # 5. Calculate Greenwich Sidereal Time (GST) from Local Sidereal Time (LST)
+    # 3. Calculate Greenwich Sidereal Time (GST) from Local Sidereal Time (LST)
     gst: float = (lst_hours - longitude_hours) % 24
 
-    # 6. Difference between GST and GMST at 0h UTC (in sidereal hours)
+    # 4. Difference between GST and GMST at 0h UTC (in sidereal hours)
     delta_sidereal_hours: float = (gst - gmst0) % 24
 
-    # 7. Convert sidereal time to solar (UTC) time
+    # 5. Convert sidereal time to solar (UTC) time
     SIDEREAL_TO_SOLAR: float = 0.9972695663  # conversion factor
     delta_utc_hours: float = delta_sidereal_hours * SIDEREAL_TO_SOLAR
 
-    # 8. Compute the UTC datetime
+    # 6. Compute the UTC datetime
     utc_datetime: datetime = datetime.combine(date_obj, time(0, 0, 0)) + timedelta(hours=delta_utc_hours)
 
     return utc_datetime.replace(microsecond=0)
@@ -294,4 +267,168 @@ def force_range(value: float, max_value: float):
         return value + max_value
     elif value >= max_value:
         return value - max_value
-    return value
\ No newline at end of file
+    return value
+
+#----> Vectorized kernels over arrays of dates <----#
+
+MICROSECONDS_PER_HOUR: int = 3600 * 1000 * 1000
+
+def date_range_array(start_date: date, end_date: date) -> np.ndarray:
+    """
+    Builds the array of every date between start_date and end_date, both included.
+
+    Args:
+        start_date (date): The first date.
+        end_date (date): The last date.
+
+    Returns:
+        np.ndarray: The dates as a datetime64[D] array.
+    """
+    return np.arange(np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1)
+
+def hours_to_microseconds(hours: np.ndarray) -> np.ndarray:
+    """
+    Converts non-negative decimal hours to whole microseconds, rounding exactly as `timedelta(hours=...)` does.
+
+    Args:
+        hours (np.ndarray): Non-negative decimal hours.
+
+    Returns:
+        np.ndarray: The int64 number of microseconds.
+    """
+    whole_hours: np.ndarray = np.floor(hours)
+    # timedelta keeps the whole hours exact and rounds the fraction half to even
+    return whole_hours.astype(np.int64) * MICROSECONDS_PER_HOUR + np.rint((hours - whole_hours) * float(MICROSECONDS_PER_HOUR)).astype(np.int64)
+
+def julian_date_array(dates: np.ndarray) -> np.ndarray:
+    """
+    Convert dates at 0h UTC to Julian Dates, as `julian_date()` does for a single datetime.
+
+    Args:
+        dates (np.ndarray): A datetime64[D] array of dates.
+
+    Returns:
+        np.ndarray: The float64 Julian Date at 0h UTC of each date.
+    """
+    years: np.ndarray = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    months: np.ndarray = dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    days: np.ndarray = (dates - dates.astype("datetime64[M]")).astype(np.int64) + 1
+
+    a = (14 - months) // 12
+    y = years + 4800 - a
+    m = months + 12 * a - 3
+
+    jdn = days + ((153 * m + 2) // 5) + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+    day_frac = (0 - 12) / 24 + 0 / 1440 + 0 / 86400
+    return jdn + day_frac
+
+def gmst_at_0h_utc_array(jd: np.ndarray) -> np.ndarray:
+    """
+    Compute GMST at 0h UTC in decimal hours for an array of Julian Dates, as `gmst_at_0h_utc()` does.
+
+    Args:
+        jd (np.ndarray): The float64 Julian Dates at 0h UTC.
+
+    Returns:
+        np.ndarray: The float64 GMST at 0h UTC of each date in decimal hours.
+    """
+    d = jd - 2451545.0  # Days since J2000
+    gmst = 6.697374558 + 0.06570982441908 * d + 1.00273790935 * 0
+    return gmst % 24
+
+def lst_to_utc_array(dates: np.ndarray, lst_hours: np.ndarray, longitude: float = SKA_LONGITUDE) -> np.ndarray:
+    """
+    Convert Local Sidereal Times to UTC for every pair of LST and date, as `lst_to_utc()` does for a single pair.
+
+    Args:
+        dates (np.ndarray): A datetime64[D] array of D UTC calendar dates.
+        lst_hours (np.ndarray): An array of L LSTs in decimal hours, computed as hour + minute / 60 + second / 3600.
+        longitude (float): Observer longitude in degrees East (default is SKA site).
+
+    Returns:
+        np.ndarray: An (L x D) int64 matrix of the UTC times in whole seconds after midnight of each date.
+    """
+    longitude_hours: float = longitude / 15.0
+    gmst0: np.ndarray = gmst_at_0h_utc_array(julian_date_array(dates))
+
+    gst: np.ndarray = (np.asarray(lst_hours, dtype=np.float64) - longitude_hours) % 24
+    delta_sidereal_hours: np.ndarray = (gst[:, None] - gmst0[None, :]) % 24
+
+    SIDEREAL_TO_SOLAR: float = 0.9972695663  # conversion factor
+    delta_utc_hours: np.ndarray = delta_sidereal_hours * SIDEREAL_TO_SOLAR
+
+    # Microseconds are dropped, as lst_to_utc() does
+    return hours_to_microseconds(delta_utc_hours) // (1000 * 1000)
+
+def force_range_array(values: np.ndarray, max_value: float) -> np.ndarray:
+    """
+    Adjusts the values to wrap around within the range [0, max), as `force_range()` does.
+
+    Args:
+        values (np.ndarray): The values to adjust.
+        max_value (float): The exclusive upper bound of the range.
+
+    Returns:
+        np.ndarray: The adjusted values.
+    """
+    return np.where(values < 0, values + max_value, np.where(values >= max_value, values - max_value, values))
+
+def get_sunrise_sunset_array(dates: np.ndarray, latitude: float = SKA_LATITUDE, longitude: float = SKA_LONGITUDE) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate sunrise and sunset times for an array of dates, as `get_sunrise_sunset()` does for a single date.
+
+    Args:
+        dates (np.ndarray): A datetime64[D] array of dates.
+        latitude (float): The latitude of the location.
+        longitude (float): The longitude of the location.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The float64 sunrise and sunset times in seconds after midnight of each date, rounded down
+        to the minute, or NaN where the sun never rises or never sets.
+    """
+    # 1. Get the day of the year
+    N = (dates - dates.astype("datetime64[Y]")).astype(np.int64) + 1
+
+    # 2. Convert the longitude to hour value and calculate an approximate time
+    lng_hour = longitude / 15.0
+    t = np.stack((N + ((6 - lng_hour) / 24), N + ((18 - lng_hour) / 24)))  # Rows for sunrise and sunset
+
+    # 3a. Calculate the Sun's mean anomaly
+    M = (0.9856 * t) - 3.289
+
+    # 3b. Calculate the Sun's true longitude, adjusted into the range [0, 360)
+    L = force_range_array(M + (1.916 * np.sin(TO_RAD * M)) + (0.020 * np.sin(TO_RAD * 2 * M)) + 282.634, 360)
+
+    # 4a. Calculate the Sun's declination
+    sinDec = 0.39782 * np.sin(TO_RAD * L)
+    cosDec = np.cos(np.arcsin(sinDec))
+
+    # 4b. Calculate the Sun's local hour angle
+    cosH = (math.cos(TO_RAD * ZENITH) - (sinDec * math.sin(TO_RAD * latitude))) / (cosDec * math.cos(TO_RAD * latitude))
+
+    # The sun never rises or never sets
+    never: np.ndarray = (cosH[0] > 1) | (cosH[1] < -1)
+
+    # 4c. Finish calculating H and convert into hours
+    with np.errstate(invalid="ignore"):
+        H = np.stack((360 - (1 / TO_RAD) * np.arccos(cosH[0]), (1 / TO_RAD) * np.arccos(cosH[1]))) / 15
+
+    # 5a. Calculate the Sun's right ascension, adjusted into the range [0, 360)
+    RA = force_range_array((1 / TO_RAD) * np.arctan(0.91764 * np.tan(TO_RAD * L)), 360)
+
+    # 5b. Right ascension value needs to be in the same quadrant as L
+    RA += (np.floor(L / 90)) * 90 - (np.floor(RA / 90)) * 90
+
+    # 5c. Right ascension value needs to be converted into hours
+    RA /= 15
+
+    # 6. Calculate local mean time of rising/setting
+    T = H + RA - (0.06571 * t) - 6.622
+
+    # 7. Adjust back to UTC, round and impose range bounds
+    UT = force_range_array(np.round(T - lng_hour, 2), 24.0)
+
+    # Seconds are dropped, as get_sunrise_sunset() does
+    seconds: np.ndarray = (hours_to_microseconds(np.nan_to_num(UT)) // (60 * 1000 * 1000) * 60).astype(np.float64)
+    seconds[:, never] = np.nan
+    return seconds[0], seconds[1]
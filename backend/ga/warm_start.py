@@ -0,0 +1,180 @@
+import threading
+import numpy as np
+from datetime import date
+from collections import OrderedDict
+from dataclasses import dataclass
+from .problem import SchedulingProblem, UNSCHEDULED
+from .individual import Individual, generate_random_start_offset
+from .utils import SECONDS_PER_DAY
+
+@dataclass(frozen=True)
+class PopulationSnapshot:
+    """
+    The final population of a run, kept to warm-start later runs on an edited version of the same timetable.
+
+    Attributes:
+        start_date (date): The first date of the run's problem, the origin of the genome offsets.
+        proposal_ids (np.ndarray): The id of each proposal position of the genomes.
+        genomes (np.ndarray): The (individuals x proposals) int64 genomes, from the fittest to the least fit.
+    """
+    start_date: date
+    proposal_ids: np.ndarray
+    genomes: np.ndarray
+
+def take_snapshot(problem: SchedulingProblem, individuals: list[Individual]) -> PopulationSnapshot:
+    """
+    Takes a compact copy of a population, which can be sent between processes and outlives the problem.
+
+    Args:
+        problem (SchedulingProblem): The problem of the run.
+        individuals (list[Individual]): The population, from the fittest to the least fit.
+
+    Returns:
+        PopulationSnapshot: The snapshot of the population.
+    """
+    return PopulationSnapshot(problem.start_date, problem.ids.copy(), np.stack([individual.genome for individual in individuals]))
+
+def remap_genomes(snapshot: PopulationSnapshot, problem: SchedulingProblem) -> np.ndarray:
+    """
+    Translates the genomes of a previous run to the proposal positions of a new problem.
+
+    Proposals are matched by id, in order of appearance for repeated ids. Starts are shifted to the new START_DATE, and starts
+    of proposals missing from the previous run, or no longer meeting their constraints, are left UNSCHEDULED.
+
+    Args:
+        snapshot (PopulationSnapshot): The population of the previous run.
+        problem (SchedulingProblem): The problem of the new run.
+
+    Returns:
+        np.ndarray: The (individuals x proposals) int64 genomes of the new problem.
+    """
+    previous_positions: dict[int, list[int]] = dict()
+    for position, proposal_id in enumerate(snapshot.proposal_ids.tolist()):
+        previous_positions.setdefault(proposal_id, list()).append(position)
+
+    genomes: np.ndarray = np.full((len(snapshot.genomes), problem.num_of_proposals), UNSCHEDULED, dtype=np.int64)
+    shift: int = (snapshot.start_date - problem.start_date).days * SECONDS_PER_DAY
+    for position, proposal_id in enumerate(problem.ids.tolist()):
+        positions: list[int] = previous_positions.get(proposal_id, list())
+        if not positions:
+            continue
+        starts: np.ndarray = snapshot.genomes[:, positions.pop(0)]
+        scheduled: np.ndarray = starts != UNSCHEDULED
+        shifted: np.ndarray = np.where(scheduled, starts + shift, UNSCHEDULED)
+        feasible: np.ndarray = scheduled & problem.feasible_starts[position].contains_many(shifted)
+        genomes[:, position] = np.where(feasible, shifted, UNSCHEDULED)
+    return genomes
+
+def perturb(individual: Individual, num_of_genes: int, rng: np.random.Generator) -> Individual:
+    """
+    Builds a variant of an Individual that moves a few of its scheduled proposals to other feasible starts.
+
+    Unlike mutation, a perturbation never unschedules a proposal, so the variant stays close to the original. Proposals
+    without any feasible start, such as one a user scheduled outside its constraints, are left where they are.
+
+    Args:
+        individual (Individual): The Individual to perturb.
+        num_of_genes (int): The number of genes to move.
+        rng (np.random.Generator): The random number generator to draw from.
+
+    Returns:
+        Individual: The perturbed copy.
+    """
+    variant: Individual = Individual(individual.problem, individual.genome)
+    movable: np.ndarray = np.array([feasible_starts.total > 0 for feasible_starts in individual.problem.feasible_starts], dtype=bool)
+    scheduled: np.ndarray = np.flatnonzero((individual.genome != UNSCHEDULED) & movable)
+    if len(scheduled) == 0:
+        return variant
+    for position in rng.choice(scheduled, size=min(num_of_genes, len(scheduled)), replace=False):
+        variant.set_gene(int(position), generate_random_start_offset(individual.problem, int(position), rng))
+    return variant
+
+class WarmStartStore:
+    """
+    Keeps the final population of the latest run of each timetable, bounded to the most recently used timetables, and seeds the
+    population of a new run on an edited timetable from it.
+
+    The populations are only held in memory, so after a restart an edited timetable is seeded from the edit alone.
+    """
+    def __init__(self, max_size: int = 100) -> None:
+        """
+        Initializes the WarmStartStore.
+
+        Args:
+            max_size (int, optional): The maximum number of timetables to remember. Defaults to 100.
+
+        Returns:
+            None
+        """
+        self.max_size: int = max_size
+        self.snapshots: OrderedDict[int, PopulationSnapshot] = OrderedDict()
+        # Runs are stored from the job completion thread while requests seed and discard from their own threads
+        self.lock: threading.Lock = threading.Lock()
+
+    def store(self, timetable_id: int, snapshot: PopulationSnapshot) -> None:
+        """
+        Remembers the final population of a timetable's run, replacing any previous one.
+
+        Args:
+            timetable_id (int): The id of the timetable.
+            snapshot (PopulationSnapshot): The final population of the run, as returned by `take_snapshot()`.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.snapshots[timetable_id] = snapshot
+            self.snapshots.move_to_end(timetable_id)
+            if len(self.snapshots) > self.max_size:
+                self.snapshots.popitem(last=False)
+
+    def discard(self, timetable_id: int) -> None:
+        """
+        Forgets the population of a timetable, such as a deleted one.
+
+        Args:
+            timetable_id (int): The id of the timetable.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.snapshots.pop(timetable_id, None)
+
+    def seed(self, timetable_id: int, edited_individual: Individual, num_of_individuals: int, rng: np.random.Generator, perturbation_rate: float = 0.05) -> list[Individual]:
+        """
+        Builds the initial population of a run on an edited timetable.
+
+        The population holds the user's edit, then up to half of the population from the timetable's previous run, remapped to the
+        edited proposals, then perturbations of the edit that each move `perturbation_rate` of its scheduled proposals.
+
+        Args:
+            timetable_id (int): The id of the timetable.
+            edited_individual (Individual): The timetable as edited by the user.
+            num_of_individuals (int): The size of the population.
+            rng (np.random.Generator): The random number generator to draw the perturbations from.
+            perturbation_rate (float, optional): The fraction of scheduled proposals each perturbation moves. Defaults to 0.05.
+
+        Returns:
+            list[Individual]: The seeded population, of at most `num_of_individuals` Individuals.
+        """
+        problem: SchedulingProblem = edited_individual.problem
+        individuals: list[Individual] = [edited_individual]
+        with self.lock:
+            snapshot: PopulationSnapshot | None = self.snapshots.get(timetable_id)
+            if snapshot is not None:
+                self.snapshots.move_to_end(timetable_id)
+        if snapshot is not None:
+            genomes: np.ndarray = remap_genomes(snapshot, problem)
+            seen: set[bytes] = {edited_individual.genome.tobytes()}
+            for genome in genomes:
+                if len(individuals) >= max(1, num_of_individuals // 2):
+                    break
+                if genome.tobytes() not in seen:
+                    seen.add(genome.tobytes())
+                    individuals.append(Individual(problem, genome))
+
+        num_of_genes: int = max(1, int(np.count_nonzero(edited_individual.genome != UNSCHEDULED) * perturbation_rate))
+        while len(individuals) < num_of_individuals:
+            individuals.append(perturb(edited_individual, num_of_genes, rng))
+        return individuals[:num_of_individuals]
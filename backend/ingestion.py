@@ -0,0 +1,189 @@
+import os
+import math
+import asyncio
+import httpx
+from dataclasses import dataclass
+from typing import Any
+from ga import Proposal
+from codec import parse_proposals
+
+OBS_DATA_URL: str = os.environ.get("OBS_DATA_URL", "http://localhost:3000/proposals")
+PAGE_SIZE: int = 100  # Proposals requested per page
+MAX_CONNECTIONS: int = 8  # Connections the client keeps open to the obs-data service
+
+@dataclass
+class CachedPage:
+    """
+    A page of proposals as last transferred, with the validators to ask the service whether it changed since.
+
+    Attributes:
+        proposal_ids (list[str]): The proposal_id of each proposal of the page, in order.
+        num_of_pages (int | None): The number of pages the service reported alongside the page, if any.
+        etag (str | None): The ETag of the page.
+        last_modified (str | None): The Last-Modified date of the page.
+    """
+    proposal_ids: list[str]
+    num_of_pages: int | None
+    etag: str | None
+    last_modified: str | None
+
+@dataclass(frozen=True)
+class SyncResult:
+    """
+    The outcome of a synchronization with the obs-data service.
+
+    Attributes:
+        num_of_proposals (int): The number of proposals the service holds.
+        num_of_pages (int): The number of pages requested.
+        num_of_pages_transferred (int): The number of pages that changed and were transferred, the others being confirmed unchanged.
+    """
+    num_of_proposals: int
+    num_of_pages: int
+    num_of_pages_transferred: int
+
+class ProposalIngestor:
+    """
+    Pulls proposals from the obs-data service (json-server locally) in pages, through a pooled async HTTP client, and keeps them
+    by proposal_id. Pages are requested conditionally, so a synchronization only transfers the pages that changed.
+    """
+    def __init__(self, url: str = OBS_DATA_URL, page_size: int = PAGE_SIZE, max_connections: int = MAX_CONNECTIONS, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        """
+        Initializes the ProposalIngestor. Its client is opened on the first synchronization.
+
+        Args:
+            url (str, optional): The URL of the proposals collection. Defaults to OBS_DATA_URL.
+            page_size (int, optional): The number of proposals requested per page. Defaults to PAGE_SIZE.
+            max_connections (int, optional): The number of connections kept open to the service. Defaults to MAX_CONNECTIONS.
+            transport (httpx.AsyncBaseTransport | None, optional): The transport of the client. Defaults to None, for HTTP.
+
+        Returns:
+            None
+        """
+        self.url: str = url
+        self.page_size: int = page_size
+        self.max_connections: int = max_connections
+        self.transport: httpx.AsyncBaseTransport | None = transport
+        self.client: httpx.AsyncClient | None = None
+        self.proposals: dict[str, Proposal] = dict()  # Keyed by proposal_id, in the order of the service
+        self.pages: dict[int, CachedPage] = dict()  # Keyed by page number, from 1
+
+    def open(self) -> httpx.AsyncClient:
+        """
+        Opens the client if it is not open yet.
+
+        Args:
+            None
+
+        Returns:
+            httpx.AsyncClient: The client.
+        """
+        if self.client is None:
+            limits: httpx.Limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+            self.client = httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(30.0), transport=self.transport)
+        return self.client
+
+    async def fetch_page(self, page: int) -> tuple[CachedPage, dict[str, Proposal] | None]:
+        """
+        Requests a page of proposals, unless the service confirms the cached copy is unchanged.
+
+        json-server 0.x answers a list with an X-Total-Count header, and json-server 1.x an object holding the list under "data"
+        and the number of pages under "pages". Both are understood.
+
+        Args:
+            page (int): The page number, from 1.
+
+        Returns:
+            tuple[CachedPage, dict[str, Proposal] | None]: The page, and its proposals by proposal_id if it was transferred, or None
+                if it was unchanged.
+        """
+        cached: CachedPage | None = self.pages.get(page)
+        headers: dict[str, str] = dict()
+        if cached is not None and cached.etag is not None:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified is not None:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        response: httpx.Response = await self.open().get(self.url, params={"_page": page, "_limit": self.page_size, "_per_page": self.page_size}, headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            return cached, None
+        response.raise_for_status()
+
+        body: Any = response.json()
+        records: list[dict[str, Any]] = body["data"] if isinstance(body, dict) else body
+        num_of_pages: int | None = body.get("pages") if isinstance(body, dict) else None
+        if num_of_pages is None and "X-Total-Count" in response.headers:
+            num_of_pages = max(1, math.ceil(int(response.headers["X-Total-Count"]) / self.page_size))
+
+        proposals: dict[str, Proposal] = {proposal.proposal_id: proposal for proposal in parse_proposals(records)}
+        fetched: CachedPage = CachedPage([record["proposal_id"] for record in records], num_of_pages, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return fetched, proposals
+
+    async def sync(self) -> SyncResult:
+        """
+        Brings the proposals up to date with the service. The first page tells the number of pages, and the others are then
+        requested concurrently. Without a page count, pages are requested one after another until one is not full.
+
+        Args:
+            None
+
+        Returns:
+            SyncResult: The outcome of the synchronization.
+        """
+        pages: dict[int, CachedPage] = dict()
+        transferred: dict[str, Proposal] = dict()
+        num_of_pages_transferred: int = 0
+
+        def collect(page: int, fetched: CachedPage, proposals: dict[str, Proposal] | None) -> None:
+            nonlocal num_of_pages_transferred
+            pages[page] = fetched
+            if proposals is not None:
+                transferred.update(proposals)
+                num_of_pages_transferred += 1
+
+        collect(1, *await self.fetch_page(1))
+        if pages[1].num_of_pages is not None:
+            results = await asyncio.gather(*(self.fetch_page(page) for page in range(2, pages[1].num_of_pages + 1)))
+            for page, result in enumerate(results, start=2):
+                collect(page, *result)
+        else:
+            page: int = 1
+            while len(pages[page].proposal_ids) == self.page_size:
+                page += 1
+                collect(page, *await self.fetch_page(page))
+
+        # Proposals no longer listed by the service are dropped
+        previous: dict[str, Proposal] = self.proposals
+        self.proposals = {proposal_id: transferred[proposal_id] if proposal_id in transferred else previous[proposal_id] for page in sorted(pages) for proposal_id in pages[page].proposal_ids}
+        self.pages = pages
+        return SyncResult(len(self.proposals), len(pages), num_of_pages_transferred)
+
+    def get(self, proposal_ids: list[str]) -> list[Proposal]:
+        """
+        Looks up synchronized proposals.
+
+        Args:
+            proposal_ids (list[str]): The proposal_id of each proposal, or an empty list for every proposal.
+
+        Returns:
+            list[Proposal]: The proposals, in the order of `proposal_ids`, or in the order of the service for every proposal.
+        """
+        if not proposal_ids:
+            return list(self.proposals.values())
+        missing: list[str] = [proposal_id for proposal_id in proposal_ids if proposal_id not in self.proposals]
+        if missing:
+            raise KeyError(f"Unknown proposals: {', '.join(missing)}")
+        return [self.proposals[proposal_id] for proposal_id in proposal_ids]
+
+    async def close(self) -> None:
+        """
+        Closes the client and its connections.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
@@ -0,0 +1,309 @@
+import os
+import time
+import uuid
+import threading
+import multiprocessing
+from enum import Enum
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Any, Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from ga import Proposal, SchedulingProblem, Individual, Genetic_Algorithm, Timetable, ClashPolicy, ProgressEvent, ThrottledProgress, StopReason, make_stop_policies
+from ga.warm_start import PopulationSnapshot, take_snapshot
+
+# Minimum time between two progress updates published by a worker, in seconds
+PROGRESS_INTERVAL: float = 0.2
+JOB_TTL: float = 3600.0  # Seconds a finished job is kept for its result to be fetched
+MAX_FINISHED_JOBS: int = 1000  # Finished jobs kept at most, the oldest evicted first
+
+class JobStatus(str, Enum):
+    """
+    The lifecycle of a timetable generation job.
+    """
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+@dataclass(frozen=True)
+class JobResult:
+    """
+    What a worker sends back once a job completes.
+
+    Attributes:
+        schedules (list[Proposal]): The scheduled proposals of the clash-free timetable.
+        raw_schedules (list[Proposal]): The proposals of the best timetable before its clashes were removed.
+        stop_reason (StopReason): The policy that ended the run.
+        population (PopulationSnapshot): The final population of the run, to warm-start later runs on the same timetable.
+    """
+    schedules: list[Proposal]
+    raw_schedules: list[Proposal]
+    stop_reason: StopReason
+    population: PopulationSnapshot
+
+class Job:
+    """
+    The record of a timetable generation job, kept by the API process while the job runs in a worker process.
+    """
+    def __init__(self, job_id: str, num_of_generations: int) -> None:
+        """
+        Initializes a queued Job.
+
+        Args:
+            job_id (str): The unique identifier of the job.
+            num_of_generations (int): The number of generations the Genetic Algorithm will run for.
+
+        Returns:
+            None
+        """
+        self.id: str = job_id
+        self.num_of_generations: int = num_of_generations
+        self.status: JobStatus = JobStatus.QUEUED
+        self.result: Any = None  # Whatever the completion callback made of the JobResult
+        self.error: str | None = None
+        self.stop_reason: StopReason | None = None  # The policy that ended the run, once completed
+        self.progress: dict[str, Any] | None = None  # The last progress the worker published, once finished
+        self.future: Future | None = None
+
+class ProgressReporter:
+    """
+    A picklable callback that publishes the progress of a Genetic Algorithm run to the shared progress table of the job manager.
+    """
+    def __init__(self, job_id: str, progress: Any) -> None:
+        """
+        Initializes the ProgressReporter.
+
+        Args:
+            job_id (str): The job whose progress is reported.
+            progress (Any): The managed dictionary shared with the API process, keyed by job id.
+
+        Returns:
+            None
+        """
+        self.job_id: str = job_id
+        self.progress: Any = progress
+
+    def __call__(self, event: ProgressEvent) -> None:
+        """
+        Publishes the latest progress event.
+
+        Args:
+            event (ProgressEvent): The state of the run after the latest generation.
+
+        Returns:
+            None
+        """
+        self.progress[self.job_id] = asdict(event)
+
+def run_timetable_job(job_id: str, start_date: date, end_date: date, proposals: list[Proposal], num_of_individuals: int, num_of_generations: int, progress: Any, stop_limits: dict[str, Any], clash_policy: ClashPolicy = ClashPolicy.FIRST_WINS) -> JobResult:
+    """
+    Generates a clash-free timetable in a worker process. Every job builds its own problem, so concurrent jobs share no state.
+
+    Args:
+        job_id (str): The job being run, used to report progress.
+        start_date (date): The first date of the timetable.
+        end_date (date): The last date of the timetable.
+        proposals (list[Proposal]): The proposals to be scheduled.
+        num_of_individuals (int): The number of Individuals in the population.
+        num_of_generations (int): The number of generations to evolve the population.
+        progress (Any): The managed dictionary shared with the API process, keyed by job id.
+        stop_limits (dict[str, Any]): The keyword arguments of `make_stop_policies()` for the run.
+        clash_policy (ClashPolicy, optional): How clashing proposals are chosen between. Defaults to ClashPolicy.FIRST_WINS.
+
+    Returns:
+        JobResult: The clash-free timetable, the policy that ended the run and the final population.
+    """
+    reporter: ProgressReporter = ProgressReporter(job_id, progress)
+    reporter(ProgressEvent(generation=0, num_of_generations=num_of_generations, best_fitness=0.0, median_fitness=0.0, worst_fitness=0.0, num_scored=0, elapsed=0.0))
+    problem: SchedulingProblem = SchedulingProblem(start_date=start_date, end_date=end_date, proposals=tuple(proposals))
+
+    # Generate the individuals using the genetic algorithm
+    genetic_algorithm: Genetic_Algorithm = Genetic_Algorithm(problem=problem, num_of_individuals=num_of_individuals, num_of_generations=num_of_generations, progress_callback=ThrottledProgress(reporter, PROGRESS_INTERVAL), verbose=False, stop_policies=make_stop_policies(**stop_limits))
+
+    best_individual: Individual = genetic_algorithm.run()
+
+    # Plots are drawn by the API once the timetable is stored, so they never hold the job up
+    best_timetable: Timetable = Timetable(problem=problem, genome=best_individual.genome)
+    raw_schedules: list[Proposal] = best_timetable.schedules
+    best_timetable.remove_clashes(clash_policy)
+    return JobResult(best_timetable.schedules, raw_schedules, genetic_algorithm.stop_reason, take_snapshot(problem, genetic_algorithm.individuals))
+
+class JobManager:
+    """
+    Runs timetable generation jobs in a pool of worker processes and tracks their status and progress. Finished jobs are
+    forgotten once they are older than a time to live or more than a number of jobs have finished since.
+    """
+    def __init__(self, max_workers: int | None = None, job_ttl: float = JOB_TTL, max_finished_jobs: int = MAX_FINISHED_JOBS) -> None:
+        """
+        Initializes the JobManager. The worker pool and the progress table are started on the first submitted job.
+
+        Args:
+            max_workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+            job_ttl (float, optional): The seconds a finished job is kept. Defaults to JOB_TTL.
+            max_finished_jobs (int, optional): The number of finished jobs kept at most. Defaults to MAX_FINISHED_JOBS.
+
+        Returns:
+            None
+        """
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.job_ttl: float = job_ttl
+        self.max_finished_jobs: int = max_finished_jobs
+        self.jobs: dict[str, Job] = dict()
+        self.finished: OrderedDict[str, float] = OrderedDict()  # The time each finished job finished at, oldest first
+        self.lock: threading.Lock = threading.Lock()
+        self.executor: ProcessPoolExecutor | None = None
+        self.manager: Any = None
+        self.progress: Any = None
+
+    def start(self) -> None:
+        """
+        Starts the worker pool and the progress table if they are not running yet.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self.lock:
+            if self.executor is not None:
+                return
+            # Spawned workers start from a clean interpreter rather than a copy of the API process
+            context = multiprocessing.get_context("spawn")
+            self.manager = context.Manager()
+            self.progress = self.manager.dict()
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+
+    def submit(self, start_date: date, end_date: date, proposals: list[Proposal], on_complete: Callable[[JobResult], Any], num_of_individuals: int = 10, num_of_generations: int = 50, stagnation_window: int | None = None, target_fitness: float | None = None, time_budget: float | None = None, clash_policy: ClashPolicy = ClashPolicy.FIRST_WINS) -> Job:
+        """
+        Queues a timetable generation job and returns immediately.
+
+        Args:
+            start_date (date): The first date of the timetable.
+            end_date (date): The last date of the timetable.
+            proposals (list[Proposal]): The proposals to be scheduled.
+            on_complete (Callable[[JobResult], Any]): Called in the API process with the result of the worker once the job
+                completes. Its return value is kept as the result of the job.
+            num_of_individuals (int, optional): The number of Individuals in the population. Defaults to 10.
+            num_of_generations (int, optional): The number of generations to evolve the population. Defaults to 50.
+            stagnation_window (int | None, optional): Stop once the best fitness has not improved for this many generations. Defaults to None.
+            target_fitness (float | None, optional): Stop once the best fitness reaches this value. Defaults to None.
+            time_budget (float | None, optional): Stop once the run has taken this many seconds. Defaults to None.
+            clash_policy (ClashPolicy, optional): How clashing proposals are chosen between. Defaults to ClashPolicy.FIRST_WINS.
+
+        Returns:
+            Job: The queued job.
+        """
+        self.start()
+        job: Job = Job(uuid.uuid4().hex, num_of_generations)
+        with self.lock:
+            self.prune()
+            self.jobs[job.id] = job
+        job.future = self.executor.submit(run_timetable_job, job.id, start_date, end_date, proposals, num_of_individuals, num_of_generations, self.progress, {"stagnation_window": stagnation_window, "target_fitness": target_fitness, "time_budget": time_budget}, clash_policy)
+        job.future.add_done_callback(lambda future: self.finish(job, future, on_complete))
+        return job
+
+    def finish(self, job: Job, future: Future, on_complete: Callable[[JobResult], Any]) -> None:
+        """
+        Records the outcome of a job once its worker is done, on the thread of the worker pool. The last progress of the job
+        is moved out of the progress table into the job.
+
+        Args:
+            job (Job): The job that finished.
+            future (Future): The future of the worker call.
+            on_complete (Callable[[JobResult], Any]): The completion callback of the job.
+
+        Returns:
+            None
+        """
+        status: JobStatus = JobStatus.COMPLETED
+        try:
+            result: JobResult = future.result()
+            job.stop_reason = result.stop_reason
+            job.result = on_complete(result)
+        except Exception as exception:
+            job.error = f"{type(exception).__name__}: {exception}"
+            status = JobStatus.FAILED
+        with self.lock:
+            if self.progress is not None:
+                progress: dict[str, Any] | None = self.progress.get(job.id)
+                job.progress = dict(progress) if progress is not None else None
+                self.progress.pop(job.id, None)
+            job.status = status
+            self.finished[job.id] = time.monotonic()
+            self.prune()
+
+    def prune(self) -> None:
+        """
+        Forgets the finished jobs older than the time to live, and the oldest ones beyond the number kept. The caller holds the
+        lock.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        expiry: float = time.monotonic() - self.job_ttl
+        while self.finished and (len(self.finished) > self.max_finished_jobs or next(iter(self.finished.values())) < expiry):
+            job_id, _ = self.finished.popitem(last=False)
+            self.jobs.pop(job_id, None)
+
+    def get(self, job_id: str) -> Job | None:
+        """
+        Looks up a job and refreshes its status.
+
+        Args:
+            job_id (str): The identifier of the job.
+
+        Returns:
+            Job | None: The job, or None if no job has that identifier.
+        """
+        with self.lock:
+            self.prune()
+            job: Job | None = self.jobs.get(job_id)
+            # A worker publishes progress as soon as it picks the job up, and a finished job has left the progress table
+            if job is not None and job.status == JobStatus.QUEUED and self.progress is not None and job_id in self.progress:
+                job.status = JobStatus.RUNNING
+        return job
+
+    def get_progress(self, job_id: str) -> dict[str, Any]:
+        """
+        Reads the latest progress a job's worker has published.
+
+        Args:
+            job_id (str): The identifier of the job.
+
+        Returns:
+            dict[str, Any]: The fields of the latest ProgressEvent of the job, all zero until the job starts.
+        """
+        with self.lock:
+            job: Job | None = self.jobs.get(job_id)
+            progress: dict[str, Any] | None = job.progress if job is not None else None
+            if progress is None and self.progress is not None:
+                progress = self.progress.get(job_id)
+        if progress is None:
+            return asdict(ProgressEvent(generation=0, num_of_generations=job.num_of_generations if job else 0, best_fitness=0.0, median_fitness=0.0, worst_fitness=0.0, num_scored=0, elapsed=0.0))
+        return dict(progress)
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker pool and the progress table, waiting for running jobs to finish.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self.lock:
+            executor, manager = self.executor, self.manager
+            self.executor = None
+        # Finishing jobs take the lock, so the pool is waited for without it
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+            with self.lock:
+                self.manager = None
+                self.progress = None
+            manager.shutdown()
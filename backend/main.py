@@ -1,35 +1,39 @@
+import os
+import random
+import asyncio
+import anyio
 import uvicorn
+import numpy as np
+from typing import Literal
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 from datetime import date, datetime
-from fastapi import FastAPI
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
 from fastapi.middleware.cors import CORSMiddleware
-from ga import Proposal, Individual, Genetic_Algorithm, Timetable, update_global_vars, parse_time
-
-class ProposalModel(BaseModel):
-    """Model representing a proposal."""
-    id: str
-    description: str
-    proposal_id: str
-    owner_email: str
-    instrument_product: str
-    instrument_integration_time: str
-    instrument_band: str
-    instrument_pool_resources: str
-    lst_start: str
-    lst_start_end: str
-    simulated_duration: str
-    night_obs: str
-    avoid_sunrise_sunset: str
-    minimum_antennas: str
-    general_comments: str
-    scheduled_start_datetime: str
-    
+from ga import Proposal, SchedulingProblem, Individual, Genetic_Algorithm, Timetable, ClashPolicy, StopReason, make_stop_policies
+from ga.plotting import WeekPlot, plan_week_plots, render_model, render_model_csv
+from codec import ProposalModel, from_proposals, to_proposals
+from ga.warm_start import WarmStartStore, take_snapshot
+from ingestion import ProposalIngestor
+from jobs import Job, JobManager, JobResult, JobStatus
+from rendering import Render, RenderManager, RenderStatus
+from storage import TimetableStore
 
 class CreateTimetableRequestModel(BaseModel):
     """Request model for creating a timetable."""
     start_date: str
     end_date: str
-    proposals: list[ProposalModel]
+    proposals: list[ProposalModel] = []
+    proposal_ids: list[str] | None = None  # Schedule these proposals of the obs-data service instead, or all of them if empty
+    stagnation_window: int | None = Field(default=None, gt=0)  # Stop once the best fitness has not improved for this many generations
+    target_fitness: float | None = Field(default=None, gt=0, le=1)  # Stop once the best fitness reaches this value
+    time_budget: float | None = Field(default=None, gt=0)  # Stop once the run has taken this many seconds
+    # Which of two clashing proposals stays in the clash-free timetable. Proposals carry no priority of their own yet, so the
+    # highest_score policy, which would fall back to first_wins, is not offered
+    clash_policy: Literal[ClashPolicy.FIRST_WINS, ClashPolicy.MAX_DURATION] = ClashPolicy.FIRST_WINS
+    render: bool = True  # Draw the weekly plots in the background, which API-only callers may skip
 
 
 class TimetableModel(CreateTimetableRequestModel):
@@ -40,10 +44,93 @@ class TimetableModel(CreateTimetableRequestModel):
         from_attributes = True
 
 
-app = FastAPI()
+class JobModel(BaseModel):
+    """Model representing a timetable generation job."""
+    id: str
+    status: JobStatus
+    timetable_id: int | None = None
+    error: str | None = None
+    stop_reason: StopReason | None = None
+
+
+class JobProgressModel(BaseModel):
+    """Model representing the progress of a timetable generation job."""
+    id: str
+    status: JobStatus
+    generation: int
+    num_of_generations: int
+    best_fitness: float
+    median_fitness: float
+    worst_fitness: float
+    num_scored: int
+    elapsed: float
+    stop_reason: StopReason | None = None
+
+
+class RenderModel(BaseModel):
+    """Model representing the weekly plots of a timetable."""
+    status: RenderStatus
+    files: list[str]
+    urls: list[str]
+    total_proposals: list[int]  # The number of proposals of the timetable each plot belongs to, which the plots do not show
+    total_scheduled_proposals: list[int]
+    error: str | None = None
+
+
+class ProposalSyncModel(BaseModel):
+    """Model representing a synchronization of the proposals of the obs-data service."""
+    num_of_proposals: int
+    num_of_pages: int
+    num_of_pages_transferred: int
+
+
+job_manager: JobManager = JobManager()
+proposal_ingestor: ProposalIngestor = ProposalIngestor()
+render_manager: RenderManager = RenderManager()
+
+# The timetables are kept beside the plots, in the outputs directory of the backend unless TIMETABLE_DATABASE points elsewhere
+DATABASE_PATH: str = os.environ.get("TIMETABLE_DATABASE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "outputs", "timetables.db"))
+timetable_store: TimetableStore = TimetableStore(DATABASE_PATH)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Opens the timetable store when the API starts, and stops the job and render workers and closes the obs-data client and
+    the timetable store when it shuts down.
+    """
+    timetable_store.open()
+    yield
+    job_manager.shutdown()
+    render_manager.shutdown()
+    await proposal_ingestor.close()
+    timetable_store.close()
+
+app = FastAPI(lifespan=lifespan)
 router_url_prefix = "/api/v1/timetables/"
+jobs_url_prefix = "/api/v1/jobs/"
+proposals_url_prefix = "/api/v1/proposals/"
+
+MAX_PAGE_SIZE: int = 1000  # Timetables listed by a single request
+
+warm_starts: WarmStartStore = WarmStartStore()  # The final population of each timetable's last run, to seed its updates
+
+NUM_OF_GENERATIONS: int = 50  # Generations of a run without any stop limit
+UPDATE_NUM_OF_INDIVIDUALS: int = 10  # Population of a run updating a timetable
+WARM_START_STAGNATION_WINDOW: int = 10  # Generations without improvement that end a warm-started update without any stop limit
+MAX_NUM_OF_GENERATIONS: int = 15 * 1000  # Generations of a run ended by its stop limits
+
+def num_of_generations_for(request: CreateTimetableRequestModel) -> int:
+    """
+    Chooses the number of generations of a run, which only its stop limits may end early.
+
+    Args:
+        request (CreateTimetableRequestModel): The request carrying the optional stop limits.
 
-timetables: list[TimetableModel] = []
+    Returns:
+        int: NUM_OF_GENERATIONS without stop limits, MAX_NUM_OF_GENERATIONS otherwise.
+    """
+    has_stop_limit: bool = any(limit is not None for limit in (request.stagnation_window, request.target_fitness, request.time_budget))
+    return MAX_NUM_OF_GENERATIONS if has_stop_limit else NUM_OF_GENERATIONS
 
 origins = [
     "http://localhost:4200",  # Angular app
@@ -68,19 +155,21 @@ def read_root():
     return {"message": "Welcome to the Genetic Algorithim based Auto Scheduler API"}
 
 @app.get(router_url_prefix, response_model=list[TimetableModel])
-def get_timetables():
+def get_timetables(response: Response, offset: int = Query(default=0, ge=0), limit: int = Query(default=100, ge=1, le=MAX_PAGE_SIZE)):
     """
-    Gets a list of all timetables.
+    Gets a page of timetables, ordered by ID.
 
     Args:
-        None
+        response (Response): The response, whose X-Total-Count header is set to the number of timetables.
+        offset (int): The number of timetables to skip. Defaults to 0.
+        limit (int): The maximum number of timetables to return. Defaults to 100.
     
     Returns:
-        JSON list of all timetables.
+        JSON list of the timetables of the page.
         If no timetables exist, returns an empty list.
     """
-    global timetables
-    return timetables
+    response.headers["X-Total-Count"] = str(timetable_store.count())
+    return [TimetableModel.model_validate(t) for t in timetable_store.page(offset, limit)]
 
 @app.get(router_url_prefix+"{timetable_id}", response_model=TimetableModel)
 def get_timetable(timetable_id: int):
@@ -94,94 +183,324 @@ def get_timetable(timetable_id: int):
         JSON object of the timetable with the specified ID.
         If not found, returns an empty JSON object.
     """
-    global timetables
-    return next((t for t in timetables if t.id == timetable_id), {})
+    timetable: dict | None = timetable_store.get(timetable_id)
+    return TimetableModel.model_validate(timetable) if timetable is not None else {}
 
-@app.post(router_url_prefix, response_model=TimetableModel)
+@app.post(router_url_prefix, response_model=JobModel, status_code=202)
 def create_timetable(create_timetable_request: CreateTimetableRequestModel):
     """
-    Generates a new timetable based on the provided proposals using Genetic Algorithm .
+    Queues the generation of a new timetable based on the provided proposals using Genetic Algorithm.
+
+    The proposals are either sent in the request, or picked by proposal_id from the obs-data service, which is synchronized first.
 
     Args:
         create_timetable_request (CreateTimetableRequestModel): Request model containing start date, end date, and proposals.
 
     Returns:
-        JSON object of the newly generated timetable.
+        JSON object of the queued job. Its result is the newly generated timetable.
+        Fails with 404 if a picked proposal is not held by the obs-data service.
     """
-    global timetables
-    timetable_id = len(timetables) + 1
     start_date: date = datetime.strptime(create_timetable_request.start_date, "%Y-%m-%d").date()
     end_date: date = datetime.strptime(create_timetable_request.end_date, "%Y-%m-%d").date()
     proposals: list[Proposal] = []
-    for p in create_timetable_request.proposals:
-        proposal: Proposal = Proposal(
-            id=int(p.id),
-            description=p.description,
-            proposal_id=p.proposal_id,
-            owner_email=p.owner_email,
-            instrument_product=p.instrument_product,
-            instrument_integration_time=float(p.instrument_integration_time),
-            instrument_band=p.instrument_band,
-            instrument_pool_resources=p.instrument_pool_resources,
-            lst_start_time=parse_time(p.lst_start),
-            lst_start_end_time=parse_time(p.lst_start_end),
-            simulated_duration=int(p.simulated_duration),
-            night_obs=p.night_obs.lower() == "yes",
-            avoid_sunrise_sunset=p.avoid_sunrise_sunset.lower() == "yes",
-            minimum_antennas=int(p.minimum_antennas),
-            general_comments=p.general_comments,
-            scheduled_start_datetime=None,
-        )
-        proposals.append(proposal)
-
-
-    update_global_vars(start_date=start_date, end_date=end_date, proposals=[p.to_dict() for p in proposals])
-
-    # Generate the individuals using the genetic algorithm
-    genetic_algorithm: Genetic_Algorithm = Genetic_Algorithm(num_of_individuals=10, num_of_generations=50)
-    
-    # Get the best individual from the genetic algorithm
-    scheduled_proposals: list[Proposal] = genetic_algorithm.get_best_fit_individual().schedules
-    
-    # Visualize the best timetable
-    best_timetable: Timetable = Timetable(schedules=scheduled_proposals)
-    best_timetable.plot() # Plot raw timetable after genetic algorithm
-    best_timetable.remove_clashes()
-    best_timetable.plot(filename_suffix="_clash_free")# Plot the timetable after removing clashes
-
-    scheduled_proposals_models: list[ProposalModel] = []
-    for s in best_timetable.schedules:
-        scheduled_proposals_models.append(ProposalModel(
-            id=str(s.id),
-            description=s.description,
-            proposal_id=s.proposal_id,
-            owner_email=s.owner_email,
-            instrument_product=s.instrument_product,
-            instrument_integration_time=str(s.instrument_integration_time),
-            instrument_band=s.instrument_band,
-            instrument_pool_resources=s.instrument_pool_resources,
-            lst_start=s.lst_start_time.strftime("%H:%M"),
-            lst_start_end=s.lst_start_end_time.strftime("%H:%M"),
-            simulated_duration=str(s.simulated_duration),
-            night_obs="yes" if s.night_obs else "no",
-            avoid_sunrise_sunset="yes" if s.avoid_sunrise_sunset else "no",
-            minimum_antennas=str(s.minimum_antennas),
-            general_comments=s.general_comments,
-            scheduled_start_datetime=s.scheduled_start_datetime.strftime("%Y-%m-%d %H:%M:%S") if s.scheduled_start_datetime else ""
-            )
-        )
-    import random
-    names = [
-        "Alpha", "Bravo", "Charlie", "Delta", "Echo", 
-        "Foxtrot", "Golf", "Hotel", "India", "Juliett",
-        "Kilo", "Lima", "Mike", "Hopewell", "Oscar",
-        "Papa", "Quebec", "Romeo", "Sierra", "Tango",
-        "Ester", "Quad", "Jovian", "Lilly", "Agile"
-    ]
-    name = random.choice(names)
-    timetable = TimetableModel(id=timetable_id, name=name, start_date=create_timetable_request.start_date, end_date=create_timetable_request.end_date, proposals=scheduled_proposals_models)
-    timetables.append(timetable)
-    return timetable
+    if create_timetable_request.proposal_ids is not None:
+        # Requests run on a worker thread, while the obs-data client belongs to the event loop
+        anyio.from_thread.run(proposal_ingestor.sync)
+        try:
+            proposals = proposal_ingestor.get(create_timetable_request.proposal_ids)
+        except KeyError as error:
+            raise HTTPException(status_code=404, detail=error.args[0])
+    proposals += to_proposals(create_timetable_request.proposals)
+
+    def add_timetable(result: JobResult) -> TimetableModel:
+        """
+        Stores the timetable of a completed job, and the final population of its run to warm-start its updates.
+
+        Args:
+            result (JobResult): The result of the job.
+
+        Returns:
+            TimetableModel: The newly generated timetable.
+        """
+        scheduled_proposals_models: list[ProposalModel] = from_proposals(result.schedules)
+        names = [
+            "Alpha", "Bravo", "Charlie", "Delta", "Echo", 
+            "Foxtrot", "Golf", "Hotel", "India", "Juliett",
+            "Kilo", "Lima", "Mike", "Hopewell", "Oscar",
+            "Papa", "Quebec", "Romeo", "Sierra", "Tango",
+            "Ester", "Quad", "Jovian", "Lilly", "Agile"
+        ]
+        name = random.choice(names)
+        timetable: TimetableModel = TimetableModel.model_validate(timetable_store.add(
+            create_timetable_request.model_dump(exclude={"proposals"}) | {"name": name, "proposals": [p.model_dump() for p in scheduled_proposals_models]}
+        ))
+        warm_starts.store(timetable.id, result.population)
+        if create_timetable_request.render:
+            render_manager.submit(timetable.id, start_date, end_date, {"": result.raw_schedules, "_clash_free": result.schedules})
+        return timetable
+
+    job: Job = job_manager.submit(
+        start_date=start_date,
+        end_date=end_date,
+        proposals=proposals,
+        on_complete=add_timetable,
+        num_of_generations=num_of_generations_for(create_timetable_request),
+        stagnation_window=create_timetable_request.stagnation_window,
+        target_fitness=create_timetable_request.target_fitness,
+        time_budget=create_timetable_request.time_budget,
+        clash_policy=create_timetable_request.clash_policy,
+    )
+    return to_job_model(job)
+
+@app.post(proposals_url_prefix+"sync", response_model=ProposalSyncModel)
+async def sync_proposals():
+    """
+    Brings the proposals held for timetable generation up to date with the obs-data service, transferring only changed pages.
+
+    Returns:
+        JSON object of the number of proposals and of the pages requested and transferred.
+    """
+    return ProposalSyncModel(**asdict(await proposal_ingestor.sync()))
+
+def to_job_model(job: Job) -> JobModel:
+    """
+    Converts a job record to its API model.
+
+    Args:
+        job (Job): The job to convert.
+
+    Returns:
+        JobModel: The API model of the job.
+    """
+    return JobModel(id=job.id, status=job.status, timetable_id=job.result.id if job.result is not None else None, error=job.error, stop_reason=job.stop_reason)
+
+def find_job(job_id: str) -> Job:
+    """
+    Looks up a job, failing the request if it does not exist.
+
+    Args:
+        job_id (str): ID of the job.
+
+    Returns:
+        Job: The job with the specified ID.
+    """
+    job: Job | None = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+@app.get(jobs_url_prefix+"{job_id}", response_model=JobModel)
+def get_job(job_id: str):
+    """
+    Gets the status of a timetable generation job.
+
+    Args:
+        job_id (str): ID of the job.
+
+    Returns:
+        JSON object of the job, including the ID of its timetable once completed.
+    """
+    return to_job_model(find_job(job_id))
+
+@app.get(jobs_url_prefix+"{job_id}/progress", response_model=JobProgressModel)
+def get_job_progress(job_id: str):
+    """
+    Gets the progress of a timetable generation job.
+
+    Args:
+        job_id (str): ID of the job.
+
+    Returns:
+        JSON object of the current generation and the best, median and worst fitness of the job.
+    """
+    return to_job_progress_model(find_job(job_id))
+
+def to_job_progress_model(job: Job) -> JobProgressModel:
+    """
+    Reads the latest progress of a job into its API model.
+
+    Args:
+        job (Job): The job whose progress is read.
+
+    Returns:
+        JobProgressModel: The API model of the progress of the job.
+    """
+    return JobProgressModel(id=job.id, status=job.status, **job_manager.get_progress(job.id))
+
+@app.get(jobs_url_prefix+"{job_id}/events")
+async def stream_job_progress(job_id: str, interval: float = Query(default=0.5, ge=0.1)):
+    """
+    Streams the progress of a timetable generation job as Server-Sent Events.
+
+    A `progress` event is sent whenever a new generation has been published, at most once per interval, and a final event named
+    after the job status (`completed` or `failed`) carries the job once it finishes.
+
+    Args:
+        job_id (str): ID of the job.
+        interval (float): The time between two progress checks, in seconds. Defaults to 0.5.
+
+    Returns:
+        A text/event-stream response.
+    """
+    # Looking a job up takes the job manager's lock and reads the progress table of the worker processes, so it runs on a
+    # worker thread rather than holding up the event loop
+    await anyio.to_thread.run_sync(find_job, job_id)
+
+    def poll() -> tuple[Job, JobProgressModel] | None:
+        """
+        Reads a job and its latest progress.
+
+        Returns:
+            tuple[Job, JobProgressModel] | None: The job and its progress, or None if the job has been forgotten.
+        """
+        job: Job | None = job_manager.get(job_id)
+        return (job, to_job_progress_model(job)) if job is not None else None
+
+    async def events():
+        last_generation: int | None = None
+        while True:
+            polled: tuple[Job, JobProgressModel] | None = await anyio.to_thread.run_sync(poll)
+            if polled is None:
+                return  # The job finished long enough ago to be forgotten
+            job, progress = polled
+            finished: bool = job.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+            if progress.generation != last_generation:
+                last_generation = progress.generation
+                yield f"event: progress\ndata: {progress.model_dump_json()}\n\n"
+            if finished:
+                yield f"event: {job.status.value}\ndata: {to_job_model(job).model_dump_json()}\n\n"
+                return
+            await asyncio.sleep(interval)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@app.get(jobs_url_prefix+"{job_id}/result", response_model=TimetableModel)
+def get_job_result(job_id: str):
+    """
+    Gets the timetable generated by a completed job.
+
+    Args:
+        job_id (str): ID of the job.
+
+    Returns:
+        JSON object of the generated timetable.
+        Fails with 409 while the job is still queued or running, and with 500 if it failed.
+    """
+    job: Job = find_job(job_id)
+    if job.status == JobStatus.FAILED:
+        raise HTTPException(status_code=500, detail=job.error)
+    if job.status != JobStatus.COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {job.status.value}")
+    return job.result
+
+def find_render(timetable_id: int) -> Render:
+    """
+    Looks up the plots of a timetable, failing the request if it was never rendered.
+
+    Args:
+        timetable_id (int): ID of the timetable.
+
+    Returns:
+        Render: The latest render of the timetable.
+    """
+    render: Render | None = render_manager.get(timetable_id)
+    if render is None:
+        raise HTTPException(status_code=404, detail=f"Timetable {timetable_id} has no plots")
+    return render
+
+@app.get(router_url_prefix+"{timetable_id}/plots", response_model=RenderModel)
+def get_timetable_plots(timetable_id: int):
+    """
+    Gets the state of the weekly plots of a timetable.
+
+    Args:
+        timetable_id (int): ID of the timetable.
+
+    Returns:
+        JSON object of the render status, and the file name, URL and timetable-wide proposal counts of each plot.
+    """
+    render: Render = find_render(timetable_id)
+    urls: list[str] = [f"{router_url_prefix}{timetable_id}/plots/{name}" for name in render.names]
+    return RenderModel(
+        status=render.status, files=render.names, urls=urls, error=render.error,
+        total_proposals=[week_plot.total_proposals for week_plot in render.week_plots],
+        total_scheduled_proposals=[week_plot.total_scheduled_proposals for week_plot in render.week_plots],
+    )
+
+@app.get(router_url_prefix+"{timetable_id}/plots/{filename}")
+def get_timetable_plot(timetable_id: int, filename: str):
+    """
+    Gets a weekly plot of a timetable once it has been drawn. A plot evicted from the render cache since is drawn again.
+
+    Args:
+        timetable_id (int): ID of the timetable.
+        filename (str): The file name of the plot, as listed by the plots endpoint.
+
+    Returns:
+        The PNG image.
+        Fails with 404 if the timetable has no such plot, and with 409 while it is being drawn.
+    """
+    render: Render = find_render(timetable_id)
+    for index, (name, path) in enumerate(zip(render.names, render.paths)):
+        if name == filename:
+            future = render_manager.redraw(render, index)
+            if not future.done():
+                raise HTTPException(status_code=409, detail=f"Plot {filename} is being drawn")
+            if future.cancelled() or future.exception() is not None:
+                raise HTTPException(status_code=500, detail=render.error or f"Plot {filename} was not drawn")
+            return FileResponse(path, media_type="image/png")
+    raise HTTPException(status_code=404, detail=f"Timetable {timetable_id} has no plot {filename}")
+
+def find_schedules(timetable_id: int) -> tuple[date, date, list[Proposal]]:
+    """
+    Looks up the dates and scheduled proposals of a stored timetable, failing the request if it does not exist.
+
+    Args:
+        timetable_id (int): ID of the timetable.
+
+    Returns:
+        tuple[date, date, list[Proposal]]: The first and last dates of the timetable, and its proposals.
+    """
+    timetable: dict | None = timetable_store.get(timetable_id)
+    if timetable is None:
+        raise HTTPException(status_code=404, detail=f"Timetable {timetable_id} not found")
+    model: TimetableModel = TimetableModel.model_validate(timetable)
+    start_date: date = datetime.strptime(model.start_date, "%Y-%m-%d").date()
+    end_date: date = datetime.strptime(model.end_date, "%Y-%m-%d").date()
+    return start_date, end_date, to_proposals(model.proposals)
+
+@app.get(router_url_prefix+"{timetable_id}/blocks")
+def get_timetable_blocks(timetable_id: int, format: Literal["json", "csv"] = "json"):
+    """
+    Gets the blocks of the weekly plots of a timetable as data, for the frontend to draw the timetable itself. Overnight
+    observations are already split at midnight.
+
+    Args:
+        timetable_id (int): ID of the timetable.
+        format (str, optional): "json" for the weeks and their blocks, or "csv" for one row per block. Defaults to "json".
+
+    Returns:
+        JSON object or CSV text of the blocks of each week.
+        Fails with 404 if the timetable does not exist.
+    """
+    week_plots: list[WeekPlot] = plan_week_plots(*find_schedules(timetable_id), directory="")
+    if format == "csv":
+        return PlainTextResponse(render_model_csv(week_plots), media_type="text/csv")
+    return JSONResponse(render_model(week_plots))
+
+@app.get(router_url_prefix+"{timetable_id}/overview")
+def get_timetable_overview(timetable_id: int):
+    """
+    Gets a single plot of every week of a timetable.
+
+    Args:
+        timetable_id (int): ID of the timetable.
+
+    Returns:
+        The PNG image.
+        Fails with 404 if the timetable does not exist.
+    """
+    return FileResponse(render_manager.overview(*find_schedules(timetable_id)), media_type="image/png")
 
 @app.put(router_url_prefix+"{timetable_id}", response_model=TimetableModel)
 def update_timetable(timetable_id: int, timetable: TimetableModel):
@@ -196,56 +515,43 @@ def update_timetable(timetable_id: int, timetable: TimetableModel):
         JSON object of the updated timetable.
         If not found, returns an empty JSON object.
     """
-    global timetables
-    for t in timetables:
-        if t.id == timetable_id:
-            updated_timetable: TimetableModel = timetable
-            start_date: date = datetime.strptime(t.start_date, "%Y-%m-%d").date()
-            end_date: date = datetime.strptime(t.end_date, "%Y-%m-%d").date()
-            proposals: list[Proposal] = list()
-            for p in timetable.proposals:
-                proposal: Proposal = Proposal(
-                    id=int(p.id),
-                    description=p.description,
-                    proposal_id=p.proposal_id,
-                    owner_email=p.owner_email,
-                    instrument_product=p.instrument_product,
-                    instrument_integration_time=float(p.instrument_integration_time),
-                    instrument_band=p.instrument_band,
-                    instrument_pool_resources=p.instrument_pool_resources,
-                    lst_start_time=parse_time(p.lst_start),
-                    lst_start_end_time=parse_time(p.lst_start_end),
-                    simulated_duration=int(p.simulated_duration),
-                    night_obs=p.night_obs.lower() == "yes",
-                    avoid_sunrise_sunset=p.avoid_sunrise_sunset.lower() == "yes",
-                    minimum_antennas=int(p.minimum_antennas),
-                    general_comments=p.general_comments,
-                    scheduled_start_datetime=datetime.strptime(p.scheduled_start_datetime, "%Y-%m-%d %H:%M:%S") if p.scheduled_start_datetime else None,
-                )
-                proposals.append(proposal)
-            
-            update_global_vars(start_date=start_date, end_date=end_date, proposals=[p.to_dict() for p in proposals])
-
-            initial_individuals: list[Individual] = [
-                Individual(schedules=proposals)
-            ]
-
-            ga: Genetic_Algorithm = Genetic_Algorithm(initial_individuals=initial_individuals, num_of_individuals=10, num_of_generations=50)
-            scheduled_proposals: list[Proposal] = ga.get_best_fit_individual().schedules
-
-            # Updating each proposal's scheduled_start_datetime
-            for i, s_p in enumerate(scheduled_proposals):
-                updated_timetable.proposals[i].scheduled_start_datetime = s_p.scheduled_start_datetime.strftime("%Y-%m-%d %H:%M:%S") if s_p.scheduled_start_datetime else "" 
-
-            best_timetable: Timetable = Timetable(schedules=scheduled_proposals)
-            best_timetable.plot("_updated") # Plot raw updated timetable after genetic algorithm
-            best_timetable.remove_clashes()
-            best_timetable.plot(filename_suffix="_clash_free_updated")# Plot the updated timetable after removing clashes
-
-            timetables = [t if t.id != timetable_id else updated_timetable for t in timetables]
-
-            return updated_timetable
-    return {}
+    t: dict | None = timetable_store.get(timetable_id)
+    if t is None:
+        return {}
+
+    updated_timetable: TimetableModel = timetable.model_copy(update={"id": timetable_id})
+    start_date: date = datetime.strptime(t["start_date"], "%Y-%m-%d").date()
+    end_date: date = datetime.strptime(t["end_date"], "%Y-%m-%d").date()
+    proposals: list[Proposal] = to_proposals(timetable.proposals)
+    
+    problem: SchedulingProblem = SchedulingProblem(start_date=start_date, end_date=end_date, proposals=tuple(proposals))
+
+    # Seed the population with the edit, the previous run's population and perturbations of the edit
+    edited_individual: Individual = Individual.from_schedules(problem=problem, schedules=proposals)
+    initial_individuals: list[Individual] = warm_starts.seed(timetable_id, edited_individual, UPDATE_NUM_OF_INDIVIDUALS, np.random.default_rng())
+
+    # A warm-started population converges quickly, so it stops once it stagnates unless given limits of its own
+    stagnation_window: int | None = timetable.stagnation_window
+    if stagnation_window is None and timetable.target_fitness is None and timetable.time_budget is None:
+        stagnation_window = WARM_START_STAGNATION_WINDOW
+    stop_policies = make_stop_policies(stagnation_window=stagnation_window, target_fitness=timetable.target_fitness, time_budget=timetable.time_budget)
+    ga: Genetic_Algorithm = Genetic_Algorithm(problem=problem, initial_individuals=initial_individuals, num_of_individuals=UPDATE_NUM_OF_INDIVIDUALS, num_of_generations=num_of_generations_for(timetable), stop_policies=stop_policies)
+    best_individual: Individual = ga.run()
+    warm_starts.store(timetable_id, take_snapshot(problem, ga.individuals))
+    scheduled_proposals: list[Proposal] = best_individual.schedules
+
+    # Updating each proposal's scheduled_start_datetime
+    updated_timetable.proposals = from_proposals(scheduled_proposals)
+
+    timetable_store.replace(timetable_id, updated_timetable.model_dump())
+
+    # Plot the raw updated timetable and the timetable after removing clashes, in the background
+    if timetable.render:
+        best_timetable: Timetable = Timetable(problem=problem, genome=best_individual.genome)
+        best_timetable.remove_clashes(timetable.clash_policy)
+        render_manager.submit(timetable_id, start_date, end_date, {"": scheduled_proposals, "_clash_free": best_timetable.schedules})
+
+    return updated_timetable
 
 @app.delete(router_url_prefix+"{timetable_id}", response_model=TimetableModel)
 def delete_timetable(timetable_id: int):
@@ -259,10 +565,10 @@ def delete_timetable(timetable_id: int):
         JSON object of deleted timetable.
         If not found, returns an empty JSON object.
     """
-    global timetables
-    timetable: TimetableModel = get_timetable(timetable_id)
-    timetables = [t for t in timetables if t.id != timetable_id]
-    return timetable
+    timetable: dict | None = timetable_store.delete(timetable_id)
+    warm_starts.discard(timetable_id)
+    render_manager.discard(timetable_id)
+    return TimetableModel.model_validate(timetable) if timetable is not None else {}
 
 def main():
     uvicorn.run(app=app, host="0.0.0.0", port=8000)
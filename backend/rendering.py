@@ -0,0 +1,381 @@
+import os
+import glob
+import threading
+import multiprocessing
+import matplotlib
+from enum import Enum
+from datetime import date
+from collections import OrderedDict
+from dataclasses import replace
+from concurrent.futures import Future, ProcessPoolExecutor
+from ga import Proposal
+from ga.plotting import WeekPlot, overview_key, plan_week_plots, render_week, render_weeks
+
+CACHE_MAX_BYTES: int = 512 * 1024 * 1024  # Disk space the cached plots may take
+CACHE_MAX_ENTRIES: int = 5000  # Plots the cache may hold
+PLOTS_DIRECTORY: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "outputs", "plots")  # The render cache, wherever the API is started from
+
+class RenderStatus(str, Enum):
+    """
+    The state of the plots of a timetable.
+    """
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+def initialize_renderer() -> None:
+    """
+    Selects the non-interactive Agg backend in a render worker, which only ever writes PNG files.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    matplotlib.use("Agg")
+
+class RenderCache:
+    """
+    Keeps drawn plots on disk under the content key of their week, evicting the least recently used plots beyond a size or
+    count limit. Plots left by a previous run of the API are picked up, oldest first.
+    """
+    def __init__(self, directory: str, max_bytes: int = CACHE_MAX_BYTES, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        """
+        Initializes the RenderCache from the plots already in its directory.
+
+        Args:
+            directory (str): The directory of the cached plots.
+            max_bytes (int, optional): The disk space the plots may take. Defaults to CACHE_MAX_BYTES.
+            max_entries (int, optional): The number of plots the cache may hold. Defaults to CACHE_MAX_ENTRIES.
+
+        Returns:
+            None
+        """
+        self.directory: str = directory
+        self.max_bytes: int = max_bytes
+        self.max_entries: int = max_entries
+        self.sizes: OrderedDict[str, int] = OrderedDict()  # The size of each plot by content key, least recently used first
+        self.num_of_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.lock: threading.Lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        for path in sorted(glob.glob(os.path.join(directory, "*.png")), key=os.path.getmtime):
+            self.sizes[os.path.splitext(os.path.basename(path))[0]] = os.path.getsize(path)
+        self.num_of_bytes = sum(self.sizes.values())
+        with self.lock:
+            self.evict()
+
+    def path(self, key: str) -> str:
+        """
+        The path of a plot in the cache, whether it is cached or not.
+
+        Args:
+            key (str): The content key of the plot.
+
+        Returns:
+            str: The path of the PNG file.
+        """
+        return os.path.join(self.directory, f"{key}.png")
+
+    def lookup(self, key: str) -> bool:
+        """
+        Checks whether a plot is cached, marking it as recently used.
+
+        Args:
+            key (str): The content key of the plot.
+
+        Returns:
+            bool: True if the plot is on disk, False otherwise.
+        """
+        with self.lock:
+            if key in self.sizes and os.path.exists(self.path(key)):
+                self.sizes.move_to_end(key)
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def add(self, key: str) -> None:
+        """
+        Records a newly drawn plot, evicting the least recently used plots if the cache is over its limits.
+
+        Args:
+            key (str): The content key of the plot.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.num_of_bytes -= self.sizes.pop(key, 0)
+            self.sizes[key] = os.path.getsize(self.path(key))
+            self.num_of_bytes += self.sizes[key]
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Deletes the least recently used plots until the cache is within its limits, always keeping the latest plot. The caller
+        holds the lock.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        while len(self.sizes) > 1 and (len(self.sizes) > self.max_entries or self.num_of_bytes > self.max_bytes):
+            key, size = self.sizes.popitem(last=False)
+            self.num_of_bytes -= size
+            if os.path.exists(self.path(key)):
+                os.remove(self.path(key))
+
+class Render:
+    """
+    The weekly plots of a timetable, drawn by the render pool one week per task or found in the render cache.
+    """
+    def __init__(self, names: list[str], week_plots: list[WeekPlot], futures: list[Future]) -> None:
+        """
+        Initializes the Render.
+
+        Args:
+            names (list[str]): The file name each plot is served under for the timetable.
+            week_plots (list[WeekPlot]): The plots, whose paths are in the render cache.
+            futures (list[Future]): The task drawing each plot, already done for a cached plot.
+
+        Returns:
+            None
+        """
+        self.names: list[str] = names
+        self.week_plots: list[WeekPlot] = week_plots
+        self.futures: list[Future] = futures
+
+    @property
+    def paths(self) -> list[str]:
+        """
+        The paths of the plots in the render cache, ready or not.
+
+        Returns:
+            list[str]: The path of each plot, in order.
+        """
+        return [week_plot.path for week_plot in self.week_plots]
+
+    @property
+    def status(self) -> RenderStatus:
+        """
+        The state of the plots: failed as soon as any plot failed, ready once every plot is drawn.
+
+        Returns:
+            RenderStatus: The state of the plots.
+        """
+        if any(future.done() and (future.cancelled() or future.exception() is not None) for future in self.futures):
+            return RenderStatus.FAILED
+        if all(future.done() for future in self.futures):
+            return RenderStatus.READY
+        return RenderStatus.PENDING
+
+    @property
+    def error(self) -> str | None:
+        """
+        The error of the first failed plot.
+
+        Returns:
+            str | None: The type and message of the error, or None if no plot failed.
+        """
+        for future in self.futures:
+            if future.done() and not future.cancelled() and future.exception() is not None:
+                exception: BaseException = future.exception()
+                return f"{type(exception).__name__}: {exception}"
+        return None
+
+class RenderManager:
+    """
+    Draws the weekly plots of timetables in a pool of worker processes, off the request path. A week whose content was drawn
+    before, by any timetable, is served from the render cache, and a week being drawn for another timetable is not drawn twice.
+    """
+    def __init__(self, max_workers: int | None = None, directory: str = PLOTS_DIRECTORY, max_bytes: int = CACHE_MAX_BYTES, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        """
+        Initializes the RenderManager. The render cache is opened and the worker pool started on the first submitted render.
+
+        Args:
+            max_workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+            directory (str, optional): The directory of the render cache. Defaults to PLOTS_DIRECTORY.
+            max_bytes (int, optional): The disk space the cached plots may take. Defaults to CACHE_MAX_BYTES.
+            max_entries (int, optional): The number of plots the cache may hold. Defaults to CACHE_MAX_ENTRIES.
+
+        Returns:
+            None
+        """
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.directory: str = directory
+        self.max_bytes: int = max_bytes
+        self.max_entries: int = max_entries
+        self.cache: RenderCache | None = None
+        self.drawing: dict[str, Future] = dict()  # The plots being drawn, by content key
+        self.renders: dict[int, Render] = dict()
+        self.lock: threading.Lock = threading.Lock()
+        self.executor: ProcessPoolExecutor | None = None
+
+    def start(self) -> None:
+        """
+        Starts the worker pool if it is not running yet.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self.lock:
+            if self.cache is None:
+                self.cache = RenderCache(self.directory, self.max_bytes, self.max_entries)
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"), initializer=initialize_renderer)
+
+    def draw(self, week_plot: WeekPlot) -> tuple[WeekPlot, Future]:
+        """
+        Finds a plot in the render cache, or joins or queues the task drawing it.
+
+        Args:
+            week_plot (WeekPlot): The plot to draw.
+
+        Returns:
+            tuple[WeekPlot, Future]: The plot with its path in the render cache, and the task drawing it.
+        """
+        key: str = week_plot.content_key()
+        cached: WeekPlot = replace(week_plot, path=self.cache.path(key))
+        with self.lock:
+            future: Future | None = self.drawing.get(key)
+            if future is not None:
+                return cached, future
+            if self.cache.lookup(key):
+                future = Future()
+                future.set_result(cached.path)
+                return cached, future
+            future = self.executor.submit(render_week, cached)
+            self.drawing[key] = future
+        future.add_done_callback(lambda done: self.finish(key, done))
+        return cached, future
+
+    def finish(self, key: str, future: Future) -> None:
+        """
+        Adds a drawn plot to the render cache.
+
+        Args:
+            key (str): The content key of the plot.
+            future (Future): The task that drew it.
+
+        Returns:
+            None
+        """
+        # The plot is cached before it stops being drawn, so it is never queued twice
+        if not future.cancelled() and future.exception() is None:
+            self.cache.add(key)
+        with self.lock:
+            self.drawing.pop(key, None)
+
+    def submit(self, timetable_id: int, start_date: date, end_date: date, variants: dict[str, list[Proposal]]) -> Render:
+        """
+        Queues the plots of a timetable, one task per week not found in the render cache.
+
+        Args:
+            timetable_id (int): The id of the timetable, which names its plots.
+            start_date (date): The first date of the timetable.
+            end_date (date): The last date of the timetable.
+            variants (dict[str, list[Proposal]]): The schedules to plot, keyed by the suffix of their file names, such as
+                "" for the raw timetable and "_clash_free" for the timetable without clashes.
+
+        Returns:
+            Render: The queued render.
+        """
+        self.start()
+        planned: list[WeekPlot] = [
+            week_plot
+            for suffix, schedules in variants.items()
+            for week_plot in plan_week_plots(start_date, end_date, schedules, suffix, "")
+        ]
+        drawn: list[tuple[WeekPlot, Future]] = [self.draw(week_plot) for week_plot in planned]
+        render: Render = Render([week_plot.path for week_plot in planned], [week_plot for week_plot, _ in drawn], [future for _, future in drawn])
+        with self.lock:
+            self.renders[timetable_id] = render
+        return render
+
+    def redraw(self, render: Render, index: int) -> Future:
+        """
+        Draws a plot of a render again if it was evicted from the render cache since it was drawn.
+
+        Args:
+            render (Render): The render.
+            index (int): The position of the plot in the render.
+
+        Returns:
+            Future: The task drawing the plot, done if the plot is still cached.
+        """
+        future: Future = render.futures[index]
+        if future.done() and not future.cancelled() and future.exception() is None and not os.path.exists(render.paths[index]):
+            _, future = self.draw(render.week_plots[index])
+            render.futures[index] = future
+        return future
+
+    def overview(self, start_date: date, end_date: date, schedules: list[Proposal]) -> str:
+        """
+        Draws every week of a timetable into a single figure, or finds it in the render cache. The whole figure takes less
+        time than queueing its weeks, so it is drawn by the caller rather than by the worker pool.
+
+        Args:
+            start_date (date): The first date of the timetable.
+            end_date (date): The last date of the timetable.
+            schedules (list[Proposal]): The proposals of the timetable, carrying their scheduled start datetimes.
+
+        Returns:
+            str: The path of the PNG file in the render cache.
+        """
+        self.start()
+        week_plots: list[WeekPlot] = plan_week_plots(start_date, end_date, schedules, directory="")
+        key: str = overview_key(week_plots)
+        if not self.cache.lookup(key):
+            render_weeks(week_plots, self.cache.path(key))
+            self.cache.add(key)
+        return self.cache.path(key)
+
+    def get(self, timetable_id: int) -> Render | None:
+        """
+        Looks up the latest render of a timetable.
+
+        Args:
+            timetable_id (int): The id of the timetable.
+
+        Returns:
+            Render | None: The render, or None if the timetable was never rendered.
+        """
+        return self.renders.get(timetable_id)
+
+    def discard(self, timetable_id: int) -> None:
+        """
+        Forgets the render of a timetable, such as a deleted one. Its plots stay cached for any other timetable showing them.
+
+        Args:
+            timetable_id (int): The id of the timetable.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.renders.pop(timetable_id, None)
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker pool, dropping queued plots.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self.lock:
+            executor: ProcessPoolExecutor | None = self.executor
+            self.executor = None
+        # Cancelled plots finish under the lock, so the pool is waited for outside it
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
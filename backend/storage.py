@@ -0,0 +1,219 @@
+import os
+import sqlite3
+import threading
+from typing import Any
+
+# The fields of a timetable and of its proposals, in column order. Their values are stored as the API sends them.
+TIMETABLE_FIELDS: tuple[str, ...] = ("name", "start_date", "end_date", "stagnation_window", "target_fitness", "time_budget")
+PROPOSAL_FIELDS: tuple[str, ...] = (
+    "id", "description", "proposal_id", "owner_email", "instrument_product", "instrument_integration_time", "instrument_band",
+    "instrument_pool_resources", "lst_start", "lst_start_end", "simulated_duration", "night_obs", "avoid_sunrise_sunset",
+    "minimum_antennas", "general_comments", "scheduled_start_datetime",
+)
+
+SCHEMA: str = f"""
+CREATE TABLE IF NOT EXISTS timetables (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    stagnation_window INTEGER,
+    target_fitness REAL,
+    time_budget REAL
+);
+CREATE TABLE IF NOT EXISTS proposals (
+    timetable_id INTEGER NOT NULL REFERENCES timetables (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    {", ".join(f"{field} TEXT NOT NULL" for field in PROPOSAL_FIELDS)},
+    PRIMARY KEY (timetable_id, position)
+) WITHOUT ROWID;
+"""
+
+class TimetableStore:
+    """
+    Keeps timetables in an SQLite database. Timetables are looked up by their primary key, and their proposals live in a table
+    of their own, clustered by timetable so the proposals of a timetable are read in one range scan.
+
+    Ids are never reused, even after a timetable is deleted.
+    """
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Initializes the TimetableStore, which is opened separately so nothing is written until the owner starts it.
+
+        Args:
+            path (str, optional): The path of the database file. Defaults to ":memory:", for a store that lasts as long as the process.
+
+        Returns:
+            None
+        """
+        self.path: str = path
+        self.connection: sqlite3.Connection | None = None
+        # Requests are served from a thread pool and jobs complete on a background thread, so one connection is shared under a lock
+        self.lock: threading.Lock = threading.Lock()
+
+    def open(self) -> None:
+        """
+        Opens the database, creating its directory and tables if needed.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.path != ":memory:" and os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self.lock:
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.row_factory = sqlite3.Row
+            with self.connection:
+                self.connection.execute("PRAGMA foreign_keys = ON")
+                self.connection.executescript(SCHEMA)
+
+    def insert_proposals(self, timetable_id: int, proposals: list[dict[str, Any]]) -> None:
+        """
+        Writes the proposals of a timetable, in order. The caller holds the lock within a transaction.
+
+        Args:
+            timetable_id (int): The id of the timetable.
+            proposals (list[dict[str, Any]]): The fields of each proposal.
+
+        Returns:
+            None
+        """
+        self.connection.executemany(
+            f"INSERT INTO proposals (timetable_id, position, {', '.join(PROPOSAL_FIELDS)}) VALUES (?, ?, {', '.join('?' * len(PROPOSAL_FIELDS))})",
+            [(timetable_id, position, *(proposal[field] for field in PROPOSAL_FIELDS)) for position, proposal in enumerate(proposals)],
+        )
+
+    def read_timetables(self, rows: list[sqlite3.Row]) -> list[dict[str, Any]]:
+        """
+        Reads the proposals of timetable rows, with a single query for all of them. The caller holds the lock.
+
+        Args:
+            rows (list[sqlite3.Row]): The rows of the timetables.
+
+        Returns:
+            list[dict[str, Any]]: The fields of each timetable, including its proposals.
+        """
+        timetables: dict[int, dict[str, Any]] = {row["id"]: dict(row) | {"proposals": list()} for row in rows}
+        if timetables:
+            proposal_rows: list[sqlite3.Row] = self.connection.execute(
+                f"SELECT timetable_id, {', '.join(PROPOSAL_FIELDS)} FROM proposals WHERE timetable_id IN ({', '.join('?' * len(timetables))}) ORDER BY timetable_id, position",
+                list(timetables),
+            ).fetchall()
+            for row in proposal_rows:
+                timetables[row["timetable_id"]]["proposals"].append({field: row[field] for field in PROPOSAL_FIELDS})
+        return list(timetables.values())
+
+    def add(self, timetable: dict[str, Any]) -> dict[str, Any]:
+        """
+        Stores a new timetable under a new id.
+
+        Args:
+            timetable (dict[str, Any]): The fields of the timetable, including its proposals. Any id is ignored.
+
+        Returns:
+            dict[str, Any]: The stored timetable, with its id.
+        """
+        with self.lock, self.connection:
+            cursor: sqlite3.Cursor = self.connection.execute(
+                f"INSERT INTO timetables ({', '.join(TIMETABLE_FIELDS)}) VALUES ({', '.join('?' * len(TIMETABLE_FIELDS))})",
+                [timetable.get(field) for field in TIMETABLE_FIELDS],
+            )
+            self.insert_proposals(cursor.lastrowid, timetable["proposals"])
+        return timetable | {"id": cursor.lastrowid}
+
+    def get(self, timetable_id: int) -> dict[str, Any] | None:
+        """
+        Looks up a timetable by id.
+
+        Args:
+            timetable_id (int): The id of the timetable.
+
+        Returns:
+            dict[str, Any] | None: The fields of the timetable, including its proposals, or None if no timetable has that id.
+        """
+        with self.lock:
+            rows: list[sqlite3.Row] = self.connection.execute("SELECT * FROM timetables WHERE id = ?", (timetable_id,)).fetchall()
+            timetables: list[dict[str, Any]] = self.read_timetables(rows)
+        return timetables[0] if timetables else None
+
+    def page(self, offset: int = 0, limit: int = 100) -> list[dict[str, Any]]:
+        """
+        Reads a page of timetables, ordered by id.
+
+        Args:
+            offset (int, optional): The number of timetables to skip. Defaults to 0.
+            limit (int, optional): The maximum number of timetables to read. Defaults to 100.
+
+        Returns:
+            list[dict[str, Any]]: The fields of each timetable of the page, including its proposals.
+        """
+        with self.lock:
+            rows: list[sqlite3.Row] = self.connection.execute("SELECT * FROM timetables ORDER BY id LIMIT ? OFFSET ?", (limit, offset)).fetchall()
+            return self.read_timetables(rows)
+
+    def count(self) -> int:
+        """
+        Counts the stored timetables.
+
+        Args:
+            None
+
+        Returns:
+            int: The number of timetables.
+        """
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM timetables").fetchone()[0]
+
+    def replace(self, timetable_id: int, timetable: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Overwrites a timetable and its proposals, keeping its id.
+
+        Args:
+            timetable_id (int): The id of the timetable.
+            timetable (dict[str, Any]): The new fields of the timetable, including its proposals. Any id is ignored.
+
+        Returns:
+            dict[str, Any] | None: The stored timetable, or None if no timetable has that id.
+        """
+        with self.lock, self.connection:
+            cursor: sqlite3.Cursor = self.connection.execute(
+                f"UPDATE timetables SET {', '.join(f'{field} = ?' for field in TIMETABLE_FIELDS)} WHERE id = ?",
+                [*(timetable.get(field) for field in TIMETABLE_FIELDS), timetable_id],
+            )
+            if cursor.rowcount == 0:
+                return None
+            self.connection.execute("DELETE FROM proposals WHERE timetable_id = ?", (timetable_id,))
+            self.insert_proposals(timetable_id, timetable["proposals"])
+        return timetable | {"id": timetable_id}
+
+    def delete(self, timetable_id: int) -> dict[str, Any] | None:
+        """
+        Deletes a timetable and its proposals.
+
+        Args:
+            timetable_id (int): The id of the timetable.
+
+        Returns:
+            dict[str, Any] | None: The deleted timetable, or None if no timetable has that id.
+        """
+        with self.lock, self.connection:
+            rows: list[sqlite3.Row] = self.connection.execute("SELECT * FROM timetables WHERE id = ?", (timetable_id,)).fetchall()
+            timetables: list[dict[str, Any]] = self.read_timetables(rows)
+            self.connection.execute("DELETE FROM timetables WHERE id = ?", (timetable_id,))
+        return timetables[0] if timetables else None
+
+    def close(self) -> None:
+        """
+        Closes the database.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,35 @@
+import random
+import pytest
+from datetime import date, time
+from ga import Proposal, SchedulingProblem
+
+def make_proposals(num_of_proposals: int, seed: int = 0) -> list[Proposal]:
+    """
+    Builds a reproducible list of random proposals for tests.
+    """
+    rng = random.Random(seed)
+    proposals: list[Proposal] = []
+    for index in range(num_of_proposals):
+        lst_start_hour = rng.randint(0, 20)
+        proposals.append(Proposal(
+            id=index + 1,
+            description=f"Proposal {index + 1}",
+            proposal_id=f"SCI-{index + 1:04d}",
+            owner_email="jane.doe@sarao.ac.za",
+            instrument_product="c856M4k",
+            instrument_integration_time=8.0,
+            instrument_band="L",
+            instrument_pool_resources="cbf",
+            lst_start_time=time(lst_start_hour, rng.randint(0, 59)),
+            lst_start_end_time=time(lst_start_hour + rng.randint(1, 3), rng.randint(0, 59)),
+            simulated_duration=rng.randint(30 * 60, 5 * 3600),
+            night_obs=rng.random() < 0.3,
+            avoid_sunrise_sunset=rng.random() < 0.3,
+            minimum_antennas=40,
+            general_comments="",
+        ))
+    return proposals
+
+@pytest.fixture
+def problem() -> SchedulingProblem:
+    return SchedulingProblem(start_date=date(2024, 1, 1), end_date=date(2024, 1, 21), proposals=tuple(make_proposals(20)))
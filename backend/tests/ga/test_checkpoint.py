@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from datetime import date
+from conftest import make_proposals
+from ga import SchedulingProblem, Genetic_Algorithm, StopReason
+from ga.checkpoint import load_checkpoint
+
+def test_resumed_run_follows_the_same_trajectory(problem: SchedulingProblem, tmp_path):
+    uninterrupted = Genetic_Algorithm(problem=problem, num_of_individuals=8, num_of_generations=10, seed=5, verbose=False)
+    best_individual = uninterrupted.run()
+
+    checkpoint_path = str(tmp_path / "run.npz")
+    interrupted = Genetic_Algorithm(problem=problem, num_of_individuals=8, num_of_generations=10, seed=5, verbose=False, checkpoint_path=checkpoint_path, checkpoint_interval=3)
+    interrupted.step(7)
+    interrupted.close()  # Waits for the checkpoint of generation 6, as a restarted process would find it
+    checkpoint = load_checkpoint(checkpoint_path)
+    assert checkpoint.generation == 6
+    assert checkpoint.best_fitness == checkpoint.fitnesses.max()
+
+    resumed = Genetic_Algorithm.resume(problem, checkpoint_path, verbose=False)
+    assert resumed.generation == 6
+    # The time budget goes on from the time the run had taken, not from when it was rebuilt
+    assert resumed.elapsed == checkpoint.elapsed > 0
+    assert np.array_equal(resumed.run().genome, best_individual.genome)
+    assert all(np.array_equal(individual_1.genome, individual_2.genome) for individual_1, individual_2 in zip(uninterrupted.individuals, resumed.individuals))
+    # The finished run wrote its last generation, and no temporary file is left behind
+    assert load_checkpoint(checkpoint_path).generation == 10
+    assert [path.name for path in tmp_path.iterdir()] == ["run.npz"]
+    assert Genetic_Algorithm.resume(problem, checkpoint_path, verbose=False).stop_reason == StopReason.NUM_OF_GENERATIONS
+
+def test_checkpoint_of_another_problem_is_rejected(problem: SchedulingProblem, tmp_path):
+    checkpoint_path = str(tmp_path / "run.npz")
+    Genetic_Algorithm(problem=problem, num_of_individuals=4, num_of_generations=2, seed=0, verbose=False, checkpoint_path=checkpoint_path).run()
+    other_problem = SchedulingProblem(start_date=problem.start_date, end_date=date(2024, 1, 28), proposals=tuple(make_proposals(20)))
+    with pytest.raises(ValueError):
+        Genetic_Algorithm.resume(other_problem, checkpoint_path)
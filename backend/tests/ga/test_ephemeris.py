@@ -0,0 +1,29 @@
+from datetime import date, time, timedelta
+from ga.ephemeris import EphemerisTable
+from ga.utils import lst_to_utc, get_sunrise_sunset, get_night_window
+
+def test_ephemeris_table_matches_utils():
+    table = EphemerisTable(date(2025, 1, 1), date(2025, 12, 31))
+    for day in (date(2025, 1, 1) + timedelta(days=offset) for offset in range(0, 365, 7)):
+        for lst_time in (time(0, 0, 0), time(9, 25, 7), time(23, 59, 59)):
+            assert table.lst_to_utc(day, lst_time) == lst_to_utc(day, lst_time)
+        assert table.sunrise_sunset(day) == get_sunrise_sunset(day)
+        assert table.night_window(day) == get_night_window(day)
+
+def test_ephemeris_table_falls_back_outside_its_dates():
+    table = EphemerisTable(date(2025, 1, 1), date(2025, 1, 7))
+
+    assert table.lst_to_utc(date(2024, 10, 14), time(11, 11, 43)) == lst_to_utc(date(2024, 10, 14), time(11, 11, 43))
+    assert table.sunrise_sunset(date(2025, 6, 21)) == get_sunrise_sunset(date(2025, 6, 21))
+    assert table.misses == 2
+
+def test_lst_cache_is_bounded_and_reports_hit_rate():
+    table = EphemerisTable(date(2025, 1, 1), date(2025, 1, 7), lst_cache_size=2)
+    for _ in range(3):
+        table.lst_to_utc(date(2025, 1, 1), time(1, 0, 0))
+    table.lst_to_utc(date(2025, 1, 2), time(1, 0, 0))
+    table.lst_to_utc(date(2025, 1, 3), time(1, 0, 0))
+
+    assert len(table.lst_cache) == 2
+    assert (table.hits, table.misses) == (2, 3)
+    assert table.hit_rate == 0.4
@@ -0,0 +1,49 @@
+import numpy as np
+from datetime import date, time
+from conftest import make_proposals
+from ga import SchedulingProblem
+from ga.feasibility import FeasibleStarts
+
+def test_feasible_starts_sample_and_contain():
+    feasible_starts = FeasibleStarts(np.array([0, 20], dtype=np.int64), np.array([10, 30], dtype=np.int64))
+    assert feasible_starts.total == 22
+    assert feasible_starts.intervals == [(0, 10), (20, 30)]
+    assert [feasible_starts.contains(offset) for offset in (-1, 0, 10, 11, 19, 20, 30, 31)] == [False, True, True, False, False, True, True, False]
+    rng = np.random.default_rng(0)
+    assert all(feasible_starts.contains(feasible_starts.sample(rng)) for _ in range(100))
+
+def test_sampled_starts_meet_all_constraints(problem: SchedulingProblem):
+    rng = np.random.default_rng(0)
+    for proposal, feasible_starts in zip(problem.proposals, problem.feasible_starts):
+        for _ in range(50):
+            offset = feasible_starts.sample(rng)
+            if feasible_starts.total == 0:
+                assert offset is None
+                break
+            assert proposal.all_constraints_met(problem.to_datetime(offset))
+
+def test_feasible_starts_match_constraint_checks(problem: SchedulingProblem):
+    for proposal, feasible_starts in zip(problem.proposals, problem.feasible_starts):
+        offsets = set(range(0, problem.num_of_days * 86400, 900))
+        for lower, upper in feasible_starts.intervals:
+            offsets.update((lower - 1, lower, upper, upper + 1))
+        for offset in sorted(offset for offset in offsets if offset >= 0):
+            assert feasible_starts.contains(offset) == proposal.all_constraints_met(problem.to_datetime(offset)), (proposal.id, offset)
+
+def test_feasible_starts_split_around_sunrise_and_sunset():
+    proposals = make_proposals(12, seed=3)
+    for index, proposal in enumerate(proposals):
+        proposal.avoid_sunrise_sunset = True
+        proposal.night_obs = index % 3 == 0
+        proposal.lst_start_time = time(2 * index, 0)
+        proposal.lst_start_end_time = time(min(2 * index + 11, 23), 30)
+        proposal.simulated_duration = 60 + index * 7
+    problem = SchedulingProblem(start_date=date(2024, 6, 1), end_date=date(2024, 6, 4), proposals=tuple(proposals))
+    # Some windows contain sunrise or sunset, and are split in more than one interval a day
+    assert max(len(feasible_starts.intervals) for feasible_starts in problem.feasible_starts) > problem.num_of_days
+    for proposal, feasible_starts in zip(problem.proposals, problem.feasible_starts):
+        offsets = set(range(0, problem.num_of_days * 86400, 600))
+        for lower, upper in feasible_starts.intervals:
+            offsets.update((lower - 1, lower, upper, upper + 1))
+        for offset in sorted(offset for offset in offsets if offset >= 0):
+            assert feasible_starts.contains(offset) == proposal.all_constraints_met(problem.to_datetime(offset)), (proposal.id, offset)
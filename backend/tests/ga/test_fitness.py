@@ -0,0 +1,144 @@
+import pytest
+import numpy as np
+from datetime import date, timedelta
+from ga import SchedulingProblem, Individual, Proposal, Genetic_Algorithm
+from ga.problem import UNSCHEDULED
+from ga.fitness import pairwise_clash_time, clash_statistics, genome_fitness, FitnessCache, IncrementalFitness, evaluate_population
+from conftest import make_proposals
+
+def reference_fitness(schedules: list[Proposal]) -> tuple[float, float, int]:
+    """
+    The original O(n^2) fitness formula over Proposal objects, also returning its clash and unscheduled accounting.
+    """
+    total_proposal_duration: int = 0
+    total_clash_time: float = 0
+    total_unscheduled_time: int = 0
+    num_scheduled_proposals: int = 0
+
+    for proposal in schedules:
+        total_proposal_duration += proposal.simulated_duration
+        if proposal.scheduled_start_datetime is not None:
+            num_scheduled_proposals += 1
+            for another_proposal in schedules:
+                if (proposal.id != another_proposal.id):
+                    if another_proposal.scheduled_start_datetime is not None:
+                        proposal_end_datetime = proposal.scheduled_start_datetime + timedelta(seconds=proposal.simulated_duration)
+                        another_proposal_end_datetime = another_proposal.scheduled_start_datetime + timedelta(seconds=another_proposal.simulated_duration)
+                        max_start = max(proposal.scheduled_start_datetime, another_proposal.scheduled_start_datetime)
+                        min_end = min(proposal_end_datetime, another_proposal_end_datetime)
+                        total_clash_time += max(0, (min_end - max_start).total_seconds())
+                    else:
+                        total_unscheduled_time += proposal.simulated_duration
+        else:
+            total_unscheduled_time += proposal.simulated_duration
+
+    if num_scheduled_proposals == 0:
+        return 0.0, total_clash_time, total_unscheduled_time
+    score = ((total_proposal_duration - total_clash_time) / (total_proposal_duration)) * (0.95 ** (len(schedules) - num_scheduled_proposals))
+    return score, total_clash_time, total_unscheduled_time
+
+@pytest.mark.parametrize("seed", range(20))
+def test_sweep_matches_reference_on_random_genomes(seed: int):
+    rng = np.random.default_rng(seed)
+    num_of_proposals = int(rng.integers(1, 60))
+    proposals = make_proposals(num_of_proposals, seed=seed)
+    for proposal in proposals:
+        proposal.simulated_duration = int(rng.choice([0, rng.integers(60, 8 * 3600)]))
+        if rng.random() < 0.2:
+            proposal.id = int(rng.integers(1, 4))  # Duplicate ids never clash with each other
+    problem = SchedulingProblem(start_date=date(2024, 1, 1), end_date=date(2024, 1, 3), proposals=tuple(proposals))
+    genome = rng.integers(0, 3 * 86400, size=num_of_proposals)
+    genome[rng.random(num_of_proposals) < rng.random()] = UNSCHEDULED
+    individual = Individual(problem, genome)
+
+    score, total_clash_time, total_unscheduled_time = reference_fitness(individual.schedules)
+
+    assert clash_statistics(problem, genome)[:2] == (total_clash_time, total_unscheduled_time)
+    assert individual.compute_fitness() == score
+
+def test_pairwise_clash_time_counts_every_ordered_pair():
+    starts = np.array([0, 5, 5, 20], dtype=np.int64)
+    ends = np.array([10, 15, 6, 30], dtype=np.int64)
+
+    # Overlaps: (0,1)=5, (0,2)=1, (1,2)=1, each counted in both orders
+    assert pairwise_clash_time(starts, ends) == 2 * (5 + 1 + 1)
+
+def test_fitness_is_memoized_until_a_gene_changes(problem: SchedulingProblem):
+    fitness_cache = FitnessCache()
+    genome = np.arange(problem.num_of_proposals, dtype=np.int64) * 600
+    individual = Individual(problem, genome, fitness_cache=fitness_cache)
+
+    first_score = individual.compute_fitness()
+    assert individual.compute_fitness() == first_score
+    individual.set_gene(0, int(genome[0]))  # Assigning the same value keeps the memo
+    individual.compute_fitness()
+    assert (fitness_cache.memo_hits, fitness_cache.misses) == (2, 1)
+
+    individual.set_gene(0, UNSCHEDULED)
+    assert individual.compute_fitness() == genome_fitness(problem, individual.genome)
+    assert fitness_cache.misses == 2
+    assert genome[0] == 0  # The shared genome is copied on write
+
+def test_duplicate_genomes_are_scored_once(problem: SchedulingProblem):
+    fitness_cache = FitnessCache()
+    genome = np.arange(problem.num_of_proposals, dtype=np.int64) * 600
+    individuals = [Individual(problem, genome.copy(), fitness_cache=fitness_cache) for _ in range(4)]
+
+    scores = {individual.compute_fitness() for individual in individuals}
+
+    assert len(scores) == 1
+    assert (fitness_cache.hits, fitness_cache.misses) == (3, 1)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_fitness_matches_full_recompute(seed: int):
+    rng = np.random.default_rng(seed)
+    proposals = make_proposals(40, seed=seed)
+    for proposal in proposals[:5]:
+        proposal.id = 1
+    problem = SchedulingProblem(start_date=date(2024, 1, 1), end_date=date(2024, 1, 3), proposals=tuple(proposals))
+    genome = rng.integers(0, 2 * 86400, size=40)
+    genome[rng.random(40) < 0.3] = UNSCHEDULED
+    tracker = IncrementalFitness(problem, genome)
+
+    for _ in range(200):
+        position = int(rng.integers(40))
+        genome[position] = UNSCHEDULED if rng.random() < 0.3 else int(rng.integers(0, 2 * 86400))
+        tracker.update(position, int(genome[position]))
+        assert tracker.total_clash_time == clash_statistics(problem, genome)[0]
+
+    assert tracker.score() == pytest.approx(genome_fitness(problem, genome))
+
+def test_offspring_tracks_fitness_from_closest_parent(problem: SchedulingProblem):
+    parent_genome = np.arange(problem.num_of_proposals, dtype=np.int64) * 1800
+    parent = Individual(problem, parent_genome)
+    offspring = Individual(problem, parent_genome.copy())
+    offspring.set_gene(0, UNSCHEDULED)
+
+    offspring.track_fitness([parent])
+    offspring.mutation(mutation_rate=0.2, rng=np.random.default_rng(0))
+
+    assert offspring.compute_fitness() == pytest.approx(genome_fitness(problem, offspring.genome))
+
+def test_population_evaluation_matches_each_individual():
+    rng = np.random.default_rng(7)
+    proposals = make_proposals(30, seed=7)
+    for proposal in proposals[:4]:
+        proposal.id = 2
+    problem = SchedulingProblem(start_date=date(2024, 1, 1), end_date=date(2024, 1, 3), proposals=tuple(proposals))
+    genomes = rng.integers(0, 2 * 86400, size=(25, 30))
+    genomes[rng.random(genomes.shape) < 0.4] = UNSCHEDULED
+    genomes[0] = UNSCHEDULED
+
+    scores = evaluate_population(problem, genomes)
+
+    assert scores.tolist() == [genome_fitness(problem, genome) for genome in genomes]
+
+def test_genetic_algorithm_ranks_population_from_batch_scores(problem: SchedulingProblem):
+    ga = Genetic_Algorithm(problem=problem, num_of_individuals=6, num_of_generations=3, seed=0)
+    ga.run()
+    ga.rank()
+
+    fitnesses = [individual.compute_fitness() for individual in ga.individuals]
+
+    assert fitnesses == sorted(fitnesses, reverse=True)
+    assert fitnesses == [genome_fitness(problem, individual.genome) for individual in ga.individuals]
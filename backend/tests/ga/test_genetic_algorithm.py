@@ -0,0 +1,43 @@
+import numpy as np
+from datetime import date
+from conftest import make_proposals
+from ga import SchedulingProblem, Genetic_Algorithm
+
+def test_seeded_runs_are_reproducible(problem: SchedulingProblem):
+    ga_1 = Genetic_Algorithm(problem=problem, num_of_individuals=8, num_of_generations=5, seed=3, verbose=False)
+    ga_1.run()
+    ga_2 = Genetic_Algorithm(problem=problem, num_of_individuals=8, num_of_generations=5, seed=3, verbose=False)
+    ga_2.run()
+    assert all(np.array_equal(individual_1.genome, individual_2.genome) for individual_1, individual_2 in zip(ga_1.individuals, ga_2.individuals))
+
+def test_parallel_breeding_matches_serial_breeding():
+    problem = SchedulingProblem(start_date=date(2024, 1, 1), end_date=date(2024, 1, 14), proposals=tuple(make_proposals(40, seed=5)))
+    serial = Genetic_Algorithm(problem=problem, num_of_individuals=12, num_of_generations=6, seed=11, verbose=False)
+    serial.run()
+    parallel = Genetic_Algorithm(problem=problem, num_of_individuals=12, num_of_generations=6, seed=11, verbose=False, num_of_workers=2)
+    parallel.run()
+    assert parallel.offspring_executor is None  # The pool only lives for the run
+    assert [individual.compute_fitness() for individual in parallel.individuals] == [individual.compute_fitness() for individual in serial.individuals]
+    assert all(np.array_equal(individual_1.genome, individual_2.genome) for individual_1, individual_2 in zip(serial.individuals, parallel.individuals))
+    # Offspring scored by the workers are accounted for by the run's cache
+    assert parallel.fitness_cache.num_scored == serial.fitness_cache.num_scored
+
+def test_construction_does_not_evolve(problem: SchedulingProblem):
+    ga = Genetic_Algorithm(problem=problem, num_of_individuals=6, num_of_generations=5, seed=2, verbose=False)
+    assert ga.generation == 0 and not ga.finished and ga.stop_reason is None
+    assert Genetic_Algorithm(problem=problem, num_of_individuals=6, num_of_generations=0, verbose=False).finished
+
+def test_stepping_and_iterating_follow_the_same_trajectory_as_run(problem: SchedulingProblem):
+    ran = Genetic_Algorithm(problem=problem, num_of_individuals=8, num_of_generations=9, seed=7, verbose=False)
+    best_individual = ran.run()
+
+    stepped = Genetic_Algorithm(problem=problem, num_of_individuals=8, num_of_generations=9, seed=7, verbose=False)
+    assert stepped.step(2).generation == 2
+    for event in stepped.iterate():
+        if event.generation == 5:
+            break  # Pauses the run
+    assert stepped.generation == 5 and not stepped.finished
+    assert [event.generation for event in stepped.iterate()] == [6, 7, 8, 9]
+    assert stepped.finished and stepped.step() is None
+    assert np.array_equal(stepped.get_best_fit_individual().genome, best_individual.genome)
+    assert all(np.array_equal(individual_1.genome, individual_2.genome) for individual_1, individual_2 in zip(ran.individuals, stepped.individuals))
@@ -0,0 +1,35 @@
+import numpy as np
+from datetime import datetime
+from ga import SchedulingProblem, Individual
+from ga.problem import UNSCHEDULED
+
+def test_genome_round_trips_through_schedules(problem: SchedulingProblem):
+    genome = np.full(problem.num_of_proposals, UNSCHEDULED, dtype=np.int64)
+    genome[0] = 3600
+    genome[3] = 2 * 86400 + 59
+
+    schedules = Individual(problem, genome).schedules
+
+    assert schedules[0].scheduled_start_datetime == datetime(2024, 1, 1, 1, 0, 0)
+    assert schedules[3].scheduled_start_datetime == datetime(2024, 1, 3, 0, 0, 59)
+    assert schedules[1].scheduled_start_datetime is None
+    assert np.array_equal(Individual.from_schedules(problem, schedules).genome, genome)
+
+def test_crossover_takes_every_gene_from_a_parent(problem: SchedulingProblem):
+    rng = np.random.default_rng(0)
+    parent_1 = Individual(problem, np.arange(problem.num_of_proposals, dtype=np.int64))
+    parent_2 = Individual(problem, np.full(problem.num_of_proposals, UNSCHEDULED, dtype=np.int64))
+
+    offspring_genome = parent_1.crossover(parent_2.genome, rng=rng)
+
+    assert offspring_genome.dtype == np.int64
+    assert np.all((offspring_genome == parent_1.genome) | (offspring_genome == parent_2.genome))
+
+def test_mutation_does_not_modify_shared_genome(problem: SchedulingProblem):
+    genome = np.arange(problem.num_of_proposals, dtype=np.int64) * 3600
+    individual = Individual(problem, genome)
+
+    individual.mutation(mutation_rate=0.5, rng=np.random.default_rng(1))
+
+    assert np.array_equal(genome, np.arange(problem.num_of_proposals, dtype=np.int64) * 3600)
+    assert np.count_nonzero(individual.genome != genome) <= problem.num_of_proposals // 2
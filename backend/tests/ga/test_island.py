@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from ga import SchedulingProblem, IslandModel
+from ga.fitness import genome_fitness
+
+def test_ring_migration_replaces_least_fit_genomes(problem: SchedulingProblem):
+    island_model = IslandModel(problem, num_of_islands=3, num_of_individuals=4, num_of_migrants=2, topology="ring", seed=0)
+    island_model.islands = [np.full((4, problem.num_of_proposals), island * 10, dtype=np.int64) + np.arange(4)[:, None] for island in range(3)]
+    island_model.fitnesses = [np.linspace(1.0, 0.0, 4) for _ in range(3)]
+    island_model.migrate()
+    # Island 1 keeps its two fittest genomes and receives the two fittest of island 0
+    assert island_model.islands[1][:, 0].tolist() == [10, 11, 0, 1]
+    assert island_model.islands[0][:, 0].tolist() == [0, 1, 20, 21]
+    assert np.isnan(island_model.fitnesses[2][2:]).all()
+
+def test_random_topology_never_sends_to_itself(problem: SchedulingProblem):
+    island_model = IslandModel(problem, num_of_islands=5, topology="random", seed=1)
+    for _ in range(20):
+        assert all(destination != island for island, destination in enumerate(island_model.destinations()))
+
+def test_unknown_topology_is_rejected(problem: SchedulingProblem):
+    with pytest.raises(ValueError):
+        IslandModel(problem, topology="star")
+
+def test_best_individual_needs_a_run(problem: SchedulingProblem):
+    with pytest.raises(RuntimeError, match="run"):
+        IslandModel(problem).get_best_fit_individual()
+
+def test_islands_return_the_global_best(problem: SchedulingProblem):
+    serial = IslandModel(problem, num_of_islands=3, num_of_individuals=6, num_of_generations=7, migration_interval=3, seed=4, num_of_workers=1)
+    best_individual = serial.run()
+    assert best_individual.compute_fitness() == max(fitnesses.max() for fitnesses in serial.fitnesses)
+    assert best_individual.compute_fitness() == pytest.approx(genome_fitness(problem, best_individual.genome))
+    # Islands evolving in worker processes follow the same trajectory
+    parallel = IslandModel(problem, num_of_islands=3, num_of_individuals=6, num_of_generations=7, migration_interval=3, seed=4, num_of_workers=2)
+    assert np.array_equal(parallel.run().genome, best_individual.genome)
+    assert all(np.array_equal(genomes_1, genomes_2) for genomes_1, genomes_2 in zip(serial.islands, parallel.islands))
@@ -0,0 +1,48 @@
+import dataclasses
+import pickle
+import pytest
+from datetime import date, datetime
+from ga import SchedulingProblem, Individual, Genetic_Algorithm
+from conftest import make_proposals
+
+def test_problem_is_immutable(problem: SchedulingProblem):
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        problem.start_date = date(2025, 1, 1)
+
+def test_problem_detaches_proposals_from_caller():
+    proposals = make_proposals(3)
+    proposals[0].scheduled_start_datetime = datetime(2024, 1, 2, 3, 0, 0)
+    problem = SchedulingProblem(start_date=date(2024, 1, 1), end_date=date(2024, 1, 7), proposals=tuple(proposals))
+
+    assert all(p.scheduled_start_datetime is None for p in problem.proposals)
+    assert proposals[0].scheduled_start_datetime == datetime(2024, 1, 2, 3, 0, 0)
+    assert problem.total_duration == sum(p.simulated_duration for p in proposals)
+    assert problem.num_of_days == 7
+
+def test_individuals_share_problem_without_touching_its_proposals(problem: SchedulingProblem):
+    individuals = [Individual(problem) for _ in range(5)]
+
+    assert all(individual.problem is problem for individual in individuals)
+    assert all(p.scheduled_start_datetime is None for p in problem.proposals)
+
+def test_concurrent_problems_do_not_interfere():
+    problem_1 = SchedulingProblem(start_date=date(2024, 1, 1), end_date=date(2024, 1, 7), proposals=tuple(make_proposals(5, seed=1)))
+    problem_2 = SchedulingProblem(start_date=date(2025, 6, 1), end_date=date(2025, 6, 7), proposals=tuple(make_proposals(8, seed=2)))
+
+    ga_1 = Genetic_Algorithm(problem=problem_1, num_of_individuals=4, num_of_generations=2)
+
+    ga_1.run()
+    ga_2 = Genetic_Algorithm(problem=problem_2, num_of_individuals=4, num_of_generations=2)
+    ga_2.run()
+
+    assert len(ga_1.get_best_fit_individual().schedules) == 5
+    assert len(ga_2.get_best_fit_individual().schedules) == 8
+
+def test_ephemeris_cache_stays_with_its_process(problem: SchedulingProblem):
+    problem.constraints_met(0, 3600)
+    assert problem.ephemeris.hits + problem.ephemeris.misses > 0 and len(problem.ephemeris.lst_cache) > 0
+    # A worker receives the problem without the cache and counters of the parent
+    copy = pickle.loads(pickle.dumps(problem))
+    assert (copy.ephemeris.hits, copy.ephemeris.misses, len(copy.ephemeris.lst_cache)) == (0, 0, 0)
+    assert copy.ephemeris.night_windows == problem.ephemeris.night_windows and len(problem.ephemeris.lst_cache) > 0
+    assert "ephemeris" not in repr(problem)
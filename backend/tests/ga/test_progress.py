@@ -0,0 +1,34 @@
+from ga import SchedulingProblem, Genetic_Algorithm, ProgressEvent, ThrottledProgress, StopReason
+
+def make_event(generation: int, num_of_generations: int = 10) -> ProgressEvent:
+    stop_reason = StopReason.NUM_OF_GENERATIONS if generation == num_of_generations else None
+    return ProgressEvent(generation=generation, num_of_generations=num_of_generations, best_fitness=0.9, median_fitness=0.5, worst_fitness=0.1, num_scored=4, elapsed=0.0, stop_reason=stop_reason)
+
+def test_genetic_algorithm_reports_every_generation(problem: SchedulingProblem):
+    events: list[ProgressEvent] = []
+    ga = Genetic_Algorithm(problem=problem, num_of_individuals=6, num_of_generations=4, seed=0, progress_callback=events.append, verbose=False)
+    ga.run()
+    assert [event.generation for event in events] == [1, 2, 3, 4]
+    for event in events:
+        assert event.num_of_generations == 4
+        assert event.worst_fitness <= event.median_fitness <= event.best_fitness
+    # The first generation scores the whole population, later ones only the offspring
+    assert events[0].num_scored == 6
+    assert all(event.num_scored > 0 for event in events[1:])
+    assert [event.elapsed for event in events] == sorted(event.elapsed for event in events)
+    assert [event.stop_reason for event in events] == [None, None, None, StopReason.NUM_OF_GENERATIONS]
+    assert ga.num_of_generations == 4
+
+def test_throttled_progress_forwards_first_and_last_events():
+    forwarded: list[ProgressEvent] = []
+    throttled = ThrottledProgress(forwarded.append, min_interval=60.0)
+    for generation in range(1, 11):
+        throttled(make_event(generation))
+    assert [event.generation for event in forwarded] == [1, 10]
+
+def test_throttled_progress_without_interval_forwards_everything():
+    forwarded: list[ProgressEvent] = []
+    throttled = ThrottledProgress(forwarded.append, min_interval=0.0)
+    for generation in range(1, 6):
+        throttled(make_event(generation, 5))
+    assert len(forwarded) == 5
@@ -0,0 +1,41 @@
+import copy
+import numpy as np
+from datetime import date, time
+from conftest import make_proposals
+from ga import Genetic_Algorithm, Individual, SchedulingProblem
+from ga.fitness import clash_statistics
+from ga.problem import UNSCHEDULED
+from ga.repair import RepairOperator
+
+def test_repair_removes_every_clash_with_feasible_starts(problem: SchedulingProblem):
+    repair_operator = RepairOperator(problem)
+    rng = np.random.default_rng(4)
+    for _ in range(10):
+        individual = Individual(problem, rng=rng)
+        clash_time, _, num_scheduled = clash_statistics(problem, individual.genome)
+        repair_operator.repair(individual)
+        genome = individual.genome
+        scheduled = np.flatnonzero(genome != UNSCHEDULED)
+        assert clash_statistics(problem, genome)[0] == 0
+        assert all(problem.feasible_starts[position].contains(int(genome[position])) for position in scheduled.tolist())
+    assert repair_operator.num_of_repairs == 10 and repair_operator.num_shifted > 0
+
+def test_clashing_proposal_moves_to_the_nearest_free_start(problem: SchedulingProblem):
+    proposal = copy.copy(problem.proposals[0])
+    proposal.lst_start_time, proposal.lst_start_end_time, proposal.simulated_duration = time(10, 0), time(13, 0), 1800
+    proposal.night_obs, proposal.avoid_sunrise_sunset = False, False
+    clone = SchedulingProblem(start_date=problem.start_date, end_date=problem.end_date, proposals=(proposal,) * 2)
+    lower = next(lower for lower, upper in clone.feasible_starts[0].intervals if upper - lower > 2 * clone.durations[0])
+    individual = Individual(clone, np.array([lower, lower + 60], dtype=np.int64))
+    RepairOperator(clone).repair(individual)
+    assert individual.genome.tolist() == [lower, lower + int(clone.durations[0])]
+
+def test_repair_is_applied_in_evolution_and_profiled(capsys):
+    problem = SchedulingProblem(start_date=date(2024, 1, 1), end_date=date(2024, 1, 3), proposals=tuple(make_proposals(30, seed=2)))
+    plain = Genetic_Algorithm(problem=problem, num_of_individuals=10, num_of_generations=15, seed=1, verbose=False).run()
+    repaired = Genetic_Algorithm(problem=problem, num_of_individuals=10, num_of_generations=15, seed=1, repair_rate=1.0)
+    best = repaired.run()
+    assert repaired.repair_operator.num_of_repairs > 0
+    assert best.compute_fitness() >= plain.compute_fitness()
+    assert "Repair: " in capsys.readouterr().out
+    assert Genetic_Algorithm(problem=problem, num_of_individuals=4, num_of_generations=2, verbose=False).repair_operator is None
@@ -0,0 +1,50 @@
+import time
+import pytest
+from ga import SchedulingProblem, Genetic_Algorithm, ProgressEvent, StopReason, StopPolicy, StagnationStop, TargetFitnessStop, TimeBudgetStop, make_stop_policies
+
+def make_event(generation: int, best_fitness: float, elapsed: float = 0.0) -> ProgressEvent:
+    return ProgressEvent(generation=generation, num_of_generations=100, best_fitness=best_fitness, median_fitness=0.0, worst_fitness=0.0, num_scored=1, elapsed=elapsed)
+
+def test_stagnation_stop_waits_for_a_full_window():
+    stop_policy = StagnationStop(window=3)
+    assert [stop_policy.should_stop(make_event(generation, best_fitness)) for generation, best_fitness in enumerate([0.1, 0.2, 0.2, 0.2, 0.3, 0.3, 0.3, 0.3], start=1)] == [False, False, False, False, False, False, False, True]
+
+def test_target_and_time_budget_stops():
+    assert not TargetFitnessStop(1.0).should_stop(make_event(1, 0.99))
+    assert TargetFitnessStop(1.0).should_stop(make_event(1, 1.0))
+    assert not TimeBudgetStop(5.0).should_stop(make_event(1, 0.5, elapsed=4.9))
+    assert TimeBudgetStop(5.0).should_stop(make_event(1, 0.5, elapsed=5.0))
+    assert [stop_policy.reason for stop_policy in make_stop_policies(stagnation_window=10, target_fitness=1.0, time_budget=5.0)] == [StopReason.STAGNATION, StopReason.TARGET_FITNESS, StopReason.TIME_BUDGET]
+
+def test_run_records_the_policy_that_ended_it(problem: SchedulingProblem):
+    events: list[ProgressEvent] = []
+    ga = Genetic_Algorithm(problem=problem, num_of_individuals=6, num_of_generations=1000, seed=0, verbose=False, progress_callback=events.append, stop_policies=[StagnationStop(window=5)])
+    ga.run()
+    assert ga.stop_reason == StopReason.STAGNATION
+    assert len(events) < 1000
+    assert events[-1].stop_reason is StopReason.STAGNATION
+
+    ga = Genetic_Algorithm(problem=problem, num_of_individuals=6, num_of_generations=100000, seed=0, verbose=False, stop_policies=[TimeBudgetStop(0.2)])
+
+    ga.run()
+    assert ga.stop_reason == StopReason.TIME_BUDGET
+
+    ga = Genetic_Algorithm(problem=problem, num_of_individuals=6, num_of_generations=3, seed=0, verbose=False, stop_policies=[TargetFitnessStop(1.1)])
+
+    ga.run()
+    assert ga.stop_reason == StopReason.NUM_OF_GENERATIONS
+
+def test_time_budget_only_counts_evolution(problem: SchedulingProblem):
+    ga = Genetic_Algorithm(problem=problem, num_of_individuals=6, num_of_generations=100, seed=0, verbose=False, stop_policies=[TimeBudgetStop(0.2)])
+    # A run built ahead of time keeps its whole budget
+    time.sleep(0.3)
+    assert ga.elapsed == 0.0
+    event = ga.step()
+    assert event.stop_reason is None and event.elapsed < 0.2
+
+def test_incomplete_policy_fails_when_constructed():
+    class IncompletePolicy(StopPolicy):
+        reason = StopReason.STAGNATION
+
+    with pytest.raises(TypeError):
+        IncompletePolicy()
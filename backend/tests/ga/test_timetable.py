@@ -0,0 +1,92 @@
+import itertools
+import numpy as np
+import pytest
+from ga import Timetable
+from ga.clashes import ClashPolicy, resolve_clashes
+from ga.problem import UNSCHEDULED
+
+def first_wins(starts: list[int], durations: list[int]) -> list[bool]:
+    """
+    Keeps each interval unless an earlier-listed kept interval overlaps it, comparing every pair.
+    """
+    kept: list[bool] = []
+    for i in range(len(starts)):
+        kept.append(not any(
+            kept[j] and (starts[j] <= starts[i] < starts[j] + durations[j] or starts[i] <= starts[j] < starts[i] + durations[i])
+            for j in range(i)
+        ))
+    return kept
+
+def overlaps(starts: np.ndarray, durations: np.ndarray, kept: np.ndarray) -> bool:
+    order = np.argsort(starts[kept])
+    return bool(np.any((starts[kept][order] + durations[kept][order])[:-1] > starts[kept][order][1:]))
+
+@pytest.mark.parametrize("seed", range(5))
+def test_first_wins_keeps_the_earlier_listed_proposal(seed: int):
+    rng = np.random.default_rng(seed)
+    starts, durations = rng.integers(0, 100_000, 300), rng.integers(1_800, 18_000, 300)
+    assert resolve_clashes(starts, durations).tolist() == first_wins(starts.tolist(), durations.tolist())
+
+def test_empty_proposals_clash_only_with_proposals_that_take_time():
+    # Empty proposals starting together never clash, while one starting with or inside a longer proposal does
+    starts, durations = np.array([0, 0, 100, 100, 50, 300, 300]), np.array([0, 0, 200, 0, 0, 0, 60])
+    assert resolve_clashes(starts, durations).tolist() == first_wins(starts.tolist(), durations.tolist()) == [True, True, True, False, True, True, False]
+    rng = np.random.default_rng(0)
+    starts, durations = rng.integers(0, 50, 200), rng.integers(0, 3, 200) * rng.integers(0, 20, 200)
+    assert resolve_clashes(starts, durations).tolist() == first_wins(starts.tolist(), durations.tolist())
+
+def test_highest_score_keeps_the_better_proposal():
+    starts, durations = np.array([0, 100, 250, 400]), np.array([200, 200, 100, 100])
+    assert resolve_clashes(starts, durations, ClashPolicy.HIGHEST_SCORE, np.array([1.0, 3.0, 2.0, 0.0])).tolist() == [False, True, False, True]
+    assert resolve_clashes(starts, durations, ClashPolicy.HIGHEST_SCORE, np.zeros(4)).tolist() == resolve_clashes(starts, durations).tolist()
+    with pytest.raises(ValueError):
+        resolve_clashes(starts, durations, ClashPolicy.HIGHEST_SCORE)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_max_duration_finds_the_fullest_selection(seed: int):
+    rng = np.random.default_rng(seed)
+    starts, durations = rng.integers(0, 200, 12), rng.integers(10, 60, 12)
+    kept = resolve_clashes(starts, durations, ClashPolicy.MAX_DURATION)
+    best = max(
+        durations[list(subset)].sum()
+        for size in range(len(starts) + 1) for subset in itertools.combinations(range(len(starts)), size)
+        if not overlaps(starts, durations, np.isin(np.arange(len(starts)), subset))
+    )
+    assert not overlaps(starts, durations, kept) and durations[kept].sum() == best
+    assert durations[kept].sum() >= durations[resolve_clashes(starts, durations)].sum()
+
+def clashes(starts: list[int], durations: list[int], i: int, j: int) -> bool:
+    return starts[j] <= starts[i] < starts[j] + durations[j] or starts[i] <= starts[j] < starts[i] + durations[i]
+
+def test_max_duration_keeps_empty_proposals_that_clash_with_nothing():
+    assert resolve_clashes(np.array([0, 100, 500]), np.array([50, 0, 0]), ClashPolicy.MAX_DURATION).tolist() == [True, True, True]
+    # An empty proposal starting with or inside a kept one still clashes with it, while one at its end does not
+    assert resolve_clashes(np.array([0, 0, 20, 50]), np.array([50, 0, 0, 0]), ClashPolicy.MAX_DURATION).tolist() == [True, False, False, True]
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        starts, durations = rng.integers(0, 30, 10).tolist(), (rng.integers(0, 2, 10) * rng.integers(1, 10, 10)).tolist()
+        kept = resolve_clashes(np.array(starts), np.array(durations), ClashPolicy.MAX_DURATION).tolist()
+        assert not any(kept[i] and kept[j] and clashes(starts, durations, i, j) for i in range(10) for j in range(i))
+        assert all(kept[i] or any(kept[j] and clashes(starts, durations, i, j) for j in range(10)) for i in range(10) if durations[i] == 0)
+        best = max(
+            sum(durations[i] for i in subset)
+            for size in range(11) for subset in itertools.combinations(range(10), size)
+            if not any(clashes(starts, durations, i, j) for i, j in itertools.combinations(subset, 2))
+        )
+        assert sum(duration for duration, keep in zip(durations, kept) if keep) == best
+
+def test_remove_clashes_keeps_unscheduled_proposals(problem):
+    genome = np.full(len(problem.proposals), UNSCHEDULED, dtype=np.int64)
+    genome[:4] = [0, 600, 50_000, 50_000 + int(problem.durations[2]) - 1]
+    timetable = Timetable(problem=problem, genome=genome)
+    timetable.remove_clashes()
+    assert np.flatnonzero(~timetable.retained).tolist() == [1, 3]
+    assert len(timetable.schedules) == len(problem.proposals) - 2
+
+def test_max_duration_schedules_at_least_as_much(problem):
+    rng = np.random.default_rng(0)
+    genome = rng.integers(0, 3 * 86_400, len(problem.proposals))
+    first, fullest = Timetable(problem=problem, genome=genome), Timetable(problem=problem, genome=genome)
+    first.remove_clashes()
+    fullest.remove_clashes(ClashPolicy.MAX_DURATION)
+    assert problem.durations[fullest.retained].sum() >= problem.durations[first.retained].sum()
@@ -1,6 +1,7 @@
 import pytest
+import numpy as np
 from datetime import date, time, datetime, timezone, timedelta
-from ga.utils import lst_to_utc, get_sunrise_sunset
+from ga.utils import lst_to_utc, get_sunrise_sunset, julian_date, gmst_at_0h_utc, date_range_array, julian_date_array, gmst_at_0h_utc_array, lst_to_utc_array, get_sunrise_sunset_array
 
 SARAO_CPT_LAT: float = -33.94470
 SARAO_CPT_LON: float = 18.47810
@@ -183,4 +184,36 @@ def test_get_sunrise_sunset_does_not_match_wrong_values(test_date: date, wrong_e
     print(f"Calculated Sunset: {sunset} | Wrong Expected Sunset: {wrong_expected_sunset} | Δ = {sunset_delta:.2f} seconds")
 
     assert sunrise_delta > 60, f"Sunrise calculation too close to wrong value ({sunrise_delta:.2f} seconds)"
-    assert sunset_delta > 60, f"Sunset calculation too close to wrong value ({sunset_delta:.2f} seconds)"
\ No newline at end of file
+    assert sunset_delta > 60, f"Sunset calculation too close to wrong value ({sunset_delta:.2f} seconds)"
+
+def test_array_kernels_match_scalar_functions():
+    """
+    The array kernels agree exactly with the scalar functions over a whole date range.
+    """
+    start_date: date = date(2023, 12, 25)
+    dates = date_range_array(start_date, date(2025, 1, 10))
+    days: list[date] = [start_date + timedelta(days=day) for day in range(len(dates))]
+    midnights: list[datetime] = [datetime.combine(day, time(0, 0, 0)) for day in days]
+
+    julian_dates = julian_date_array(dates)
+    assert julian_dates.tolist() == [julian_date(midnight) for midnight in midnights]
+    assert gmst_at_0h_utc_array(julian_dates).tolist() == [gmst_at_0h_utc(julian_date(midnight)) for midnight in midnights]
+
+    lst_times: list[time] = [time(0, 0, 0), time(9, 25, 7), time(11, 11, 43), time(12, 38, 55), time(23, 59, 59)]
+    utc_seconds = lst_to_utc_array(dates, np.array([lst.hour + lst.minute / 60 + lst.second / 3600 for lst in lst_times]))
+    for row, lst in enumerate(lst_times):
+        assert utc_seconds[row].tolist() == [(lst_to_utc(day, lst) - midnight).total_seconds() for day, midnight in zip(days, midnights)]
+
+    sunrises, sunsets = get_sunrise_sunset_array(dates)
+    for day, midnight, sunrise, sunset in zip(days, midnights, sunrises, sunsets):
+        expected_sunrise, expected_sunset = get_sunrise_sunset(day)
+        assert (sunrise, sunset) == ((expected_sunrise - midnight).total_seconds(), (expected_sunset - midnight).total_seconds())
+
+def test_sunrise_sunset_array_marks_polar_days():
+    """
+    Dates on which the sun never rises or never sets are NaN, as the scalar function returns None for them.
+    """
+    dates = date_range_array(date(2025, 6, 20), date(2025, 6, 22))
+    sunrises, sunsets = get_sunrise_sunset_array(dates, latitude=78.22, longitude=15.65)
+    assert np.isnan(sunrises).all() and np.isnan(sunsets).all()
+    assert get_sunrise_sunset(date(2025, 6, 21), latitude=78.22, longitude=15.65) == (None, None)
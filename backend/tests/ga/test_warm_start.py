@@ -0,0 +1,109 @@
+import copy
+import threading
+import numpy as np
+from collections import OrderedDict
+from datetime import date, time
+from ga import SchedulingProblem, Individual
+from ga.problem import UNSCHEDULED
+from ga.warm_start import PopulationSnapshot, WarmStartStore, perturb, remap_genomes, take_snapshot
+from conftest import make_proposals
+
+def test_contains_many_matches_contains(problem: SchedulingProblem):
+    rng = np.random.default_rng(0)
+    for feasible_starts in problem.feasible_starts:
+        offsets = rng.integers(0, problem.num_of_days * 86400, size=200)
+        assert feasible_starts.contains_many(offsets).tolist() == [feasible_starts.contains(int(offset)) for offset in offsets]
+
+def test_remap_matches_proposals_by_id(problem: SchedulingProblem):
+    snapshot = take_snapshot(problem, [Individual(problem, rng=np.random.default_rng(seed)) for seed in range(3)])
+    # The edited timetable drops the first proposal and lists the others in reverse
+    edited = SchedulingProblem(start_date=problem.start_date, end_date=problem.end_date, proposals=problem.proposals[1:][::-1])
+    genomes = remap_genomes(snapshot, edited)
+    assert np.array_equal(genomes, snapshot.genomes[:, 1:][:, ::-1])
+
+def test_remap_shifts_starts_and_drops_infeasible_ones(problem: SchedulingProblem):
+    genome = Individual(problem, rng=np.random.default_rng(0)).genome
+    snapshot = PopulationSnapshot(problem.start_date, problem.ids.copy(), genome[None, :])
+    # One day later, every start keeps its datetime, but those of the first day fall outside the new timetable
+    shifted = SchedulingProblem(start_date=date(2024, 1, 2), end_date=problem.end_date, proposals=problem.proposals)
+    remapped = remap_genomes(snapshot, shifted)[0]
+    for position, offset in enumerate(genome.tolist()):
+        if offset != UNSCHEDULED and offset >= 86400 and shifted.feasible_starts[position].contains(offset - 86400):
+            assert remapped[position] == offset - 86400
+        else:
+            assert remapped[position] == UNSCHEDULED
+
+def test_seed_holds_edit_previous_population_and_perturbations(problem: SchedulingProblem):
+    store = WarmStartStore()
+    previous = [Individual(problem, rng=np.random.default_rng(seed)) for seed in range(6)]
+    store.store(1, take_snapshot(problem, previous))
+    edited_individual = Individual(problem, previous[0].genome)
+    edited_individual.set_gene(0, UNSCHEDULED)
+
+    individuals = store.seed(1, edited_individual, 10, np.random.default_rng(0))
+    assert len(individuals) == 10
+    assert individuals[0] is edited_individual
+    # Half of the population comes from the previous run, skipping genomes equal to the edit
+    expected = [individual.genome for individual in previous if not np.array_equal(individual.genome, edited_individual.genome)][:4]
+    assert all(np.array_equal(individual.genome, genome) for individual, genome in zip(individuals[1:5], expected))
+    # Perturbations move a few scheduled proposals of the edit and never unschedule any
+    scheduled = edited_individual.genome != UNSCHEDULED
+    for individual in individuals[5:]:
+        assert np.array_equal(individual.genome == UNSCHEDULED, ~scheduled)
+        assert np.count_nonzero(individual.genome != edited_individual.genome) <= 1
+
+def test_store_forgets_least_recently_used_timetables(problem: SchedulingProblem):
+    store = WarmStartStore(max_size=2)
+    snapshot = take_snapshot(problem, [Individual(problem, rng=np.random.default_rng(0))])
+    for timetable_id in (1, 2, 3):
+        store.store(timetable_id, snapshot)
+    assert list(store.snapshots) == [2, 3]
+    store.discard(2)
+    # Without a previous population, the seed is the edit and its perturbations
+    individuals = store.seed(2, Individual(problem, snapshot.genomes[0]), 3, np.random.default_rng(0))
+    assert len(individuals) == 3 and list(store.snapshots) == [3]
+
+class DiscardingSnapshots(OrderedDict):
+    """
+    Snapshots that let another thread delete the timetable right after it is looked up, waiting briefly for the delete.
+    """
+    def __init__(self, store: WarmStartStore) -> None:
+        super().__init__()
+        self.store = store
+
+    def get(self, timetable_id, default=None):
+        snapshot = super().get(timetable_id, default)
+        thread = threading.Thread(target=self.store.discard, args=(timetable_id,))
+        thread.start()
+        thread.join(timeout=0.2)
+        return snapshot
+
+def test_seeding_is_not_broken_by_a_concurrent_discard(problem: SchedulingProblem):
+    store = WarmStartStore()
+    snapshot = take_snapshot(problem, [Individual(problem, rng=np.random.default_rng(0))])
+    store.snapshots = DiscardingSnapshots(store)
+    store.store(1, snapshot)
+    # The discard waits for the seed to finish with the snapshot, then forgets it
+    assert len(store.seed(1, Individual(problem, snapshot.genomes[0]), 2, np.random.default_rng(0))) == 2
+    store.discard(1)
+    assert list(store.snapshots) == []
+
+def test_remap_ignores_new_proposals():
+    problem = SchedulingProblem(start_date=date(2024, 1, 1), end_date=date(2024, 1, 7), proposals=tuple(make_proposals(5)))
+    snapshot = take_snapshot(problem, [Individual(problem, rng=np.random.default_rng(0))])
+    added = SchedulingProblem(start_date=problem.start_date, end_date=problem.end_date, proposals=tuple(make_proposals(7)))
+    genomes = remap_genomes(snapshot, added)
+    assert np.array_equal(genomes[0, :5], snapshot.genomes[0]) and (genomes[0, 5:] == UNSCHEDULED).all()
+
+def test_perturbations_never_unschedule_proposals():
+    proposals = make_proposals(2)
+    proposals[1] = copy.copy(proposals[1])
+    proposals[1].lst_start_time, proposals[1].lst_start_end_time = time(10, 0), time(9, 0)  # A window with no feasible start
+    problem = SchedulingProblem(start_date=date(2024, 1, 1), end_date=date(2024, 1, 7), proposals=tuple(proposals))
+    assert problem.feasible_starts[1].total == 0
+    # A user may still schedule it, and perturbations leave it there
+    edited = Individual(problem, np.array([problem.feasible_starts[0].lowers[0], 3600], dtype=np.int64))
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        genome = perturb(edited, 2, rng).genome
+        assert problem.feasible_starts[0].contains(int(genome[0])) and genome[1] == 3600
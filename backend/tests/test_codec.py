@@ -0,0 +1,46 @@
+import pytest
+from datetime import datetime, time
+from pydantic import ValidationError
+from codec import ProposalModel, from_proposals, parse_proposals, to_proposals
+
+def make_fields(index: int) -> dict:
+    """
+    Builds the fields of a proposal as the API sends them.
+    """
+    return {
+        "id": str(index + 1),
+        "description": f"Proposal {index + 1}",
+        "proposal_id": f"SCI-{index + 1:04d}",
+        "owner_email": "jane.doe@sarao.ac.za",
+        "instrument_product": "c856M4k",
+        "instrument_integration_time": "8.0",
+        "instrument_band": "L",
+        "instrument_pool_resources": "cbf",
+        "lst_start": f"{index % 20:02d}:00",
+        "lst_start_end": f"{index % 20 + 3:02d}:30",
+        "simulated_duration": str(3600 + index * 60),
+        "night_obs": "Yes" if index % 3 == 0 else "no",
+        "avoid_sunrise_sunset": "no",
+        "minimum_antennas": "40",
+        "general_comments": "",
+        "scheduled_start_datetime": "2024-09-21 08:00:00" if index % 2 else "",
+    }
+
+def test_string_fields_are_parsed_into_proposals():
+    proposal = ProposalModel.model_validate(make_fields(3)).to_proposal()
+    assert (proposal.id, proposal.instrument_integration_time, proposal.simulated_duration, proposal.minimum_antennas) == (4, 8.0, 3780, 40)
+    assert (proposal.lst_start_time, proposal.lst_start_end_time) == (time(3, 0), time(6, 30))
+    assert (proposal.night_obs, proposal.avoid_sunrise_sunset) == (True, False)
+    assert proposal.scheduled_start_datetime == datetime(2024, 9, 21, 8, 0, 0)
+
+def test_models_serialize_back_to_the_api_strings():
+    fields = [make_fields(index) for index in range(6)]
+    proposals = parse_proposals(fields)
+    assert [model.model_dump() for model in from_proposals(proposals)] == [field | {"night_obs": field["night_obs"].lower()} for field in fields]
+    assert to_proposals(from_proposals(proposals))[1].scheduled_start_datetime == proposals[1].scheduled_start_datetime
+
+def test_invalid_fields_are_rejected():
+    with pytest.raises(ValidationError):
+        ProposalModel.model_validate(make_fields(0) | {"simulated_duration": "an hour"})
+    with pytest.raises(ValidationError):
+        ProposalModel.model_validate(make_fields(0) | {"lst_start": "25:00"})
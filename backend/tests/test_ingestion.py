@@ -0,0 +1,85 @@
+import json
+import asyncio
+import hashlib
+import httpx
+import pytest
+from ingestion import ProposalIngestor
+
+def make_record(index: int) -> dict:
+    """
+    Builds a proposal record as the obs-data service serves it.
+    """
+    return {
+        "id": str(index + 1),
+        "description": f"Proposal {index + 1}",
+        "proposal_id": f"SCI-{index + 1:04d}",
+        "owner_email": "jane.doe@sarao.ac.za",
+        "instrument_product": "c856M4k",
+        "instrument_integration_time": "8",
+        "instrument_band": "L",
+        "instrument_pool_resources": "cbf",
+        "lst_start": f"{index % 20:02d}:00",
+        "lst_start_end": f"{index % 20 + 3:02d}:30",
+        "simulated_duration": str(3600 + index * 60),
+        "night_obs": "Yes" if index % 3 == 0 else "No",
+        "avoid_sunrise_sunset": "no",
+        "minimum_antennas": "40",
+        "general_comments": "",
+        "scheduled_start_datetime": "",
+    }
+
+class FakeObsData:
+    """
+    Serves proposals in pages like json-server, with an ETag per page, and counts the pages it transfers.
+    """
+    def __init__(self, records: list[dict], paginated_object: bool = False) -> None:
+        self.records = records
+        self.paginated_object = paginated_object  # json-server 1.x answers an object, 0.x a list with X-Total-Count
+        self.num_of_transfers = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        page, limit = int(request.url.params["_page"]), int(request.url.params["_limit"])
+        records = self.records[(page - 1) * limit:page * limit]
+        headers = dict()
+        if self.paginated_object:
+            body = json.dumps({"data": records, "pages": max(1, -(-len(self.records) // limit))})
+        else:
+            body = json.dumps(records)
+            headers["X-Total-Count"] = str(len(self.records))
+        etag = f'W/"{hashlib.sha1(body.encode()).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=headers | {"ETag": etag})
+        self.num_of_transfers += 1
+        return httpx.Response(200, content=body, headers=headers | {"ETag": etag, "Content-Type": "application/json"})
+
+@pytest.mark.parametrize("paginated_object", [False, True])
+def test_sync_only_transfers_changed_pages(paginated_object: bool):
+    obs_data = FakeObsData([make_record(index) for index in range(25)], paginated_object)
+    ingestor = ProposalIngestor(url="http://obs-data/proposals", page_size=10, transport=httpx.MockTransport(obs_data))
+
+    async def run():
+        first = await ingestor.sync()
+        obs_data.records[12] = make_record(12) | {"description": "Edited"}
+        second = await ingestor.sync()
+        await ingestor.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert (first.num_of_proposals, first.num_of_pages, first.num_of_pages_transferred) == (25, 3, 3)
+    assert (second.num_of_pages, second.num_of_pages_transferred) == (3, 1)
+    assert obs_data.num_of_transfers == 4
+    assert [proposal.proposal_id for proposal in ingestor.get([])] == [f"SCI-{index + 1:04d}" for index in range(25)]
+    assert ingestor.get(["SCI-0013"])[0].description == "Edited"
+
+def test_sync_drops_removed_proposals():
+    obs_data = FakeObsData([make_record(index) for index in range(10)])
+    ingestor = ProposalIngestor(url="http://obs-data/proposals", page_size=4, transport=httpx.MockTransport(obs_data))
+
+    async def run():
+        await ingestor.sync()
+        del obs_data.records[8:]
+        return await ingestor.sync()
+
+    assert asyncio.run(run()).num_of_proposals == 8
+    with pytest.raises(KeyError):
+        ingestor.get(["SCI-0009"])
@@ -0,0 +1,105 @@
+import time
+from datetime import date
+from ga import Proposal, StopReason
+from ga.utils import parse_time
+from jobs import JobManager, JobResult, JobStatus
+
+def make_proposals(num_of_proposals: int) -> list[Proposal]:
+    """
+    Builds a list of proposals that can be scheduled in September and October.
+    """
+    return [Proposal(
+        id=index + 1,
+        description=f"Proposal {index + 1}",
+        proposal_id=f"SCI-{index + 1:04d}",
+        owner_email="jane.doe@sarao.ac.za",
+        instrument_product="c856M4k",
+        instrument_integration_time=8.0,
+        instrument_band="L",
+        instrument_pool_resources="cbf",
+        lst_start_time=parse_time(f"{index % 20:02d}:00"),
+        lst_start_end_time=parse_time(f"{index % 20 + 3:02d}:30"),
+        simulated_duration=3600 + index * 60,
+        night_obs=False,
+        avoid_sunrise_sunset=False,
+        minimum_antennas=40,
+        general_comments="",
+    ) for index in range(num_of_proposals)]
+
+def count_schedules(result: JobResult) -> int:
+    return len(result.schedules)
+
+def wait_for(job_manager: JobManager, job_id: str, timeout: float = 120.0) -> JobStatus:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = job_manager.get(job_id)
+        if job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+            return job.status
+        time.sleep(0.05)
+    raise TimeoutError(job_id)
+
+def test_concurrent_jobs_run_in_workers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    job_manager = JobManager(max_workers=2)
+    try:
+        jobs = [
+            job_manager.submit(date(2024, 9, 20), date(2024, 9, 30), make_proposals(num_of_proposals), on_complete=count_schedules, num_of_individuals=4, num_of_generations=5)
+            for num_of_proposals in (6, 9)
+        ]
+        assert {job.status for job in jobs} <= {JobStatus.QUEUED, JobStatus.RUNNING}
+        for job in jobs:
+            assert wait_for(job_manager, job.id) == JobStatus.COMPLETED, job.error
+            progress = job_manager.get_progress(job.id)
+            assert progress["generation"] == progress["num_of_generations"] == 5
+            assert progress["worst_fitness"] <= progress["median_fitness"] <= progress["best_fitness"]
+        # The completion callback sees the clash-free schedules of each job
+        assert jobs[0].result <= 6 and jobs[1].result <= 9
+        # Plots are left to the API, so jobs write no files
+        assert list(tmp_path.iterdir()) == []
+    finally:
+        job_manager.shutdown()
+
+def test_time_budget_ends_job():
+    job_manager = JobManager(max_workers=1)
+    try:
+        job = job_manager.submit(date(2024, 9, 20), date(2024, 9, 22), make_proposals(4), on_complete=count_schedules, num_of_individuals=4, num_of_generations=10 ** 6, time_budget=0.5)
+        assert wait_for(job_manager, job.id) == JobStatus.COMPLETED, job.error
+        assert job.stop_reason == StopReason.TIME_BUDGET
+        assert job_manager.get_progress(job.id)["stop_reason"] == StopReason.TIME_BUDGET
+    finally:
+        job_manager.shutdown()
+
+def test_failed_job_records_error():
+    job_manager = JobManager(max_workers=1)
+    try:
+        # A proposal id that is not a number fails the worker
+        proposals = make_proposals(3)
+        proposals[0].id = "SCI-0001"
+        job = job_manager.submit(date(2024, 9, 20), date(2024, 9, 22), proposals, on_complete=count_schedules, num_of_individuals=2, num_of_generations=1)
+        assert wait_for(job_manager, job.id) == JobStatus.FAILED
+        assert "ValueError" in job.error
+        assert job_manager.get("unknown") is None
+    finally:
+        job_manager.shutdown()
+
+def test_finished_jobs_are_evicted():
+    job_manager = JobManager(max_workers=1, max_finished_jobs=1)
+    try:
+        first, second = [
+            job_manager.submit(date(2024, 9, 20), date(2024, 9, 22), make_proposals(4), on_complete=count_schedules, num_of_individuals=2, num_of_generations=3)
+            for _ in range(2)
+        ]
+        assert wait_for(job_manager, second.id) == JobStatus.COMPLETED, second.error
+        assert first.status == JobStatus.COMPLETED and job_manager.get(first.id) is None
+        # The last progress of a finished job moves out of the shared progress table
+        assert len(job_manager.progress) == 0 and job_manager.get_progress(second.id)["generation"] == 3
+    finally:
+        job_manager.shutdown()
+    expiring = JobManager(max_workers=1, job_ttl=0.0)
+    try:
+        job = expiring.submit(date(2024, 9, 20), date(2024, 9, 22), make_proposals(4), on_complete=count_schedules, num_of_individuals=2, num_of_generations=1)
+        job.future.result()
+        time.sleep(0.1)
+        assert expiring.get(job.id) is None
+    finally:
+        expiring.shutdown()
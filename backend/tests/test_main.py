@@ -0,0 +1,50 @@
+import pytest
+from fastapi.testclient import TestClient
+import main
+from jobs import JobManager
+from rendering import RenderManager
+from storage import TimetableStore
+from test_codec import make_fields
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(main, "timetable_store", TimetableStore())
+    monkeypatch.setattr(main, "render_manager", RenderManager(max_workers=1, directory=str(tmp_path)))
+    with TestClient(main.app) as client:
+        yield client
+
+def make_timetable(clash_policy: str) -> dict:
+    """
+    Builds a one-day timetable of two proposals scheduled at their only feasible starts, where they overlap by about a
+    minute: a short one listed first and a long one. Updates are seeded with this schedule, which no run improves on.
+    """
+    proposals = [
+        make_fields(index) | {"lst_start": lst_start, "lst_start_end": lst_start, "simulated_duration": duration, "night_obs": "no", "scheduled_start_datetime": scheduled_start_datetime}
+        for index, (lst_start, duration, scheduled_start_datetime) in enumerate([("10:00", "3600", "2024-09-20 08:35:18"), ("10:59", "10800", "2024-09-20 09:34:08")])
+    ]
+    return {"name": "Alpha", "start_date": "2024-09-20", "end_date": "2024-09-20", "proposals": proposals, "clash_policy": clash_policy}
+
+def kept_proposal_ids(client: TestClient, clash_policy: str) -> list[int]:
+    timetable_id = main.timetable_store.add(make_timetable(clash_policy))["id"]
+    updated = client.put(f"{main.router_url_prefix}{timetable_id}", json=make_timetable(clash_policy) | {"id": timetable_id}).json()
+    assert all(proposal["scheduled_start_datetime"] for proposal in updated["proposals"])
+    render = main.render_manager.get(timetable_id)
+    clash_free = render.week_plots[render.names.index("week_2024-09-20_2024-09-26_clash_free.png")]
+    return [proposal.id for _, proposal in clash_free.entries]
+
+def test_clash_policy_chooses_the_kept_proposals(client):
+    assert kept_proposal_ids(client, "first_wins") == [1]
+    assert kept_proposal_ids(client, "max_duration") == [2]
+    # Proposals have no priority of their own, so the highest_score policy is not offered
+    request = make_timetable("highest_score")
+    assert client.post(main.router_url_prefix, json=request).status_code == 422
+    assert client.put(f"{main.router_url_prefix}1", json=request | {"id": 1}).status_code == 422
+
+def test_progress_stream_ends_when_its_job_is_forgotten(client, monkeypatch):
+    # A manager keeping no finished jobs forgets the job as soon as it completes
+    monkeypatch.setattr(main, "job_manager", JobManager(max_workers=1, max_finished_jobs=0))
+    request = make_timetable("first_wins") | {"time_budget": 1.0, "render": False}
+    job_id = client.post(main.router_url_prefix, json=request).json()["id"]
+    response = client.get(f"{main.jobs_url_prefix}{job_id}/events", params={"interval": 0.1})
+    assert response.status_code == 200 and "event: completed" not in response.text
+    assert client.get(f"{main.jobs_url_prefix}{job_id}").status_code == 404
@@ -0,0 +1,133 @@
+import os
+import time
+from datetime import date, datetime, timedelta
+import csv
+from ga.plotting import plan_week_plots, plot_blocks, render_model, render_model_csv, render_weeks
+from rendering import RenderManager, RenderStatus
+from test_jobs import make_proposals
+
+def make_schedules(num_of_proposals: int) -> list:
+    """
+    Builds proposals scheduled one per day from 2024-09-20, the last one left unscheduled.
+    """
+    schedules = make_proposals(num_of_proposals)
+    for index, proposal in enumerate(schedules[:-1]):
+        proposal.scheduled_start_datetime = datetime(2024, 9, 20, 10) + timedelta(days=index)
+    return schedules
+
+def test_weeks_hold_the_proposals_scheduled_in_them():
+    week_plots = plan_week_plots(date(2024, 9, 20), date(2024, 10, 3), make_schedules(12), "_test", "plots")
+    assert [week_plot.path for week_plot in week_plots] == ["plots/week_2024-09-20_2024-09-26_test.png", "plots/week_2024-09-27_2024-10-03_test.png"]
+    assert [[idx for idx, _ in week_plot.entries] for week_plot in week_plots] == [list(range(7)), list(range(7, 11))]
+    assert all((week_plot.total_proposals, week_plot.total_scheduled_proposals) == (12, 11) for week_plot in week_plots)
+
+def wait_for(render, timeout: float = 120.0) -> RenderStatus:
+    deadline = time.monotonic() + timeout
+    while render.status == RenderStatus.PENDING and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return render.status
+
+def test_content_key_follows_what_the_plot_shows():
+    schedules = make_schedules(10)
+    content_key = plan_week_plots(date(2024, 9, 20), date(2024, 9, 26), schedules)[0].content_key()
+    # The file name plays no part, while any scheduled interval does
+    assert plan_week_plots(date(2024, 9, 20), date(2024, 9, 26), schedules, "_other", "elsewhere")[0].content_key() == content_key
+    schedules[2].scheduled_start_datetime += timedelta(hours=1)
+    assert plan_week_plots(date(2024, 9, 20), date(2024, 9, 26), schedules)[0].content_key() != content_key
+
+def test_plots_are_drawn_in_workers_and_cached(tmp_path):
+    render_manager = RenderManager(max_workers=2, directory=str(tmp_path))
+    try:
+        schedules = make_schedules(10)
+        render = render_manager.submit(1, date(2024, 9, 20), date(2024, 10, 3), {"": schedules, "_clash_free": schedules[:5]})
+        assert wait_for(render) == RenderStatus.READY, render.error
+        assert render.names == [
+            "week_2024-09-20_2024-09-26.png", "week_2024-09-27_2024-10-03.png",
+            "week_2024-09-20_2024-09-26_clash_free.png", "week_2024-09-27_2024-10-03_clash_free.png",
+        ]
+        assert sorted(path.name for path in tmp_path.iterdir()) == sorted(f"{week_plot.content_key()}.png" for week_plot in render.week_plots)
+        assert all(path.read_bytes().startswith(b"\x89PNG") for path in tmp_path.iterdir())
+
+        # Another timetable with an edit in its second week only draws that week again
+        schedules[8].scheduled_start_datetime += timedelta(hours=2)
+        edited = render_manager.submit(2, date(2024, 9, 20), date(2024, 10, 3), {"": schedules, "_clash_free": schedules[:5]})
+        assert [future.done() for future in edited.futures] == [True, False, True, True]
+        assert wait_for(edited) == RenderStatus.READY, edited.error
+        assert render_manager.cache.hits == 3 and len(list(tmp_path.iterdir())) == 5
+
+        render_manager.discard(1)
+        assert render_manager.get(1) is None and render_manager.get(2) is edited
+    finally:
+        render_manager.shutdown()
+
+def test_other_weeks_stay_cached_when_the_totals_change(tmp_path):
+    render_manager = RenderManager(max_workers=1, directory=str(tmp_path))
+    try:
+        schedules = make_schedules(10)
+        render = render_manager.submit(1, date(2024, 9, 20), date(2024, 10, 10), {"": schedules})
+        assert wait_for(render) == RenderStatus.READY, render.error
+
+        # Unscheduling a proposal in the second week changes the timetable-wide counts, but not the other weeks
+        schedules[8].scheduled_start_datetime = None
+        edited = render_manager.submit(1, date(2024, 9, 20), date(2024, 10, 10), {"": schedules})
+        assert (edited.week_plots[0].total_scheduled_proposals, render.week_plots[0].total_scheduled_proposals) == (8, 9)
+        assert [future.done() for future in edited.futures] == [True, False, True]
+        assert wait_for(edited) == RenderStatus.READY, edited.error
+        assert render_manager.cache.hits == 2 and render_manager.cache.misses == 4
+    finally:
+        render_manager.shutdown()
+
+def test_cache_directory_does_not_follow_the_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    render_manager = RenderManager()
+    assert render_manager.directory == os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "outputs", "plots")
+
+def test_least_recently_used_plots_are_evicted(tmp_path):
+    render_manager = RenderManager(max_workers=1, directory=str(tmp_path), max_entries=2)
+    try:
+        schedules = make_schedules(10)
+        render = render_manager.submit(1, date(2024, 9, 20), date(2024, 10, 17), {"": schedules})
+        assert wait_for(render) == RenderStatus.READY, render.error
+        assert len(list(tmp_path.iterdir())) == 2
+        # An evicted plot is drawn again when it is asked for
+        assert not render_manager.redraw(render, 0).done()
+        assert wait_for(render) == RenderStatus.READY and (tmp_path / f"{render.week_plots[0].content_key()}.png").exists()
+    finally:
+        render_manager.shutdown()
+
+def test_overnight_blocks_are_split_at_midnight():
+    schedules = make_proposals(3)
+    schedules[0].scheduled_start_datetime = datetime(2024, 9, 23, 23, 30)  # A Monday, into Tuesday
+    schedules[1].scheduled_start_datetime = datetime(2024, 9, 29, 23, 30)  # A Sunday, past the end of the week grid
+    schedules[2].scheduled_start_datetime = datetime(2024, 9, 24, 10)
+    week_plot = plan_week_plots(date(2024, 9, 20), date(2024, 9, 26), schedules)[0]
+    assert [(block.index, block.day_index, block.start_time, block.end_time) for block in plot_blocks(week_plot)] == [
+        (0, 0, 23.5, 24), (0, 1, 0, 0.5), (2, 1, 10.0, 11.0 + 2 / 60),
+    ]
+
+    model = render_model(plan_week_plots(date(2024, 9, 20), date(2024, 10, 3), schedules))
+    assert [len(week["blocks"]) for week in model["weeks"]] == [3, 1]
+    assert model["weeks"][1]["blocks"][0] == {"index": 1, "day_index": 6, "start_time": 23.5, "end_time": 24, "color": "yellow", "label": "1 jane 01:00:00 04:30:00 False False"}
+    rows = list(csv.DictReader(render_model_csv(plan_week_plots(date(2024, 9, 20), date(2024, 10, 3), schedules)).splitlines()))
+    assert [(row["week_num"], row["index"], row["day_index"]) for row in rows] == [("0", "0", "0"), ("0", "0", "1"), ("0", "2", "1"), ("1", "1", "6")]
+
+def test_weeks_are_drawn_into_one_figure_quickly(tmp_path):
+    schedules = make_proposals(200)
+    for index, proposal in enumerate(schedules):
+        proposal.scheduled_start_datetime = datetime(2024, 9, 20, index * 7 % 24) + timedelta(hours=20 * index)
+    week_plots = plan_week_plots(date(2024, 9, 20), date(2024, 9, 20) + timedelta(weeks=26, days=-1), schedules)
+    render_weeks(week_plots, str(tmp_path / "warm_up.png"))
+    started = time.perf_counter()
+    path = render_weeks(week_plots, str(tmp_path / "overview.png"))
+    assert time.perf_counter() - started < 1.0
+    assert open(path, "rb").read().startswith(b"\x89PNG")
+
+def test_overview_is_cached(tmp_path):
+    render_manager = RenderManager(max_workers=1, directory=str(tmp_path))
+    try:
+        schedules = make_schedules(10)
+        path = render_manager.overview(date(2024, 9, 20), date(2024, 10, 3), schedules)
+        assert render_manager.overview(date(2024, 9, 20), date(2024, 10, 3), schedules) == path
+        assert render_manager.cache.hits == 1 and len(list(tmp_path.iterdir())) == 1
+    finally:
+        render_manager.shutdown()
@@ -0,0 +1,80 @@
+from storage import TimetableStore
+
+def make_timetable(name: str, num_of_proposals: int) -> dict:
+    """
+    Builds the fields of a timetable, as the API stores them.
+    """
+    return {
+        "name": name,
+        "start_date": "2024-09-20",
+        "end_date": "2024-09-30",
+        "stagnation_window": None,
+        "target_fitness": 0.9,
+        "time_budget": None,
+        "proposals": [{
+            "id": str(index + 1),
+            "description": f"Proposal {index + 1}",
+            "proposal_id": f"SCI-{index + 1:04d}",
+            "owner_email": "jane.doe@sarao.ac.za",
+            "instrument_product": "c856M4k",
+            "instrument_integration_time": "8.0",
+            "instrument_band": "L",
+            "instrument_pool_resources": "cbf",
+            "lst_start": "10:00",
+            "lst_start_end": "12:30",
+            "simulated_duration": "3600",
+            "night_obs": "no",
+            "avoid_sunrise_sunset": "yes",
+            "minimum_antennas": "40",
+            "general_comments": "",
+            "scheduled_start_datetime": f"2024-09-2{index} 08:00:00" if index % 2 == 0 else "",
+        } for index in range(num_of_proposals)],
+    }
+
+def test_timetables_round_trip_in_order():
+    store = TimetableStore()
+    store.open()
+    stored = store.add(make_timetable("Alpha", 4))
+    assert stored["id"] == 1
+    assert store.get(1) == stored
+    assert store.get(2) is None
+
+def test_ids_are_not_reused_after_a_delete():
+    store = TimetableStore()
+    store.open()
+    for name in ("Alpha", "Bravo"):
+        store.add(make_timetable(name, 2))
+    assert store.delete(2)["name"] == "Bravo"
+    assert store.delete(2) is None
+    assert store.add(make_timetable("Charlie", 2))["id"] == 3
+    assert store.count() == 2
+
+def test_pages_are_ordered_by_id():
+    store = TimetableStore()
+    store.open()
+    for index in range(5):
+        store.add(make_timetable(f"Timetable {index}", index))
+    page = store.page(offset=1, limit=3)
+    assert [timetable["id"] for timetable in page] == [2, 3, 4]
+    assert [len(timetable["proposals"]) for timetable in page] == [1, 2, 3]
+    assert store.page(offset=5) == []
+
+def test_replace_rewrites_proposals():
+    store = TimetableStore()
+    store.open()
+    store.add(make_timetable("Alpha", 4))
+    assert store.replace(1, make_timetable("Bravo", 2) | {"id": 7})["id"] == 1
+    assert store.get(1) == make_timetable("Bravo", 2) | {"id": 1}
+    assert store.replace(2, make_timetable("Bravo", 2)) is None
+
+def test_timetables_persist_across_connections(tmp_path):
+    path = str(tmp_path / "data" / "timetables.db")
+    store = TimetableStore(path)
+    store.open()
+    store.add(make_timetable("Alpha", 3))
+    store.delete(store.add(make_timetable("Bravo", 3))["id"])
+    store.close()
+    reopened = TimetableStore(path)
+    reopened.open()
+    assert [timetable["name"] for timetable in reopened.page()] == ["Alpha"]
+    assert reopened.add(make_timetable("Charlie", 1))["id"] == 3
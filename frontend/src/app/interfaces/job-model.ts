@@ -0,0 +1,22 @@
+export type StopReason = 'num_of_generations' | 'stagnation' | 'target_fitness' | 'time_budget';
+
+export interface JobModel {
+    id: string;
+    status: 'queued' | 'running' | 'completed' | 'failed';
+    timetable_id: number | null;
+    error: string | null;
+    stop_reason: StopReason | null;
+}
+
+export interface JobProgressModel {
+    id: string;
+    status: 'queued' | 'running' | 'completed' | 'failed';
+    generation: number;
+    num_of_generations: number;
+    best_fitness: number;
+    median_fitness: number;
+    worst_fitness: number;
+    num_scored: number;
+    elapsed: number;
+    stop_reason: StopReason | null;
+}
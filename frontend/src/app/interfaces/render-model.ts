@@ -0,0 +1,23 @@
+export interface PlotBlockModel {
+    index: number;
+    day_index: number;
+    start_time: number;
+    end_time: number;
+    color: string;
+    label: string;
+}
+
+export interface WeekRenderModel {
+    week_num: number;
+    week_start_date: string;
+    week_end_date: string;
+    num_of_proposals: number;
+    total_scheduled_proposals: number;
+    total_proposals: number;
+    blocks: PlotBlockModel[];
+}
+
+export interface RenderModel {
+    days_of_week: string[];
+    weeks: WeekRenderModel[];
+}
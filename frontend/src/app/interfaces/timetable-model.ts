@@ -6,4 +6,8 @@ export interface TimetableModel {
     start_date: string;
     end_date: string;
     proposals: ProposalModel[];
+    stagnation_window?: number | null; // stop once the best fitness has not improved for this many generations
+    target_fitness?: number | null; // stop once the best fitness reaches this value
+    time_budget?: number | null; // stop once the run has taken this many seconds
+    clash_policy?: 'first_wins' | 'max_duration'; // which of two clashing proposals stays
 }
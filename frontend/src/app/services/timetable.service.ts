@@ -1,21 +1,61 @@
 import { HttpClient, HttpHeaders } from '@angular/common/http';
 import { Injectable } from '@angular/core';
-import { Observable } from 'rxjs';
+import { Observable, filter, switchMap, take, throwError, timer } from 'rxjs';
 import { environment } from '../../environments/environment';
 import { TimetableModel } from '../interfaces/timetable-model';
+import { JobModel, JobProgressModel } from '../interfaces/job-model';
+import { RenderModel } from '../interfaces/render-model';
 
 @Injectable({
   providedIn: 'root'
 })
 export class TimetableService {
   url: string = `http://${environment.host}:${environment.port}/api/v1/timetables/`;
+  jobsUrl: string = `http://${environment.host}:${environment.port}/api/v1/jobs/`;
+  jobPollingInterval: number = 1000; // milliseconds
   headers: HttpHeaders = new HttpHeaders({
       'Content-Type': 'application/json'
     });
   constructor(private httpClient: HttpClient) { }
 
   postTimetable(timetable: TimetableModel): Observable<TimetableModel> {
-    return this.httpClient.post<TimetableModel>(this.url, timetable, { headers: this.headers });
+    // The timetable is generated by a background job, which is polled until it finishes
+    return this.postTimetableJob(timetable).pipe(
+      switchMap((job: JobModel) => timer(0, this.jobPollingInterval).pipe(
+        switchMap(() => this.getJob(job.id)),
+        filter((polledJob: JobModel) => polledJob.status === 'completed' || polledJob.status === 'failed'),
+        take(1),
+      )),
+      switchMap((job: JobModel) => job.status === 'completed' ? this.getJobResult(job.id) : throwError(() => new Error(job.error ?? 'Timetable generation failed'))),
+    );
+  }
+
+  postTimetableJob(timetable: TimetableModel): Observable<JobModel> {
+    return this.httpClient.post<JobModel>(this.url, timetable, { headers: this.headers });
+  }
+
+  getJob(jobId: string): Observable<JobModel> {
+    return this.httpClient.get<JobModel>(`${this.jobsUrl}${jobId}`, { headers: this.headers });
+  }
+
+  getJobProgress(jobId: string): Observable<JobProgressModel> {
+    return this.httpClient.get<JobProgressModel>(`${this.jobsUrl}${jobId}/progress`, { headers: this.headers });
+  }
+
+  streamJobProgress(jobId: string): Observable<JobProgressModel> {
+    // Server-Sent Events of the job, completing when the job finishes
+    return new Observable<JobProgressModel>((subscriber) => {
+      const eventSource: EventSource = new EventSource(`${this.jobsUrl}${jobId}/events`);
+      eventSource.addEventListener('progress', (event: MessageEvent) => subscriber.next(JSON.parse(event.data)));
+      eventSource.addEventListener('completed', () => { eventSource.close(); subscriber.complete(); });
+      eventSource.addEventListener('failed', (event: MessageEvent) => { eventSource.close(); subscriber.error(new Error(JSON.parse(event.data).error)); });
+      eventSource.onerror = () => { eventSource.close(); subscriber.error(new Error('Lost the progress stream of the job')); };
+      return () => eventSource.close();
+    });
+  }
+
+  getJobResult(jobId: string): Observable<TimetableModel> {
+    return this.httpClient.get<TimetableModel>(`${this.jobsUrl}${jobId}/result`, { headers: this.headers });
   }
 
   getTimetable(timetableId: number): Observable<TimetableModel> {
@@ -26,6 +66,15 @@ export class TimetableService {
     return this.httpClient.get<TimetableModel[]>(this.url, { headers: this.headers });
   }
 
+  getTimetableBlocks(timetableId: number): Observable<RenderModel> {
+    // The blocks of each week, with overnight observations split at midnight, for drawing the timetable in the browser
+    return this.httpClient.get<RenderModel>(`${this.url}${timetableId}/blocks`, { headers: this.headers });
+  }
+
+  getTimetableOverviewUrl(timetableId: number): string {
+    return `${this.url}${timetableId}/overview`;
+  }
+
   updateTimetable(timetable: TimetableModel): Observable<TimetableModel> {
     return this.httpClient.put<TimetableModel>(`${this.url}${timetable.id}`, timetable, { headers: this.headers });
   }